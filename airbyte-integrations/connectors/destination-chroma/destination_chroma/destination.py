@@ -37,7 +37,7 @@ class DestinationChroma(Destination):
             if config.embedding.mode != "no_embedding"
             else NoEmbedder(config.embedding)
         )
-        self.indexer = ChromaIndexer(config.indexing)
+        self.indexer = ChromaIndexer(config.indexing, embeddings_from_records=config.embedding.mode == "from_field")
 
     def write(
         self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
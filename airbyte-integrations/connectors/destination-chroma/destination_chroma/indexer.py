@@ -2,25 +2,62 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import hashlib
 import json
 import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
 import chromadb
 from chromadb.config import Settings
 
-from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD, METADATA_STREAM_FIELD
+from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD, METADATA_STREAM_FIELD, Chunk
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
 from airbyte_cdk.destinations.vector_db_based.utils import create_stream_identifier, format_exception
-from airbyte_cdk.models import ConfiguredAirbyteCatalog
+from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from destination_chroma.config import ChromaIndexingConfigModel
 from destination_chroma.utils import is_valid_collection_name
 
 
+# Copy of CHUNK_ID_NAMESPACE of destination-qdrant, connectors don't share code
+CHUNK_ID_NAMESPACE = uuid.UUID("5f0c3d3a-3b8e-4b43-9a57-2f4c4b0f5e4d")
+
+
+def get_chunk_ids(document_chunks: List[Chunk], embeddings_from_records: bool = False) -> List[Tuple[Chunk, str]]:
+    """Copy of `get_chunk_ids` of destination-qdrant, keep them in sync."""
+    chunks_with_ids: List[Tuple[Chunk, str]] = []
+    record_chunks: Dict[str, List[Chunk]] = {}
+    records = {}
+    for chunk in document_chunks:
+        record_id = chunk.metadata.get(METADATA_RECORD_ID_FIELD)
+        if record_id is None:
+            chunks_with_ids.append((chunk, str(uuid.uuid4())))
+            continue
+        if records.get(record_id) is not chunk.record:
+            records[record_id] = chunk.record
+            record_chunks[record_id] = []
+        record_chunks[record_id].append(chunk)
+
+    for record_id, chunks in record_chunks.items():
+        for index, chunk in enumerate(chunks):
+            # the embedding stands for the text when the text is omitted, or when it isn't computed from the text
+            with_embedding = embeddings_from_records or chunk.page_content is None
+            content = json.dumps(
+                [chunk.page_content, chunk.metadata, chunk.embedding if with_embedding else None], sort_keys=True, default=str
+            )
+            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            chunks_with_ids.append((chunk, str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{record_id}:{index}:{content_hash}"))))
+    return chunks_with_ids
+
+
 class ChromaIndexer(Indexer):
-    def __init__(self, config: ChromaIndexingConfigModel):
+    def __init__(self, config: ChromaIndexingConfigModel, embeddings_from_records: bool = False):
         super().__init__(config)
         self.collection_name = config.collection_name
+        self.embeddings_from_records = embeddings_from_records
+        # ids of the records whose chunks are replaced by their chunks in the next `index` call of their stream
+        self._records_to_replace: Dict[Tuple[Optional[str], str], List[str]] = defaultdict(list)
 
     def check(self):
         collection_name_validation_error = is_valid_collection_name(self.collection_name)
@@ -47,22 +84,33 @@ class ChromaIndexer(Indexer):
             del client
 
     def delete(self, delete_ids, namespace, stream):
-        if len(delete_ids) > 0:
-            self._delete_by_filter(field_name=METADATA_RECORD_ID_FIELD, field_values=delete_ids)
+        # The chunks of the records are diffed against their new chunks in `index`, the unchanged ones are kept
+        self._records_to_replace[(namespace, stream)].extend(delete_ids)
 
     def index(self, document_chunks, namespace, stream):
+        record_ids = self._records_to_replace.pop((namespace, stream), [])
+        existing_ids = self._get_chunk_ids(record_ids) if record_ids else set()
+
         entities = []
-        for i in range(len(document_chunks)):
-            chunk = document_chunks[i]
+        chunk_ids = set()
+        for chunk, chunk_id in get_chunk_ids(document_chunks, self.embeddings_from_records):
+            chunk_ids.add(chunk_id)
+            if chunk_id in existing_ids:
+                continue
             entities.append(
                 {
-                    "id": str(uuid.uuid4()),
+                    "id": chunk_id,
                     "embedding": chunk.embedding,
                     "metadata": self._normalize(chunk.metadata),
                     "document": chunk.page_content if chunk.page_content is not None else "",
                 }
             )
-        self._write_data(entities)
+        if entities:
+            self._write_data(entities)
+
+        vanished_ids = existing_ids - chunk_ids
+        if vanished_ids:
+            self.client.get_collection(name=self.collection_name).delete(ids=sorted(vanished_ids))
 
     def pre_sync(self, catalog: ConfiguredAirbyteCatalog) -> None:
         self.client = self._get_client()
@@ -74,6 +122,13 @@ class ChromaIndexer(Indexer):
         if len(streams_to_overwrite):
             self._delete_by_filter(field_name=METADATA_STREAM_FIELD, field_values=streams_to_overwrite)
 
+    def post_sync(self) -> List[AirbyteMessage]:
+        for record_ids in self._records_to_replace.values():
+            if len(record_ids) > 0:
+                self._delete_by_filter(field_name=METADATA_RECORD_ID_FIELD, field_values=record_ids)
+        self._records_to_replace.clear()
+        return []
+
     def _get_client(self):
         auth_method = self.config.auth_method
         if auth_method.mode == "persistent_client":
@@ -104,6 +159,10 @@ class ChromaIndexer(Indexer):
         where_filter = {field_name: {"$in": field_values}}
         collection.delete(where=where_filter)
 
+    def _get_chunk_ids(self, record_ids: List[str]) -> Set[str]:
+        collection = self.client.get_collection(name=self.collection_name)
+        return set(collection.get(where={METADATA_RECORD_ID_FIELD: {"$in": sorted(set(record_ids))}}, include=[])["ids"])
+
     def _normalize(self, metadata: dict) -> dict:
         result = {}
         for key, value in metadata.items():
@@ -6,8 +6,9 @@ import unittest
 from unittest.mock import Mock
 
 from destination_chroma.config import ChromaIndexingConfigModel
-from destination_chroma.indexer import ChromaIndexer
+from destination_chroma.indexer import ChromaIndexer, get_chunk_ids
 
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.models.airbyte_protocol import AirbyteStream, DestinationSyncMode, SyncMode
 
 
@@ -153,7 +154,39 @@ class TestChromaIndexer(unittest.TestCase):
 
         self.mock_client.get_collection().add.assert_called_once()
 
+    def _chunks(self, record_id, texts):
+        record = Mock()
+        return [Chunk(page_content=text, metadata={"_ab_record_id": record_id}, record=record, embedding=[1.0]) for text in texts]
+
+    def test_chunk_ids_are_derived_from_the_record_and_the_content(self):
+        first_ids = [chunk_id for _, chunk_id in get_chunk_ids(self._chunks("some_id", ["a", "b"]))]
+        second_ids = [chunk_id for _, chunk_id in get_chunk_ids(self._chunks("some_id", ["a", "c"]))]
+
+        self.assertEqual(first_ids[0], second_ids[0])
+        self.assertNotEqual(first_ids[1], second_ids[1])
+
+    def test_index_only_writes_changed_chunks(self):
+        old_ids = [chunk_id for _, chunk_id in get_chunk_ids(self._chunks("some_id", ["a", "b"]))]
+        self.mock_client.get_collection().get.return_value = {"ids": old_ids}
+
+        self.chroma_indexer.delete(["some_id"], None, "some_stream")
+        self.mock_client.get_collection().delete.assert_not_called()
+        self.chroma_indexer.index(self._chunks("some_id", ["a", "c"]), None, "some_stream")
+
+        self.mock_client.get_collection().get.assert_called_once_with(where={"_ab_record_id": {"$in": ["some_id"]}}, include=[])
+        self.assertEqual(self.mock_client.get_collection().add.call_args.kwargs["documents"], ["c"])
+        self.mock_client.get_collection().delete.assert_called_once_with(ids=[old_ids[1]])
+
     def test_index_calls_delete(self):
+        self.mock_client.get_collection().get.return_value = {"ids": ["old_chunk"]}
+        self.chroma_indexer.delete(["some_id"], None, "some_stream")
+        self.chroma_indexer.index([], None, "some_stream")
+
+        self.mock_client.get_collection().add.assert_not_called()
+        self.mock_client.get_collection().delete.assert_called_with(ids=["old_chunk"])
+
+    def test_post_sync_deletes_records_left_to_replace(self):
         self.chroma_indexer.delete(["some_id"], None, "some_stream")
+        self.chroma_indexer.post_sync()
 
         self.mock_client.get_collection().delete.assert_called_with(where={"_ab_record_id": {"$in": ["some_id"]}})
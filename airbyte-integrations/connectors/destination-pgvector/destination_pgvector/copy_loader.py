@@ -0,0 +1,108 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""Stream the local JSONL batch files into Postgres with a binary `COPY ... FROM STDIN`."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+import orjson
+
+COPY_BUFFER_SIZE = 1024 * 1024
+"""The number of bytes sent to the server at once."""
+
+COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+COPY_TRAILER = struct.pack(">h", -1)
+COPY_NULL_FIELD = struct.pack(">i", -1)
+
+
+def encode_text(value: Any) -> bytes:  # noqa: ANN401  # Any JSON value
+    """Encode a value of a text or JSON column, objects are written as JSON."""
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value)
+    return str(value).encode()
+
+
+def encode_vector(value: list[float]) -> bytes:
+    """Encode an embedding in the binary format of the pgvector `vector` type.
+
+    The binary format skips the parsing of the numbers by the server, about half of the load time
+    of the text format for 1536 dimensions.
+    """
+    return struct.pack(f">HH{len(value)}f", len(value), 0, *value)
+
+
+def _open_jsonl(file_path: Path) -> IO[bytes]:
+    if file_path.suffix == ".gz":
+        return gzip.open(file_path, "rb")
+    return file_path.open("rb")
+
+
+def iter_copy_rows(
+    files: Iterable[Path],
+    columns: list[str],
+    vector_columns: set[str],
+) -> Iterator[bytes]:
+    """Yield the records of the JSONL files as the rows of a binary COPY, with its header.
+
+    The `vector_columns` are written as pgvector embeddings, the others as text, which is the
+    binary format of the text and JSON types. Record fields that are not in `columns` are left
+    out, missing fields are written as NULL.
+    """
+    encoders: list[Callable[[Any], bytes]] = [
+        encode_vector if column in vector_columns else encode_text for column in columns
+    ]
+    field_count = struct.pack(">h", len(columns))
+
+    yield COPY_HEADER
+    for file_path in files:
+        with _open_jsonl(file_path) as jsonl_file:
+            for line in jsonl_file:
+                record = orjson.loads(line)
+                fields = [field_count]
+                for column, encode in zip(columns, encoders):
+                    value = record.get(column)
+                    if value is None:
+                        fields.append(COPY_NULL_FIELD)
+                        continue
+                    data = encode(value)
+                    fields.append(struct.pack(">i", len(data)))
+                    fields.append(data)
+                yield b"".join(fields)
+    yield COPY_TRAILER
+
+
+class CopyStream(io.RawIOBase):
+    """A file-like view of the COPY rows, read by the driver while the rows are produced.
+
+    Only one read buffer is held in memory, rather than the encoded files.
+    """
+
+    def __init__(self, rows: Iterator[bytes]) -> None:
+        """Initialize the stream over the given rows."""
+        super().__init__()
+        self._rows = rows
+        self._buffer = bytearray()
+
+    def readable(self) -> bool:
+        """Return True, the stream is only read."""
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """Return up to `size` bytes of rows, all the remaining rows if `size` is negative."""
+        while size < 0 or len(self._buffer) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._buffer += row
+        if size < 0:
+            size = len(self._buffer)
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return chunk
@@ -47,6 +47,7 @@ class DestinationPGVector(Destination):
             catalog_provider=CatalogProvider(configured_catalog),
             temp_dir=Path(tempfile.mkdtemp()),
             temp_file_cleanup=True,
+            embedding_batch_size=BATCH_SIZE,
         )
 
     def write(
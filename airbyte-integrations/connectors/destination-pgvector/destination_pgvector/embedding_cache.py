@@ -0,0 +1,99 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""A cache of the chunk embeddings, keyed by the hash of the chunk content."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+MEMORY_CACHE_SIZE = 10_000
+"""The number of embeddings kept in memory, the least recently used ones are evicted first."""
+
+SQLITE_BATCH_SIZE = 500
+"""Keys looked up per statement, below the SQLite limit of host parameters."""
+
+CACHE_FILE_NAME = "embeddings.sqlite"
+
+
+class EmbeddingCache:
+    """Embeddings of the chunk contents already embedded with the same embedding configuration.
+
+    The most recent embeddings are kept in memory, so repeated chunks of a sync are embedded once.
+    When a directory is given, all embeddings are also kept in a SQLite file there, so the
+    unchanged chunks of the next syncs are not embedded again.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        directory: Path | str | None = None,
+        memory_cache_size: int = MEMORY_CACHE_SIZE,
+    ) -> None:
+        """Initialize the cache.
+
+        The namespace identifies the embedding model, the embeddings of different namespaces are
+        never mixed up.
+        """
+        self._namespace = namespace
+        self._memory_cache_size = memory_cache_size
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(Path(directory) / CACHE_FILE_NAME)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, embedding TEXT NOT NULL)"
+            )
+
+    def key(self, content: str) -> str:
+        """Return the cache key of the given chunk content."""
+        return hashlib.sha256(f"{self._namespace}\0{content}".encode()).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Return the cached embeddings of the given keys, missing keys are left out."""
+        found: dict[str, list[float]] = {}
+        for key in keys:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+
+        missing = [key for key in keys if key not in found]
+        if self._connection is not None and missing:
+            for start in range(0, len(missing), SQLITE_BATCH_SIZE):
+                batch = missing[start : start + SQLITE_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                )
+                for key, embedding in rows:
+                    found[key] = json.loads(embedding)
+                    self._remember(key, found[key])
+        return found
+
+    def put_many(self, embeddings: dict[str, list[float]]) -> None:
+        """Add the given embeddings to the cache."""
+        for key, embedding in embeddings.items():
+            self._remember(key, embedding)
+        if self._connection is not None and embeddings:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                    [(key, json.dumps(embedding)) for key, embedding in embeddings.items()],
+                )
+
+    def close(self) -> None:
+        """Close the cache file, if any."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _remember(self, key: str, embedding: list[float]) -> None:
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_cache_size:
+            self._memory.popitem(last=False)
@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
+import os
 import uuid
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
@@ -12,7 +15,9 @@ import dpath
 import sqlalchemy
 from airbyte._processors.file.jsonl import JsonlWriter
 from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
 from airbyte_cdk.destinations.vector_db_based import embedder
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.destinations.vector_db_based.document_processor import (
     DocumentProcessor as DocumentSplitter,
 )
@@ -26,6 +31,8 @@ from typing_extensions import Protocol
 
 from destination_pgvector.common.catalog.catalog_providers import CatalogProvider
 from destination_pgvector.common.sql.sql_processor import SqlConfig, SqlProcessorBase
+from destination_pgvector.copy_loader import COPY_BUFFER_SIZE, CopyStream, iter_copy_rows
+from destination_pgvector.embedding_cache import EmbeddingCache
 from destination_pgvector.globals import (
     CHUNK_ID_COLUMN,
     DOCUMENT_CONTENT_COLUMN,
@@ -34,6 +41,24 @@ from destination_pgvector.globals import (
     METADATA_COLUMN,
 )
 
+EMBEDDING_BATCH_SIZE = 150
+"""The number of chunks, across records, embedded with a single embedder call."""
+
+EMBEDDING_CACHE_DIR = os.getenv("PGVECTOR_EMBEDDING_CACHE_DIR")
+"""A persistent directory to keep the embeddings of the chunk contents between the syncs."""
+
+EMBEDDING_CACHE_SECRET_FIELDS = {"openai_key", "cohere_key", "api_key"}
+"""Embedding config fields left out of the cache namespace, e.g. a rotated key keeps the cache."""
+
+
+@dataclass
+class PendingRecord:
+    """A record split into chunks, waiting for the embeddings of its chunks."""
+
+    record_msg: AirbyteRecordMessage
+    document_id: str
+    chunks: list[Chunk]
+
 
 class PostgresConfig(SqlConfig):
     """Configuration for the Postgres cache.
@@ -94,10 +119,14 @@ class PGVectorProcessor(SqlProcessorBase):
         catalog_provider: CatalogProvider,
         temp_dir: Path,
         temp_file_cleanup: bool = True,
+        embedding_batch_size: int = EMBEDDING_BATCH_SIZE,
     ) -> None:
         """Initialize the PGVector processor."""
         self.splitter_config = splitter_config
         self.embedder_config = embedder_config
+        self.embedding_batch_size = embedding_batch_size
+        self._pending_records: list[PendingRecord] = []
+        self._pending_chunks_count = 0
         super().__init__(
             sql_config=sql_config,
             catalog_provider=catalog_provider,
@@ -122,6 +151,46 @@ class PGVectorProcessor(SqlProcessorBase):
             EMBEDDING_COLUMN: Vector(self.embedding_dimensions),
         }
 
+    @cached_property
+    def bulk_load_engine(self) -> sqlalchemy.engine.Engine:
+        """Return the engine of the `COPY` loads, reused so its connections are pooled."""
+        return self.get_sql_engine()
+
+    @overrides
+    def _write_files_to_new_table(
+        self,
+        files: list[Path],
+        stream_name: str,
+        batch_id: str,
+    ) -> str:
+        """Write the files to a new table.
+
+        The JSONL files are streamed into the table with a binary `COPY ... FROM STDIN`, rather
+        than loaded in a dataframe and inserted with a new engine for each file.
+        """
+        temp_table_name = self._create_table_for_loading(stream_name, batch_id)
+        column_definitions = self._get_sql_column_definitions(stream_name)
+        columns = list(column_definitions)
+        vector_columns = {
+            column
+            for column, sql_type in column_definitions.items()
+            if isinstance(sql_type, Vector)
+        }
+        copy_statement = (
+            f"COPY {self._fully_qualified(temp_table_name)} "
+            f"({', '.join(self._quote_identifier(column) for column in columns)}) "
+            "FROM STDIN WITH (FORMAT binary)"
+        )
+        with self.bulk_load_engine.begin() as connection:
+            self._init_connection_settings(connection)
+            with connection.connection.cursor() as cursor:
+                cursor.copy_expert(
+                    copy_statement,
+                    CopyStream(iter_copy_rows(files, columns, vector_columns)),
+                    size=COPY_BUFFER_SIZE,
+                )
+        return temp_table_name
+
     def _emulated_merge_temp_table_to_final_table(
         self,
         stream_name: str,
@@ -173,45 +242,109 @@ class PGVectorProcessor(SqlProcessorBase):
 
         We override the SQLProcessor implementation in order to handle chunking, embedding, etc.
 
-        This method is called for each record message, before the record is written to local file.
+        This method is called for each record message. The chunks of the record are embedded
+        together with the chunks of the next records, once `embedding_batch_size` chunks are
+        pending, and then written to local file.
         """
         document_chunks, id_to_delete = self.splitter.process(record_msg)
 
         _ = id_to_delete  # unused
 
-        embeddings = self.embedder.embed_documents(
-            documents=document_chunks,
+        self._pending_records.append(
+            PendingRecord(
+                record_msg=record_msg,
+                document_id=self._create_document_id(record_msg),
+                chunks=document_chunks,
+            )
+        )
+        self._pending_chunks_count += len(document_chunks)
+        if self._pending_chunks_count >= self.embedding_batch_size:
+            self._flush_pending_records()
+
+    @overrides
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Embed and write the pending records before finalizing the streams."""
+        self._flush_pending_records()
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+        super().write_all_stream_data(write_strategy=write_strategy)
+
+    def _flush_pending_records(self) -> None:
+        """Embed the chunks of all pending records at once and write them to local file."""
+        if not self._pending_records:
+            return
+
+        embeddings = iter(
+            self._embed_chunks([
+                chunk for pending in self._pending_records for chunk in pending.chunks
+            ])
         )
-        for i, chunk in enumerate(document_chunks, start=0):
-            new_data: dict[str, Any] = {
-                DOCUMENT_ID_COLUMN: self._create_document_id(record_msg),
-                CHUNK_ID_COLUMN: str(uuid.uuid4().int),
-                METADATA_COLUMN: chunk.metadata,
-                DOCUMENT_CONTENT_COLUMN: chunk.page_content,
-                EMBEDDING_COLUMN: embeddings[i],
-            }
-
-            self.file_writer.process_record_message(
-                record_msg=AirbyteRecordMessage(
-                    namespace=record_msg.namespace,
-                    stream=record_msg.stream,
-                    data=new_data,
-                    emitted_at=record_msg.emitted_at,
-                ),
-                stream_schema={
-                    "type": "object",
-                    "properties": {
-                        DOCUMENT_ID_COLUMN: {"type": "string"},
-                        CHUNK_ID_COLUMN: {"type": "string"},
-                        METADATA_COLUMN: {"type": "object"},
-                        DOCUMENT_CONTENT_COLUMN: {"type": "string"},
-                        EMBEDDING_COLUMN: {
-                            "type": "array",
-                            "items": {"type": "float"},
-                        },
+        for pending in self._pending_records:
+            for chunk in pending.chunks:
+                self._write_chunk(pending, chunk, next(embeddings))
+
+        self._pending_records = []
+        self._pending_chunks_count = 0
+
+    def _embed_chunks(self, chunks: list[Chunk]) -> list[list[float] | None]:
+        """Return the embeddings of the chunks, embedding only the contents not in the cache."""
+        if self.embedding_cache is None:
+            return self.embedder.embed_documents(documents=chunks)  # type: ignore [arg-type]
+
+        keys = [self.embedding_cache.key(chunk.page_content or "") for chunk in chunks]
+        cached = self.embedding_cache.get_many(keys)
+        # The same content is embedded once, even when repeated in the batch
+        to_embed: dict[str, Chunk] = {}
+        for key, chunk in zip(keys, chunks):
+            if key not in cached and key not in to_embed:
+                to_embed[key] = chunk
+        if to_embed:
+            embeddings = self.embedder.embed_documents(
+                documents=list(to_embed.values()),  # type: ignore [arg-type]
+            )
+            new_embeddings = dict(zip(to_embed.keys(), embeddings))
+            self.embedding_cache.put_many({
+                key: value for key, value in new_embeddings.items() if value is not None
+            })
+            cached = {**cached, **new_embeddings}
+        return [cached[key] for key in keys]
+
+    def _write_chunk(
+        self,
+        pending: PendingRecord,
+        chunk: Chunk,
+        embedding: list[float] | None,
+    ) -> None:
+        record_msg = pending.record_msg
+        new_data: dict[str, Any] = {
+            DOCUMENT_ID_COLUMN: pending.document_id,
+            CHUNK_ID_COLUMN: str(uuid.uuid4().int),
+            METADATA_COLUMN: chunk.metadata,
+            DOCUMENT_CONTENT_COLUMN: chunk.page_content,
+            EMBEDDING_COLUMN: embedding,
+        }
+
+        self.file_writer.process_record_message(
+            record_msg=AirbyteRecordMessage(
+                namespace=record_msg.namespace,
+                stream=record_msg.stream,
+                data=new_data,
+                emitted_at=record_msg.emitted_at,
+            ),
+            stream_schema={
+                "type": "object",
+                "properties": {
+                    DOCUMENT_ID_COLUMN: {"type": "string"},
+                    CHUNK_ID_COLUMN: {"type": "string"},
+                    METADATA_COLUMN: {"type": "object"},
+                    DOCUMENT_CONTENT_COLUMN: {"type": "string"},
+                    EMBEDDING_COLUMN: {
+                        "type": "array",
+                        "items": {"type": "float"},
                     },
                 },
-            )
+            },
+        )
 
     def _add_missing_columns_to_table(
         self,
@@ -224,19 +357,34 @@ class PGVectorProcessor(SqlProcessorBase):
         """
         pass
 
-    @property
+    @cached_property
     def embedder(self) -> embedder.Embedder:
         return embedder.create_from_config(
             embedding_config=self.embedder_config,  # type: ignore [arg-type]  # No common base class
             processing_config=self.splitter_config,
         )
 
+    @cached_property
+    def embedding_cache(self) -> EmbeddingCache | None:
+        """Return the cache of the chunk embeddings, None if they come from the records."""
+        if self.embedder_config.mode == "from_field":
+            return None
+        config = self.embedder_config.dict()  # type: ignore [attr-defined]  # No common base class
+        namespace = repr(
+            sorted(
+                (name, value)
+                for name, value in config.items()
+                if name not in EMBEDDING_CACHE_SECRET_FIELDS
+            )
+        )
+        return EmbeddingCache(namespace=namespace, directory=EMBEDDING_CACHE_DIR)
+
     @property
     def embedding_dimensions(self) -> int:
         """Return the number of dimensions for the embeddings."""
         return self.embedder.embedding_dimensions
 
-    @property
+    @cached_property
     def splitter(self) -> DocumentSplitter:
         return DocumentSplitter(
             config=self.splitter_config,
@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import json
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from destination_pgvector.copy_loader import COPY_HEADER, COPY_TRAILER, CopyStream, iter_copy_rows
+
+
+def _decode_row(row: bytes) -> list:
+    (field_count,) = struct.unpack_from(">h", row)
+    offset = 2
+    fields = []
+    for _ in range(field_count):
+        (length,) = struct.unpack_from(">i", row, offset)
+        offset += 4
+        if length == -1:
+            fields.append(None)
+            continue
+        fields.append(row[offset : offset + length])
+        offset += length
+    assert offset == len(row)
+    return fields
+
+
+class TestCopyLoader(unittest.TestCase):
+    def setUp(self):
+        self.file_path = Path(tempfile.mkdtemp()) / "batch.jsonl.gz"
+        with gzip.open(self.file_path, "wt") as jsonl_file:
+            jsonl_file.write(
+                json.dumps({
+                    "_airbyte_raw_id": "ignored",
+                    "document_id": "Stream_mystream_Key_1",
+                    "metadata": {"text": "tab\there \\ back"},
+                    "document_content": "line\nwith newline",
+                    "embedding": [0.5, -1.25, 2.0],
+                })
+                + "\n"
+            )
+
+    def test_records_are_encoded_as_binary_copy_rows(self):
+        rows = list(
+            iter_copy_rows(
+                [self.file_path],
+                columns=["document_id", "chunk_id", "metadata", "document_content", "embedding"],
+                vector_columns={"embedding"},
+            )
+        )
+
+        self.assertEqual(rows[0], COPY_HEADER)
+        self.assertEqual(rows[-1], COPY_TRAILER)
+        document_id, chunk_id, metadata, content, embedding = _decode_row(rows[1])
+        self.assertEqual(document_id, b"Stream_mystream_Key_1")
+        self.assertIsNone(chunk_id)
+        self.assertEqual(json.loads(metadata), {"text": "tab\there \\ back"})
+        self.assertEqual(content, b"line\nwith newline")
+        self.assertEqual(struct.unpack(">HH3f", embedding), (3, 0, 0.5, -1.25, 2.0))
+
+    def test_copy_stream_reads_the_rows_by_size(self):
+        stream = CopyStream(iter([b"abc", b"defgh", b"i"]))
+
+        self.assertEqual(stream.read(4), b"abcd")
+        self.assertEqual(stream.read(4), b"efgh")
+        self.assertEqual(stream.read(4), b"i")
+        self.assertEqual(stream.read(4), b"")
@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
+from airbyte_cdk.destinations.vector_db_based.config import FakeEmbeddingConfigModel
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk, ProcessingConfigModel
+from airbyte_cdk.destinations.vector_db_based.embedder import FakeEmbedder
+from airbyte_cdk.models import AirbyteRecordMessage, ConfiguredAirbyteCatalog
+
+from destination_pgvector.common.catalog.catalog_providers import CatalogProvider
+from destination_pgvector.pgvector_processor import PGVectorProcessor, PostgresConfig
+
+CATALOG = {
+    "streams": [
+        {
+            "stream": {
+                "name": "mystream",
+                "json_schema": {"type": "object", "properties": {"str_col": {"type": "string"}}},
+                "supported_sync_modes": ["full_refresh"],
+            },
+            "sync_mode": "full_refresh",
+            "destination_sync_mode": "overwrite",
+        }
+    ]
+}
+
+
+class TestPGVectorProcessor(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(PGVectorProcessor, "_ensure_schema_exists")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.embed_documents = patch.object(
+            FakeEmbedder, "embed_documents", autospec=True, side_effect=FakeEmbedder.embed_documents
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    def _processor(self, embedding_batch_size: int = 150) -> PGVectorProcessor:
+        processor = PGVectorProcessor(
+            sql_config=PostgresConfig(
+                host="MYACCOUNT",
+                port=5432,
+                database="MYDATABASE",
+                schema_name="MYSCHEMA",
+                username="MYUSERNAME",
+                password=SecretString("xxxxxxx"),
+            ),
+            splitter_config=ProcessingConfigModel(chunk_size=1000, text_fields=["str_col"]),
+            embedder_config=FakeEmbeddingConfigModel(mode="fake"),
+            catalog_provider=CatalogProvider(ConfiguredAirbyteCatalog.parse_obj(CATALOG)),
+            temp_dir=Path(tempfile.mkdtemp()),
+            embedding_batch_size=embedding_batch_size,
+        )
+        processor.file_writer = Mock()
+        # One chunk per record, the real splitter downloads its tokenizer
+        processor.splitter = Mock()
+        processor.splitter.process.side_effect = lambda record: (
+            [Chunk(page_content=f"str_col: {record.data['str_col']}", metadata={}, record=record)],
+            None,
+        )
+        return processor
+
+    def _write(self, processor: PGVectorProcessor, contents: list[str]) -> list[dict]:
+        for content in contents:
+            processor.process_record_message(
+                AirbyteRecordMessage(stream="mystream", data={"str_col": content}, emitted_at=0),
+                stream_schema={},
+            )
+        with patch.object(PGVectorProcessor, "write_stream_data"):
+            processor.write_all_stream_data(write_strategy=WriteStrategy.AUTO)
+        return [
+            call.kwargs["record_msg"].data
+            for call in processor.file_writer.process_record_message.call_args_list
+        ]
+
+    def test_chunks_of_several_records_are_embedded_together(self):
+        processor = self._processor(embedding_batch_size=4)
+
+        rows = self._write(processor, [f"record {i}" for i in range(10)])
+
+        self.assertEqual(
+            [row["document_content"] for row in rows],
+            [f"str_col: record {i}" for i in range(10)],
+        )
+        self.assertTrue(all(len(row["embedding"]) == 1536 for row in rows))
+        self.assertEqual(
+            [len(call.kwargs["documents"]) for call in self.embed_documents.call_args_list],
+            [4, 4, 2],
+        )
+
+    def test_repeated_chunks_are_embedded_once(self):
+        processor = self._processor()
+
+        rows = self._write(processor, ["same", "same", "other"])
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["embedding"], rows[1]["embedding"])
+        self.assertEqual(
+            [len(call.kwargs["documents"]) for call in self.embed_documents.call_args_list], [2]
+        )
+
+    def test_unchanged_chunks_are_not_embedded_again_in_the_next_sync(self):
+        with (
+            tempfile.TemporaryDirectory() as cache_dir,
+            patch("destination_pgvector.pgvector_processor.EMBEDDING_CACHE_DIR", cache_dir),
+        ):
+            first_sync = self._processor()
+            first_rows = self._write(first_sync, ["first", "second"])
+            second_sync = self._processor()
+            second_rows = self._write(second_sync, ["first", "second", "third"])
+
+        self.assertEqual(
+            [len(call.kwargs["documents"]) for call in self.embed_documents.call_args_list], [2, 1]
+        )
+        self.assertEqual(
+            [row["embedding"] for row in first_rows],
+            [row["embedding"] for row in second_rows[:2]],
+        )
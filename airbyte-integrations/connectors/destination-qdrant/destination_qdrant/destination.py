@@ -25,7 +25,9 @@ class DestinationQdrant(Destination):
 
     def _init_indexer(self, config: ConfigModel):
         self.embedder = create_from_config(config.embedding, config.processing)
-        self.indexer = QdrantIndexer(config.indexing, self.embedder.embedding_dimensions)
+        self.indexer = QdrantIndexer(
+            config.indexing, self.embedder.embedding_dimensions, embeddings_from_records=config.embedding.mode == "from_field"
+        )
 
     def write(
         self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
@@ -3,14 +3,17 @@
 #
 
 
+import hashlib
+import json
 import uuid
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from qdrant_client import QdrantClient, models
 from qdrant_client.conversions.common_types import PointsSelector
 from qdrant_client.models import Distance, PayloadSchemaType, VectorParams
 
-from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD, METADATA_STREAM_FIELD
+from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD, METADATA_STREAM_FIELD, Chunk
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
 from airbyte_cdk.destinations.vector_db_based.utils import create_stream_identifier, format_exception
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, ConfiguredAirbyteCatalog, Level, Type
@@ -24,13 +27,47 @@ DISTANCE_METRIC_MAP = {
     "euc": Distance.EUCLID,
 }
 
+# Namespace of the ids of the chunks, derived from their record id and content (destination-chroma has a copy)
+CHUNK_ID_NAMESPACE = uuid.UUID("5f0c3d3a-3b8e-4b43-9a57-2f4c4b0f5e4d")
+SCROLL_PAGE_SIZE = 1000
+
+
+def get_chunk_ids(document_chunks: List[Chunk], embeddings_from_records: bool = False) -> List[Tuple[Chunk, str]]:
+    """Return the chunks with their point ids: stable across syncs for the last version of a record with an id, random otherwise."""
+    chunks_with_ids: List[Tuple[Chunk, str]] = []
+    record_chunks: Dict[str, List[Chunk]] = {}
+    records = {}
+    for chunk in document_chunks:
+        record_id = chunk.metadata.get(METADATA_RECORD_ID_FIELD)
+        if record_id is None:
+            chunks_with_ids.append((chunk, str(uuid.uuid4())))
+            continue
+        if records.get(record_id) is not chunk.record:
+            records[record_id] = chunk.record
+            record_chunks[record_id] = []
+        record_chunks[record_id].append(chunk)
+
+    for record_id, chunks in record_chunks.items():
+        for index, chunk in enumerate(chunks):
+            # the embedding stands for the text when the text is omitted, or when it isn't computed from the text
+            with_embedding = embeddings_from_records or chunk.page_content is None
+            content = json.dumps(
+                [chunk.page_content, chunk.metadata, chunk.embedding if with_embedding else None], sort_keys=True, default=str
+            )
+            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            chunks_with_ids.append((chunk, str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{record_id}:{index}:{content_hash}"))))
+    return chunks_with_ids
+
 
 class QdrantIndexer(Indexer):
     config: QdrantIndexingConfigModel
 
-    def __init__(self, config: QdrantIndexingConfigModel, embedding_dimensions: int):
+    def __init__(self, config: QdrantIndexingConfigModel, embedding_dimensions: int, embeddings_from_records: bool = False):
         super().__init__(config)
         self.embedding_dimensions = embedding_dimensions
+        self.embeddings_from_records = embeddings_from_records
+        # ids of the records whose chunks are replaced by their chunks in the next `index` call of their stream
+        self._records_to_replace: Dict[Tuple[Optional[str], str], List[str]] = defaultdict(list)
 
     def check(self) -> Optional[str]:
         auth_method_mode = self.config.auth_method.mode
@@ -90,35 +127,40 @@ class QdrantIndexer(Indexer):
             )
 
     def delete(self, delete_ids, namespace, stream):
-        if len(delete_ids) > 0:
-            self._delete_for_filter(
-                models.FilterSelector(
-                    filter=models.Filter(
-                        should=[
-                            models.FieldCondition(key=METADATA_RECORD_ID_FIELD, match=models.MatchValue(value=_id)) for _id in delete_ids
-                        ]
-                    )
-                )
-            )
+        # The points of the records are diffed against their new chunks in `index`, the unchanged ones are kept
+        self._records_to_replace[(namespace, stream)].extend(delete_ids)
 
     def index(self, document_chunks, namespace, stream):
+        record_ids = self._records_to_replace.pop((namespace, stream), [])
+        existing_ids = self._get_point_ids(record_ids) if record_ids else set()
+
         entities = []
-        for i in range(len(document_chunks)):
-            chunk = document_chunks[i]
+        chunk_ids = set()
+        for chunk, chunk_id in get_chunk_ids(document_chunks, self.embeddings_from_records):
+            chunk_ids.add(chunk_id)
+            if chunk_id in existing_ids:
+                continue
             payload = chunk.metadata
             if chunk.page_content is not None:
                 payload[self.config.text_field] = chunk.page_content
             entities.append(
                 models.Record(
-                    id=str(uuid.uuid4()),
+                    id=chunk_id,
                     payload=payload,
                     vector=chunk.embedding,
                 )
             )
         self._client.upload_records(collection_name=self.config.collection, records=entities)
 
+        vanished_ids = existing_ids - chunk_ids
+        if vanished_ids:
+            self._delete_for_filter(models.PointIdsList(points=list(vanished_ids)))
+
     def post_sync(self) -> List[AirbyteMessage]:
         try:
+            for record_ids in self._records_to_replace.values():
+                self._delete_records(record_ids)
+            self._records_to_replace.clear()
             self._client.close()
             return [
                 AirbyteMessage(
@@ -141,3 +183,34 @@ class QdrantIndexer(Indexer):
 
     def _delete_for_filter(self, selector: PointsSelector) -> None:
         self._client.delete(collection_name=self.config.collection, points_selector=selector)
+
+    def _delete_records(self, record_ids: List[str]) -> None:
+        if len(record_ids) > 0:
+            self._delete_for_filter(
+                models.FilterSelector(
+                    filter=models.Filter(
+                        should=[
+                            models.FieldCondition(key=METADATA_RECORD_ID_FIELD, match=models.MatchValue(value=_id)) for _id in record_ids
+                        ]
+                    )
+                )
+            )
+
+    def _get_point_ids(self, record_ids: Iterable[str]) -> Set[str]:
+        point_ids = set()
+        scroll_filter = models.Filter(
+            should=[models.FieldCondition(key=METADATA_RECORD_ID_FIELD, match=models.MatchAny(any=sorted(set(record_ids))))]
+        )
+        offset = None
+        while True:
+            points, offset = self._client.scroll(
+                collection_name=self.config.collection,
+                scroll_filter=scroll_filter,
+                limit=SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+            point_ids.update(str(point.id) for point in points)
+            if offset is None:
+                return point_ids
@@ -6,9 +6,10 @@ import unittest
 from unittest.mock import Mock, call
 
 from destination_qdrant.config import QdrantIndexingConfigModel
-from destination_qdrant.indexer import QdrantIndexer
+from destination_qdrant.indexer import QdrantIndexer, get_chunk_ids
 from qdrant_client import models
 
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.destinations.vector_db_based.utils import format_exception
 from airbyte_cdk.models.airbyte_protocol import AirbyteLogMessage, AirbyteMessage, AirbyteStream, DestinationSyncMode, Level, SyncMode, Type
 
@@ -157,8 +158,52 @@ class TestQdrantIndexer(unittest.TestCase):
 
         self.qdrant_indexer._client.upload_records.assert_called_once()
 
+    def _chunks(self, record_id, texts):
+        record = Mock()
+        return [Chunk(page_content=text, metadata={"_ab_record_id": record_id}, record=record, embedding=[1.0]) for text in texts]
+
+    def test_chunk_ids_are_derived_from_the_record_and_the_content(self):
+        first_ids = [chunk_id for _, chunk_id in get_chunk_ids(self._chunks("some_id", ["a", "b"]))]
+        second_ids = [chunk_id for _, chunk_id in get_chunk_ids(self._chunks("some_id", ["a", "c"]))]
+        other_record_ids = [chunk_id for _, chunk_id in get_chunk_ids(self._chunks("another_id", ["a", "b"]))]
+
+        self.assertEqual(first_ids[0], second_ids[0])
+        self.assertNotEqual(first_ids[1], second_ids[1])
+        self.assertTrue(set(first_ids).isdisjoint(other_record_ids))
+
+    def test_chunk_ids_keep_the_last_version_of_a_record(self):
+        chunks = self._chunks("some_id", ["a", "b"]) + self._chunks("some_id", ["c"])
+
+        self.assertEqual([chunk.page_content for chunk, _ in get_chunk_ids(chunks)], ["c"])
+
+    def test_index_only_writes_changed_chunks(self):
+        old_ids = [chunk_id for _, chunk_id in get_chunk_ids(self._chunks("some_id", ["a", "b"]))]
+        self.qdrant_indexer._client.scroll.return_value = ([Mock(id=old_id) for old_id in old_ids], None)
+
+        self.qdrant_indexer.delete(["some_id"], None, "some_stream")
+        self.qdrant_indexer._client.delete.assert_not_called()
+        self.qdrant_indexer.index(self._chunks("some_id", ["a", "c"]), None, "some_stream")
+
+        records = self.qdrant_indexer._client.upload_records.call_args.kwargs["records"]
+        self.assertEqual([record.payload["text"] for record in records], ["c"])
+        self.qdrant_indexer._client.delete.assert_called_once_with(
+            collection_name=self.mock_config.collection,
+            points_selector=models.PointIdsList(points=[old_ids[1]]),
+        )
+
     def test_index_calls_delete(self):
+        self.qdrant_indexer._client.scroll.return_value = ([], None)
+        self.qdrant_indexer.delete(["some_id", "another_id"], None, "some_stream")
+        self.qdrant_indexer.index([], None, "some_stream")
+
+        self.qdrant_indexer._client.scroll.assert_called_once()
+        self.assertEqual(
+            self.qdrant_indexer._client.scroll.call_args.kwargs["scroll_filter"].should[0].match.any, ["another_id", "some_id"]
+        )
+
+    def test_post_sync_deletes_records_left_to_replace(self):
         self.qdrant_indexer.delete(["some_id", "another_id"], None, "some_stream")
+        self.qdrant_indexer.post_sync()
 
         self.qdrant_indexer._client.delete.assert_called_with(
             collection_name=self.mock_config.collection,
@@ -14,7 +14,7 @@ from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.api import FacebookResponse
 from facebook_business.exceptions import FacebookRequestError
 
-from source_facebook_marketing.streams.common import retry_pattern
+from source_facebook_marketing.streams.common import parse_insights_throttle, retry_pattern
 
 
 logger = logging.getLogger("airbyte")
@@ -138,13 +138,10 @@ class MyFacebookAdsApi(FacebookAdsApi):
         jobs for current app/account.  We need this information to adjust
         number of running async jobs for optimal performance.
         """
-        ads_insights_throttle = response.headers().get("x-fb-ads-insights-throttle")
+        ads_insights_throttle = parse_insights_throttle(response.headers())
         if ads_insights_throttle:
-            ads_insights_throttle = json.loads(ads_insights_throttle)
-            self._ads_insights_throttle = self.Throttle(
-                per_application=ads_insights_throttle.get("app_id_util_pct", 0),
-                per_account=ads_insights_throttle.get("acc_id_util_pct", 0),
-            )
+            per_application, per_account = ads_insights_throttle
+            self._ads_insights_throttle = self.Throttle(per_application=per_application, per_account=per_account)
 
     def _should_restore_default_page_size(self, params):
         """
@@ -153,17 +153,20 @@ class SourceFacebookMarketing(AbstractSource):
         insights_args = dict(
             api=api,
             account_ids=config.account_ids,
+            max_concurrent_accounts=config.max_concurrent_accounts,
             start_date=report_start_date,
             end_date=config.end_date,
             insights_lookback_window=config.insights_lookback_window,
             insights_job_timeout=config.insights_job_timeout,
+            insights_result_workers=config.insights_result_workers,
             filter_statuses=[status.value for status in [*ValidAdStatuses]],
         )
         streams = [
-            AdAccount(api=api, account_ids=config.account_ids),
+            AdAccount(api=api, account_ids=config.account_ids, max_concurrent_accounts=config.max_concurrent_accounts),
             AdSets(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 start_date=config.start_date,
                 end_date=config.end_date,
                 filter_statuses=config.adset_statuses,
@@ -172,6 +175,7 @@ class SourceFacebookMarketing(AbstractSource):
             Ads(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 start_date=config.start_date,
                 end_date=config.end_date,
                 filter_statuses=config.ad_statuses,
@@ -180,6 +184,7 @@ class SourceFacebookMarketing(AbstractSource):
             AdCreatives(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 fetch_thumbnail_images=config.fetch_thumbnail_images,
                 page_size=config.page_size,
             ),
@@ -212,6 +217,7 @@ class SourceFacebookMarketing(AbstractSource):
             Campaigns(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 start_date=config.start_date,
                 end_date=config.end_date,
                 filter_statuses=config.campaign_statuses,
@@ -220,16 +226,19 @@ class SourceFacebookMarketing(AbstractSource):
             CustomConversions(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 page_size=config.page_size,
             ),
             CustomAudiences(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 page_size=config.page_size,
             ),
             Images(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 start_date=config.start_date,
                 end_date=config.end_date,
                 page_size=config.page_size,
@@ -237,6 +246,7 @@ class SourceFacebookMarketing(AbstractSource):
             Videos(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 start_date=config.start_date,
                 end_date=config.end_date,
                 page_size=config.page_size,
@@ -244,6 +254,7 @@ class SourceFacebookMarketing(AbstractSource):
             Activities(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 start_date=config.start_date,
                 end_date=config.end_date,
                 page_size=config.page_size,
@@ -320,6 +331,7 @@ class SourceFacebookMarketing(AbstractSource):
             stream = AdsInsights(
                 api=api,
                 account_ids=config.account_ids,
+                max_concurrent_accounts=config.max_concurrent_accounts,
                 name=f"Custom{insight.name}",
                 fields=list(insight_fields),
                 breakdowns=list(set(insight.breakdowns)),
@@ -330,6 +342,7 @@ class SourceFacebookMarketing(AbstractSource):
                 end_date=insight.end_date or config.end_date,
                 insights_lookback_window=insight.insights_lookback_window or config.insights_lookback_window,
                 insights_job_timeout=insight.insights_job_timeout or config.insights_job_timeout,
+                insights_result_workers=config.insights_result_workers,
                 level=insight.level,
             )
             streams.append(stream)
@@ -323,6 +323,26 @@ class ConnectorConfig(BaseConfig):
         default=60,
     )
 
+    insights_result_workers: Optional[PositiveInt] = Field(
+        title="Insights Result Workers",
+        order=13,
+        description=(
+            "The number of threads used to download the results of completed insights jobs, while new jobs keep being started and polled. "
+            "When not set, the results are downloaded one after another, in between the job polling."
+        ),
+        maximum=10,
+    )
+
+    max_concurrent_accounts: Optional[PositiveInt] = Field(
+        title="Max Concurrent Accounts",
+        order=14,
+        description=(
+            "The number of ad accounts synced at the same time, each with its own insights job queue and rate limits. "
+            "When not set, the accounts are synced one after another."
+        ),
+        maximum=50,
+    )
+
     action_breakdowns_allow_empty: bool = Field(
         description="Allows action_breakdowns to be an empty list",
         default=True,
@@ -132,6 +132,16 @@ class AsyncJob(ABC):
     def get_result(self) -> Iterator[Any]:
         """Retrieve result of the finished job."""
 
+    @property
+    def elapsed_time(self) -> Optional[timedelta]:
+        """Elapsed time since the job start, None if unknown"""
+        return None
+
+    @property
+    def estimated_time_left(self) -> Optional[timedelta]:
+        """Estimated time until the job completes, None if unknown"""
+        return None
+
 
 # ----------------------------- parent job -----------------------------------
 class ParentAsyncJob(AsyncJob):
@@ -183,6 +193,18 @@ class ParentAsyncJob(AsyncJob):
     def failed(self) -> bool:
         return all(child.completed for child in self._jobs) and any(child.failed for child in self._jobs)
 
+    @property
+    def elapsed_time(self) -> Optional[timedelta]:
+        """Elapsed time of the longest running child"""
+        elapsed = [e for e in (child.elapsed_time for child in self._jobs) if e is not None]
+        return max(elapsed) if elapsed else None
+
+    @property
+    def estimated_time_left(self) -> Optional[timedelta]:
+        """Earliest estimated completion among the running children"""
+        estimates = [e for e in (child.estimated_time_left for child in self._jobs) if e is not None]
+        return min(estimates) if estimates else None
+
     def update_job(self, batch: Optional[FacebookAdsApiBatch] = None):
         for child in self._jobs:
             if child.started and not child.completed:
@@ -305,6 +327,17 @@ class InsightAsyncJob(AsyncJob):
         end_time = self._finish_time or ab_datetime_now()
         return end_time - self._start_time
 
+    @property
+    def estimated_time_left(self) -> Optional[timedelta]:
+        """Linear estimate from `async_percent_completion` and the elapsed time, None until some progress is reported"""
+        if not self._job or not self.started or self.completed:
+            return None
+        percent = self._job.get("async_percent_completion")
+        if not percent:
+            return None
+        percent = min(float(percent), 100.0)
+        return self.elapsed_time * (100.0 - percent) / percent
+
     @property
     def completed(self) -> bool:
         """Check job status and return True if it is completed, use failed/succeeded to check if it was successful
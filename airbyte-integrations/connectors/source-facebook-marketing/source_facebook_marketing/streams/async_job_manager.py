@@ -2,9 +2,11 @@
 
 import logging
 import time
-from typing import TYPE_CHECKING, Iterator, List, Optional
+from datetime import timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Mapping, Optional
 
 from .async_job import AsyncJob, update_in_batch  # ParentAsyncJob not needed here
+from .common import parse_insights_throttle
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -34,11 +36,16 @@ class APILimit:
         """
         Ping the account to refresh the `x-fb-ads-insights-throttle` header and cache the value.
         NOTE: This is inexpensive (empty insights call) and safe to perform before scheduling.
+        The value is read from the response of the ping: the api is shared by the accounts read concurrently,
+        its last throttle may belong to another account.
         """
-        self._api.get_account(account_id=self._account_id).get_insights()
-        t = self._api.api.ads_insights_throttle
+        cursor = self._api.get_account(account_id=self._account_id).get_insights()
+        throttle = parse_insights_throttle(cursor.headers())
+        if throttle is None:
+            # no header on the ping, keep the last known value of the account
+            return
         # Use the stricter of the two numbers.
-        self._current_throttle = max(getattr(t, "per_account", 0.0), getattr(t, "per_application", 0.0))
+        self._current_throttle = max(throttle)
 
     @property
     def limit_reached(self) -> bool:
@@ -80,6 +87,62 @@ class APILimit:
         return self._current_throttle
 
 
+class JobPollScheduler:
+    """
+    Picks the wait before the next batch status poll from the progress of the running jobs:
+      - a job reporting progress is expected to complete in `elapsed * (100 - percent) / percent`
+      - a job with no progress yet is polled again after a fraction of its elapsed time (backoff)
+    The earliest expected completion wins, the wait is kept within [min_interval, max_interval]
+    and stretched to max_interval while the APILimit throttle is reached.
+    It also collects the latency (start -> completion) of the consumed jobs into a histogram.
+    """
+
+    LATENCY_BUCKETS_SECONDS = (5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+    def __init__(self, api_limit: APILimit, *, min_interval: float, max_interval: float, backoff_factor: float = 0.5):
+        self._api_limit = api_limit
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self._latency_buckets: Dict[str, int] = {self._bucket_name(bound): 0 for bound in self.LATENCY_BUCKETS_SECONDS}
+        self._latency_buckets[self._bucket_name(None)] = 0
+
+    @staticmethod
+    def _bucket_name(bound: Optional[int]) -> str:
+        return f"<={bound}s" if bound is not None else f">{JobPollScheduler.LATENCY_BUCKETS_SECONDS[-1]}s"
+
+    def _job_interval(self, job: AsyncJob) -> Optional[float]:
+        time_left = job.estimated_time_left
+        if isinstance(time_left, timedelta):
+            return time_left.total_seconds()
+        elapsed = job.elapsed_time
+        if isinstance(elapsed, timedelta):
+            return elapsed.total_seconds() * self.backoff_factor
+        return None
+
+    def next_interval(self, jobs: Iterable[AsyncJob]) -> float:
+        """Seconds to wait before the next status poll of the given running jobs."""
+        if self._api_limit.current_throttle >= self._api_limit.throttle_limit:
+            return self.max_interval
+        intervals = [i for i in (self._job_interval(job) for job in jobs if job.started) if i is not None]
+        if not intervals:
+            return self.max_interval
+        return min(max(min(intervals), self.min_interval), self.max_interval)
+
+    def observe(self, job: AsyncJob) -> None:
+        """Record the latency of the completed job."""
+        elapsed = job.elapsed_time
+        if not isinstance(elapsed, timedelta):
+            return
+        seconds = elapsed.total_seconds()
+        bound = next((b for b in self.LATENCY_BUCKETS_SECONDS if seconds <= b), None)
+        self._latency_buckets[self._bucket_name(bound)] += 1
+
+    @property
+    def latency_histogram(self) -> Mapping[str, int]:
+        return dict(self._latency_buckets)
+
+
 class InsightAsyncJobManager:
     """
     Minimal, state-agnostic manager:
@@ -90,6 +153,7 @@ class InsightAsyncJobManager:
     """
 
     JOB_STATUS_UPDATE_SLEEP_SECONDS = 30
+    JOB_STATUS_UPDATE_MIN_SLEEP_SECONDS = 2
 
     def __init__(
         self, api: "API", jobs: Iterator[AsyncJob], account_id: str, *, throttle_limit: float = 90.0, max_jobs_in_queue: int = 100
@@ -100,6 +164,11 @@ class InsightAsyncJobManager:
         self._running_jobs: List[AsyncJob] = []
         self._prefetched_job: Optional[AsyncJob] = None  # look-ahead buffer
         self._api_limit = APILimit(self._api, self._account_id, throttle_limit=throttle_limit, max_jobs=max_jobs_in_queue)
+        self._poll_scheduler = JobPollScheduler(
+            self._api_limit,
+            min_interval=self.JOB_STATUS_UPDATE_MIN_SLEEP_SECONDS,
+            max_interval=self.JOB_STATUS_UPDATE_SLEEP_SECONDS,
+        )
 
     # --- Public consumption API ---
 
@@ -109,10 +178,20 @@ class InsightAsyncJobManager:
 
             completed = self._check_jobs_status()
             if completed:
-                yield from completed
+                for job in completed:
+                    self._poll_scheduler.observe(job)
+                    yield job
             else:
-                logger.info(f"No jobs ready to be consumed, wait for {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
-                time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+                interval = self._poll_scheduler.next_interval(self._running_jobs)
+                logger.info(f"No jobs ready to be consumed, wait for {interval:.1f} seconds")
+                time.sleep(interval)
+
+        logger.info("Jobs latency histogram: %s", self.latency_histogram)
+
+    @property
+    def latency_histogram(self) -> Mapping[str, int]:
+        """Number of the consumed jobs per latency (start -> completion) bucket."""
+        return self._poll_scheduler.latency_histogram
 
     # --- Internals ---
 
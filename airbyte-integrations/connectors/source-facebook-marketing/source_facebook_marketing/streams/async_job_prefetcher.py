@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import Any, Iterator
+
+from .async_job import AsyncJob
+from .common import QueueEnd, QueueFailure, get_or_raise, put_until_stopped
+
+
+logger = logging.getLogger("airbyte")
+
+
+class PrefetchedJobResult:
+    """
+    Result rows of one completed job. A worker pages through `job.get_result()` into a bounded queue,
+    the consumer iterates the rows in the original order; an error raised while paging is re-raised on iteration.
+    """
+
+    def __init__(self, job: AsyncJob, max_rows: int):
+        self.job = job
+        self._rows: Queue = Queue(maxsize=max_rows)
+
+    def fetch(self, stop: threading.Event) -> None:
+        """Runs in a worker thread."""
+        try:
+            for row in self.job.get_result():
+                if not put_until_stopped(self._rows, row, stop):
+                    return
+        except Exception as exc:
+            put_until_stopped(self._rows, QueueFailure(exc), stop)
+            return
+        put_until_stopped(self._rows, QueueEnd(), stop)
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            row = get_or_raise(self._rows)
+            if isinstance(row, QueueEnd):
+                return
+            yield row
+
+
+class InsightAsyncJobResultPrefetcher:
+    """
+    Overlaps the download of completed job results with the job polling:
+      - a producer thread drives the manager (start/poll jobs) and hands every completed job to the worker pool
+      - up to `workers` results are paged concurrently, each into a bounded rows queue (`max_rows`)
+      - results are emitted in the completion order, so the consumer (and the state checkpoints) see the same
+        order of slices as with the synchronous read; at most `workers * 2` completed jobs are queued ahead.
+    The results are fetched in the order they are emitted, so the oldest unconsumed result always has a worker.
+    """
+
+    def __init__(self, completed_jobs: Iterator[AsyncJob], *, workers: int, max_rows: int = 1000):
+        self._completed_jobs = completed_jobs
+        self._workers = workers
+        self._max_rows = max_rows
+
+    def _produce(self, results: Queue, executor: ThreadPoolExecutor, stop: threading.Event) -> None:
+        try:
+            for job in self._completed_jobs:
+                result = PrefetchedJobResult(job, max_rows=self._max_rows)
+                executor.submit(result.fetch, stop)
+                if not put_until_stopped(results, result, stop):
+                    return
+        except Exception as exc:
+            put_until_stopped(results, QueueFailure(exc), stop)
+            return
+        put_until_stopped(results, QueueEnd(), stop)
+
+    def results(self) -> Iterator[PrefetchedJobResult]:
+        stop = threading.Event()
+        results: Queue = Queue(maxsize=self._workers * 2)
+        executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="insights-result")
+        producer = threading.Thread(target=self._produce, args=(results, executor, stop), name="insights-jobs", daemon=True)
+        producer.start()
+        logger.info(f"Fetching the results of completed jobs with {self._workers} worker(s)")
+        try:
+            while True:
+                result = get_or_raise(results)
+                if isinstance(result, QueueEnd):
+                    break
+                yield result
+        except BaseException:
+            # the consumer is gone or failed: release the blocked threads and drop the results not fetched yet
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        # the results already emitted are still being read, let the workers finish them
+        executor.shutdown(wait=False)
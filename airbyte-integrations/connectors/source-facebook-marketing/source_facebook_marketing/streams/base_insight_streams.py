@@ -4,7 +4,7 @@
 
 import logging
 from datetime import date, timedelta
-from functools import cache, cached_property
+from functools import cache, cached_property, partial
 from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
 
 from facebook_business.exceptions import FacebookBadObjectError, FacebookRequestError
@@ -17,7 +17,8 @@ from airbyte_cdk.utils import AirbyteTracedException
 from airbyte_cdk.utils.datetime_helpers import AirbyteDateTime, ab_datetime_now, ab_datetime_parse
 from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob
 from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager
-from source_facebook_marketing.streams.common import traced_exception
+from source_facebook_marketing.streams.async_job_prefetcher import InsightAsyncJobResultPrefetcher
+from source_facebook_marketing.streams.common import merge_concurrently, traced_exception
 from source_facebook_marketing.utils import DateInterval
 
 from .base_streams import FBMarketingIncrementalStream
@@ -78,6 +79,7 @@ class AdsInsights(FBMarketingIncrementalStream):
         time_increment: Optional[int] = None,
         insights_lookback_window: int = None,
         insights_job_timeout: int = 60,
+        insights_result_workers: Optional[int] = None,
         level: str = "ad",
         **kwargs,
     ):
@@ -97,6 +99,7 @@ class AdsInsights(FBMarketingIncrementalStream):
         self._new_class_name = name
         self._insights_lookback_window = insights_lookback_window
         self._insights_job_timeout = insights_job_timeout
+        self._insights_result_workers = insights_result_workers
         self.level = level
         self.entity_prefix = level
 
@@ -162,9 +165,11 @@ class AdsInsights(FBMarketingIncrementalStream):
         """Waits for current job to finish (slice) and yield its result"""
         job = stream_slice["insight_job"]
         account_id = stream_slice["account_id"]
+        # the result is being fetched in background, when `insights_result_workers` is set
+        job_result = stream_slice.get("insight_job_result")
 
         try:
-            for obj in job.get_result():
+            for obj in job_result if job_result is not None else job.get_result():
                 data = obj.export_all_data()
                 if self._response_data_is_valid(data):
                     self._add_account_id(data, account_id)
@@ -317,18 +322,36 @@ class AdsInsights(FBMarketingIncrementalStream):
         if stream_state:
             self.state = stream_state
 
+        if self.account_parallel:
+            # the jobs are generated upfront: generating them resets the cursors, which are advanced while the slices are read
+            jobs = {
+                account_id: list(self._generate_async_jobs(params=self.request_params(), account_id=account_id))
+                for account_id in self._account_ids
+            }
+            readers = [partial(self._account_slices, account_id, iter(account_jobs)) for account_id, account_jobs in jobs.items()]
+            try:
+                yield from merge_concurrently(readers, self.max_concurrent_accounts, queue_size=self.max_concurrent_accounts)
+            except FacebookRequestError as exc:
+                raise traced_exception(exc)
+            return
+
         for account_id in self._account_ids:
             try:
-                manager = InsightAsyncJobManager(
-                    api=self._api,
-                    jobs=self._generate_async_jobs(params=self.request_params(), account_id=account_id),
-                    account_id=account_id,
-                )
-                for job in manager.completed_jobs():
-                    yield {"insight_job": job, "account_id": account_id}
+                yield from self._account_slices(account_id, self._generate_async_jobs(params=self.request_params(), account_id=account_id))
             except FacebookRequestError as exc:
                 raise traced_exception(exc)
 
+    def _account_slices(self, account_id: str, jobs: Iterator[AsyncJob]) -> Iterable[Mapping[str, Any]]:
+        """Run the jobs of the account with its own job manager, yield a slice per completed job"""
+        manager = InsightAsyncJobManager(api=self._api, jobs=jobs, account_id=account_id)
+        if self._insights_result_workers:
+            prefetcher = InsightAsyncJobResultPrefetcher(manager.completed_jobs(), workers=self._insights_result_workers)
+            for result in prefetcher.results():
+                yield {"insight_job": result.job, "insight_job_result": result, "account_id": account_id}
+        else:
+            for job in manager.completed_jobs():
+                yield {"insight_job": job, "account_id": account_id}
+
     def _get_start_date(self) -> Mapping[str, date]:
         """Get start date to begin sync with. It is not that trivial as it might seem.
         There are few rules:
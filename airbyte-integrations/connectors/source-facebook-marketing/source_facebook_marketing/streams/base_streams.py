@@ -5,7 +5,7 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from functools import cache
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping, Optional
 
 from facebook_business.adobjects.abstractobject import AbstractObject
@@ -18,7 +18,7 @@ from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from airbyte_cdk.utils.datetime_helpers import AirbyteDateTime, ab_datetime_parse
 from source_facebook_marketing.streams.common import traced_exception
 
-from .common import deep_merge
+from .common import AccountPrefetcher, deep_merge
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -51,12 +51,15 @@ class FBMarketingStream(Stream, ABC):
         account_ids: List[str],
         filter_statuses: list = [],
         page_size: int = 100,
+        max_concurrent_accounts: Optional[int] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self._api = api
         self._account_ids = account_ids
         self.page_size = page_size if page_size is not None else 100
+        self.max_concurrent_accounts = max_concurrent_accounts or 1
+        self._prefetcher: Optional[AccountPrefetcher] = None
         self._filter_statuses = filter_statuses
         self._fields = None
         self._saved_fields = None
@@ -189,10 +192,7 @@ class FBMarketingStream(Stream, ABC):
         account_state = stream_slice.get("stream_state", {})
 
         try:
-            for record in self.list_objects(
-                params=self.request_params(stream_state=account_state),
-                account_id=account_id,
-            ):
+            for record in self._account_objects(account_id, account_state):
                 if isinstance(record, AbstractObject):
                     record = record.export_all_data()  # convert FB object to dict
                 self.fix_date_time(record)
@@ -206,9 +206,42 @@ class FBMarketingStream(Stream, ABC):
             stream_state = self._transform_state_from_one_account_format(stream_state, ["include_deleted"])
             stream_state = self._transform_state_from_old_deleted_format(stream_state)
 
-        for account_id in self._account_ids:
-            account_state = self.get_account_state(account_id, stream_state)
-            yield {"account_id": account_id, "stream_state": account_state}
+        account_slices = [
+            {"account_id": account_id, "stream_state": self.get_account_state(account_id, stream_state)} for account_id in self._account_ids
+        ]
+        if not self.account_parallel:
+            yield from account_slices
+            return
+
+        # the objects of the upcoming accounts are listed ahead, while the sync reads the current account
+        self._prefetcher = AccountPrefetcher(
+            readers=[
+                (
+                    account_slice["account_id"],
+                    partial(self._list_account_objects, account_slice["account_id"], account_slice["stream_state"]),
+                )
+                for account_slice in account_slices
+            ],
+            concurrency=self.max_concurrent_accounts,
+        )
+        try:
+            yield from account_slices
+        finally:
+            self._prefetcher.close()
+            self._prefetcher = None
+
+    @property
+    def account_parallel(self) -> bool:
+        """Account-parallel mode: more than one account and `max_concurrent_accounts` allows reading them at the same time"""
+        return self.max_concurrent_accounts > 1 and len(self._account_ids) > 1
+
+    def _list_account_objects(self, account_id: str, account_state: Optional[Mapping[str, Any]]) -> Iterable:
+        return self.list_objects(params=self.request_params(stream_state=account_state), account_id=account_id)
+
+    def _account_objects(self, account_id: str, account_state: Optional[Mapping[str, Any]]) -> Iterable:
+        """The objects of the account, listed ahead by a worker in account-parallel mode (see `stream_slices`)"""
+        objects = self._prefetcher.objects(account_id) if self._prefetcher else None
+        return self._list_account_objects(account_id, account_state) if objects is None else objects
 
     @abstractmethod
     def list_objects(self, params: Mapping[str, Any]) -> Iterable:
@@ -391,10 +424,7 @@ class FBMarketingReversedIncrementalStream(FBMarketingIncrementalStream, ABC):
         account_state = stream_slice.get("stream_state")
 
         try:
-            records_iter = self.list_objects(
-                params=self.request_params(stream_state=account_state),
-                account_id=account_id,
-            )
+            records_iter = self._account_objects(account_id, account_state)
             account_cursor = self._cursor_values.get(account_id)
 
             max_cursor_value = None
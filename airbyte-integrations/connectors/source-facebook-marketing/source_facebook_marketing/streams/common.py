@@ -3,11 +3,16 @@
 #
 
 import http.client
+import json
 import logging
 import re
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any
+from queue import Full, Queue
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 import backoff
 from facebook_business.exceptions import FacebookRequestError
@@ -148,6 +153,154 @@ def deep_merge(a: Any, b: Any) -> Any:
         return a if b is None else b
 
 
+def parse_insights_throttle(headers: Any) -> Optional[Tuple[float, float]]:
+    """(per_application, per_account) utilization from the x-fb-ads-insights-throttle header of an /insights response"""
+    ads_insights_throttle = headers.get("x-fb-ads-insights-throttle") if isinstance(headers, Mapping) else None
+    if not ads_insights_throttle:
+        return None
+    ads_insights_throttle = json.loads(ads_insights_throttle)
+    return ads_insights_throttle.get("app_id_util_pct", 0), ads_insights_throttle.get("acc_id_util_pct", 0)
+
+
+# how long a thread blocked on a full queue waits before re-checking if the consumer has gone away
+QUEUE_PUT_TIMEOUT_SECONDS = 0.5
+
+
+class QueueEnd:
+    """Marks the end of the items put into a queue by a background thread."""
+
+
+class QueueFailure:
+    """Carries an exception raised in a background thread to the consumer of its queue."""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def put_until_stopped(queue: Queue, item: Any, stop: threading.Event) -> bool:
+    """Blocking put that gives up once `stop` is set, returns True if the item was queued."""
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=QUEUE_PUT_TIMEOUT_SECONDS)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def get_or_raise(queue: Queue) -> Any:
+    """Blocking get that re-raises the exception carried by a QueueFailure."""
+    item = queue.get()
+    if isinstance(item, QueueFailure):
+        raise item.exception
+    return item
+
+
+def merge_concurrently(readers: List[Callable[[], Iterable[Any]]], concurrency: int, queue_size: int = 1000) -> Iterator[Any]:
+    """
+    Run up to `concurrency` readers at the same time and yield their items as they come.
+    The items of every reader keep their order, the items of different readers are interleaved.
+    The first exception raised by a reader is re-raised to the consumer, the other readers are stopped then.
+    """
+    stop = threading.Event()
+    items: Queue = Queue(maxsize=queue_size)
+
+    def read(reader: Callable[[], Iterable[Any]]) -> None:
+        iterator = None
+        try:
+            iterator = iter(reader())
+            for item in iterator:
+                if not put_until_stopped(items, item, stop):
+                    return
+        except Exception as exc:
+            put_until_stopped(items, QueueFailure(exc), stop)
+            return
+        finally:
+            # release the resources of a reader left in the middle, e.g. its own background threads
+            if hasattr(iterator, "close"):
+                iterator.close()
+        put_until_stopped(items, QueueEnd(), stop)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="accounts")
+    try:
+        for reader in readers:
+            executor.submit(read, reader)
+        finished = 0
+        while finished < len(readers):
+            item = get_or_raise(items)
+            if isinstance(item, QueueEnd):
+                finished += 1
+                continue
+            yield item
+    finally:
+        # the consumer is done, failed or gone: release the blocked readers and drop the ones not started yet
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AccountPrefetcher:
+    """
+    Reads the objects of the upcoming accounts in worker threads, while the sync consumes the current account.
+
+    The accounts are submitted in the order of the slices, up to `concurrency` of them are read at the same time,
+    and each one buffers at most `queue_size` objects. Only the listing is done ahead: the objects are handed over
+    to the thread of the sync, which keeps transforming the records and updating the state of each account
+    after they are yielded, as in the sequential read.
+    """
+
+    def __init__(self, readers: List[Tuple[str, Callable[[], Iterable[Any]]]], concurrency: int, queue_size: int = 1000):
+        self._pending: "OrderedDict[str, Tuple[Queue, threading.Event]]" = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="accounts")
+        for account_id, reader in readers:
+            items, cancelled = Queue(maxsize=queue_size), threading.Event()
+            self._pending[account_id] = (items, cancelled)
+            self._executor.submit(self._read, reader, items, cancelled)
+
+    def close(self) -> None:
+        # the sync is done, failed or gone: release the blocked workers and drop the accounts not started yet
+        for _, cancelled in self._pending.values():
+            cancelled.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def objects(self, account_id: str) -> Optional[Iterator[Any]]:
+        """
+        The objects of the account, None if it isn't read ahead.
+        The accounts before it are not going to be asked for anymore, their workers are released.
+        """
+        if account_id not in self._pending:
+            return None
+        while True:
+            pending_account_id, (items, cancelled) = self._pending.popitem(last=False)
+            if pending_account_id == account_id:
+                return self._drain(items, cancelled)
+            cancelled.set()
+
+    @staticmethod
+    def _drain(items: Queue, cancelled: threading.Event) -> Iterator[Any]:
+        try:
+            while True:
+                item = get_or_raise(items)
+                if isinstance(item, QueueEnd):
+                    return
+                yield item
+        finally:
+            # the sync may stop reading an account early, e.g. the reversed incremental streams
+            cancelled.set()
+
+    @staticmethod
+    def _read(reader: Callable[[], Iterable[Any]], items: Queue, cancelled: threading.Event) -> None:
+        if cancelled.is_set():
+            return
+        try:
+            for item in reader():
+                if not put_until_stopped(items, item, cancelled):
+                    return
+        except Exception as exc:
+            put_until_stopped(items, QueueFailure(exc), cancelled)
+            return
+        put_until_stopped(items, QueueEnd(), cancelled)
+
+
 FACEBOOK_CONFIG_ERRORS_TO_CATCH = [  # list of tuples (code, error_subcode)
     (100, 2446289),
 ]
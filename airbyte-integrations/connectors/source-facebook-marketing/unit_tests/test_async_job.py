@@ -338,6 +338,19 @@ class TestInsightAsyncJob:
 
         assert elapsed_2 == elapsed_1, "should not change after job completed"
 
+    def test_estimated_time_left(self, started_job, adreport, mocker):
+        mocker.patch.object(InsightAsyncJob, "elapsed_time", new_callable=mocker.PropertyMock, return_value=timedelta(seconds=30))
+        assert started_job.estimated_time_left is None, "should be None until the job reports progress"
+
+        adreport["async_percent_completion"] = 75
+        assert started_job.estimated_time_left == timedelta(seconds=10)
+
+    def test_estimated_time_left_not_started(self, job):
+        assert job.estimated_time_left is None
+
+    def test_estimated_time_left_completed(self, completed_job):
+        assert completed_job.estimated_time_left is None
+
     def test_completed_without_start(self, job, api, adreport):
         assert not job.completed
         assert not job.failed
@@ -707,5 +720,19 @@ class TestParentAsyncJob:
         assert merged["metric"] == 1
         assert merged["metric2"] == 2
 
+    def test_elapsed_and_estimated_time_left(self, parent_job, grouped_jobs):
+        for job in grouped_jobs:
+            job.estimated_time_left = None
+        assert parent_job.elapsed_time is None
+        assert parent_job.estimated_time_left is None
+
+        grouped_jobs[0].elapsed_time = timedelta(seconds=40)
+        grouped_jobs[0].estimated_time_left = timedelta(seconds=20)
+        grouped_jobs[1].elapsed_time = timedelta(seconds=10)
+        grouped_jobs[1].estimated_time_left = timedelta(seconds=5)
+
+        assert parent_job.elapsed_time == timedelta(seconds=40), "should be the longest running child"
+        assert parent_job.estimated_time_left == timedelta(seconds=5), "should be the earliest child completion"
+
     def test_str(self, parent_job, grouped_jobs):
         assert str(parent_job) == f"ParentAsyncJob({grouped_jobs[0]} ... {len(grouped_jobs) - 1} jobs more)"
@@ -2,11 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+from datetime import timedelta
+
 import pytest
 from facebook_business.api import FacebookAdsApiBatch
 from source_facebook_marketing.api import MyFacebookAdsApi
 from source_facebook_marketing.streams.async_job import InsightAsyncJob, ParentAsyncJob
-from source_facebook_marketing.streams.async_job_manager import APILimit, InsightAsyncJobManager
+from source_facebook_marketing.streams.async_job_manager import APILimit, InsightAsyncJobManager, JobPollScheduler
 
 
 @pytest.fixture(name="api")
@@ -17,6 +20,12 @@ def api_fixture(mocker):
     return api
 
 
+def set_ping_throttle(account, per_application: float, per_account: float):
+    """The x-fb-ads-insights-throttle header of the insights ping of the account"""
+    header = json.dumps({"app_id_util_pct": per_application, "acc_id_util_pct": per_account})
+    account.get_insights.return_value.headers.return_value = {"x-fb-ads-insights-throttle": header}
+
+
 @pytest.fixture(name="time_mock")
 def time_mock_fixture(mocker):
     return mocker.patch("source_facebook_marketing.streams.async_job_manager.time")
@@ -85,6 +94,34 @@ class TestInsightAsyncManager:
         # No more jobs
         assert next(manager.completed_jobs(), None) is None
 
+    def test_jobs_wait_adaptive_interval(self, api, mocker, time_mock, update_job_mock, some_config):
+        """
+        Manager should poll again as soon as the near-done job is expected to complete,
+        and record the latency of the consumed jobs.
+        """
+        job = mocker.Mock(
+            spec=InsightAsyncJob,
+            started=True,
+            completed=False,
+            new_jobs=[],
+            elapsed_time=timedelta(seconds=9),
+            estimated_time_left=timedelta(seconds=3),
+        )
+
+        def side_effect():
+            # 1st poll: still running -> manager waits for the estimated time left
+            yield
+            # 2nd poll: completed
+            job.completed = True
+            yield
+
+        update_job_mock.side_effect = side_effect()
+        manager = InsightAsyncJobManager(api=api, jobs=[job], account_id=some_config["account_ids"][0])
+
+        assert list(manager.completed_jobs()) == [job]
+        time_mock.sleep.assert_called_once_with(3)
+        assert manager.latency_histogram["<=10s"] == 1
+
     def test_new_jobs_are_adopted(self, api, mocker, time_mock, update_job_mock, some_config):
         """
         If a running job emits .new_jobs, the manager should replace it
@@ -163,7 +200,7 @@ class TestInsightAsyncManager:
         manager._api_limit._current_throttle = 95.0  # > default throttle_limit=90
 
         # Backend actually reports low throttle on refresh
-        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(0.0, 0.0)
+        set_ping_throttle(api.get_account.return_value, 0.0, 0.0)
 
         # No-op polling
         update_job_mock.side_effect = lambda *args, **kwargs: None
@@ -307,8 +344,8 @@ class TestInsightAsyncManager:
 class TestAPILimit:
     def test_refresh_throttle_uses_max_and_pings_account(self, mocker, api):
         # Arrange: per_account=42, per_application=77 -> expect 77
-        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(42.0, 77.0)
         acct = mocker.Mock()
+        set_ping_throttle(acct, per_application=77.0, per_account=42.0)
         api.get_account.return_value = acct
 
         limit = APILimit(api=api, account_id="act_123")
@@ -319,10 +356,27 @@ class TestAPILimit:
         acct.get_insights.assert_called_once()  # the "ping"
         assert limit.current_throttle == 77.0
 
+    def test_refresh_throttle_ignores_the_throttle_of_another_account(self, mocker, api):
+        # the shared api holds the throttle of the last /insights response, here of another account
+        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(99.0, 99.0)
+        acct = mocker.Mock()
+        set_ping_throttle(acct, per_application=10.0, per_account=20.0)
+        api.get_account.return_value = acct
+
+        limit = APILimit(api=api, account_id="act_123")
+
+        limit.refresh_throttle()
+        assert limit.current_throttle == 20.0
+
+        # no header on the ping: the last value of the account is kept
+        acct.get_insights.return_value.headers.return_value = {}
+        limit.refresh_throttle()
+        assert limit.current_throttle == 20.0
+
     def test_try_consume_success_and_release_accounting(self, mocker, api):
         # Arrange: very low throttle so we never block on throttle
-        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(0.0, 0.0)
         api.get_account.return_value = mocker.Mock()
+        set_ping_throttle(api.get_account.return_value, 0.0, 0.0)
 
         limit = APILimit(api=api, account_id="act_1", throttle_limit=90.0, max_jobs=2)
 
@@ -350,8 +404,8 @@ class TestAPILimit:
 
     def test_try_consume_blocks_on_throttle(self, mocker, api):
         # Arrange: throttle too high -> block
-        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(95.0, 10.0)  # max()=95 >= limit
         api.get_account.return_value = mocker.Mock()
+        set_ping_throttle(api.get_account.return_value, 95.0, 10.0)  # max()=95 >= limit
 
         limit = APILimit(api=api, account_id="act_2", throttle_limit=90.0, max_jobs=10)
 
@@ -360,7 +414,7 @@ class TestAPILimit:
         assert limit.inflight == 0
 
         # Lower throttle -> allow
-        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(10.0, 5.0)
+        set_ping_throttle(api.get_account.return_value, 10.0, 5.0)
         assert limit.try_consume() is True
         assert limit.inflight == 1
 
@@ -398,3 +452,48 @@ class TestAPILimit:
 
         # No throttle refresh should have been attempted
         api.get_account.assert_not_called()
+
+
+class TestJobPollScheduler:
+    @pytest.fixture(name="scheduler")
+    def scheduler_fixture(self, api):
+        return JobPollScheduler(APILimit(api=api, account_id="act_1"), min_interval=2, max_interval=30)
+
+    @staticmethod
+    def _job(mocker, started=True, elapsed=None, time_left=None):
+        return mocker.Mock(spec=InsightAsyncJob, started=started, elapsed_time=elapsed, estimated_time_left=time_left)
+
+    def test_earliest_expected_completion_wins(self, mocker, scheduler):
+        jobs = [
+            self._job(mocker, elapsed=timedelta(seconds=100), time_left=timedelta(seconds=20)),
+            self._job(mocker, elapsed=timedelta(seconds=10), time_left=timedelta(seconds=5)),
+        ]
+        assert scheduler.next_interval(jobs) == 5
+
+    def test_interval_is_clamped(self, mocker, scheduler):
+        assert scheduler.next_interval([self._job(mocker, elapsed=timedelta(seconds=5), time_left=timedelta(seconds=0))]) == 2
+        assert scheduler.next_interval([self._job(mocker, elapsed=timedelta(minutes=5), time_left=timedelta(minutes=10))]) == 30
+
+    def test_backoff_without_progress(self, mocker, scheduler):
+        assert scheduler.next_interval([self._job(mocker, elapsed=timedelta(seconds=3))]) == 2
+        assert scheduler.next_interval([self._job(mocker, elapsed=timedelta(seconds=20))]) == 10
+        assert scheduler.next_interval([self._job(mocker, elapsed=timedelta(minutes=10))]) == 30
+
+    def test_not_started_or_unknown_jobs_wait_max_interval(self, mocker, scheduler):
+        assert scheduler.next_interval([]) == 30
+        assert scheduler.next_interval([self._job(mocker, started=False, time_left=timedelta(seconds=3))]) == 30
+
+    def test_throttle_reached_waits_max_interval(self, mocker, scheduler):
+        scheduler._api_limit._current_throttle = 95.0
+        assert scheduler.next_interval([self._job(mocker, elapsed=timedelta(seconds=5), time_left=timedelta(seconds=3))]) == 30
+
+    def test_latency_histogram(self, mocker, scheduler):
+        for seconds in (3, 4, 45, 7200):
+            scheduler.observe(self._job(mocker, elapsed=timedelta(seconds=seconds)))
+        scheduler.observe(self._job(mocker))
+
+        histogram = scheduler.latency_histogram
+        assert histogram["<=5s"] == 2
+        assert histogram["<=60s"] == 1
+        assert histogram[">3600s"] == 1
+        assert sum(histogram.values()) == 4
@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+
+import pytest
+from facebook_business.exceptions import FacebookRequestError
+from source_facebook_marketing.streams.async_job import InsightAsyncJob
+from source_facebook_marketing.streams.async_job_prefetcher import InsightAsyncJobResultPrefetcher, PrefetchedJobResult
+
+
+def _job(mocker, rows):
+    job = mocker.Mock(spec=InsightAsyncJob)
+    job.get_result.return_value = iter(rows)
+    return job
+
+
+def _failing_rows(rows, exc):
+    yield from rows
+    raise exc
+
+
+class TestPrefetchedJobResult:
+    def test_rows_in_order(self, mocker):
+        result = PrefetchedJobResult(_job(mocker, range(10)), max_rows=3)
+        worker = threading.Thread(target=result.fetch, args=(threading.Event(),))
+        worker.start()
+
+        assert list(result) == list(range(10))
+        worker.join(timeout=5)
+
+    def test_error_is_raised_on_iteration(self, mocker):
+        result = PrefetchedJobResult(_job(mocker, _failing_rows([1, 2], ValueError("broken page"))), max_rows=10)
+        result.fetch(threading.Event())
+
+        rows = iter(result)
+        assert [next(rows), next(rows)] == [1, 2]
+        with pytest.raises(ValueError, match="broken page"):
+            next(rows)
+
+    def test_fetch_gives_up_when_stopped(self, mocker):
+        stop = threading.Event()
+        result = PrefetchedJobResult(_job(mocker, range(10)), max_rows=1)
+        worker = threading.Thread(target=result.fetch, args=(stop,))
+        worker.start()
+
+        stop.set()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+
+class TestInsightAsyncJobResultPrefetcher:
+    def test_results_in_completion_order(self, mocker):
+        jobs = [_job(mocker, [f"{i}-{row}" for row in range(50)]) for i in range(6)]
+        prefetcher = InsightAsyncJobResultPrefetcher(iter(jobs), workers=2, max_rows=5)
+
+        results = list((result.job, list(result)) for result in prefetcher.results())
+
+        assert [job for job, _ in results] == jobs
+        for i, (_, rows) in enumerate(results):
+            assert rows == [f"{i}-{row}" for row in range(50)]
+
+    def test_completed_jobs_error_is_raised(self, mocker):
+        def completed_jobs():
+            yield _job(mocker, [1])
+            raise FacebookRequestError("Call was not successful", {}, 400, [], "")
+
+        results = InsightAsyncJobResultPrefetcher(completed_jobs(), workers=1).results()
+
+        assert list(next(results)) == [1]
+        with pytest.raises(FacebookRequestError):
+            next(results)
+
+    def test_consumer_gone(self, mocker):
+        jobs = [_job(mocker, range(100)) for _ in range(10)]
+        results = InsightAsyncJobResultPrefetcher(iter(jobs), workers=2, max_rows=1).results()
+
+        assert list(next(results))[:3] == [0, 1, 2]
+        # closing the generator releases the producer and the workers, blocked on the bounded queues
+        results.close()
@@ -335,6 +335,63 @@ class TestBaseInsightsStream:
         assert generated_jobs[0].interval.start == start_date.date()
         assert generated_jobs[1].interval.start == start_date.date() + timedelta(days=1)
 
+    def test_stream_slices_with_result_workers(self, mocker, api, async_manager_mock, start_date, some_config):
+        """Stream will fetch the results of completed jobs in background, keeping the completion order of the slices"""
+        stream = AdsInsights(
+            api=api,
+            account_ids=some_config["account_ids"],
+            start_date=start_date,
+            end_date=start_date + timedelta(weeks=2),
+            insights_lookback_window=28,
+            insights_result_workers=2,
+        )
+        rec = mocker.Mock()
+        rec.export_all_data.return_value = {}
+        jobs = [mocker.Mock(spec=InsightAsyncJob, interval=DateInterval(date(2010, 1, i), date(2010, 1, i))) for i in range(1, 4)]
+        for job in jobs:
+            job.get_result.return_value = [rec, rec]
+        async_manager_mock.completed_jobs.return_value = jobs
+
+        slices = list(stream.stream_slices(stream_state=None, sync_mode=SyncMode.incremental))
+
+        assert [stream_slice["insight_job"] for stream_slice in slices] == jobs
+        for stream_slice in slices:
+            assert len(list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice))) == 2
+            stream_slice["insight_job"].get_result.assert_called_once()
+
+    def test_stream_slices_account_parallel(self, mocker, api, start_date):
+        """Stream will run the job managers of the accounts side by side and merge their slices"""
+        account_ids = ["123", "456", "789"]
+        end_date = start_date + timedelta(weeks=2)
+        stream = AdsInsights(
+            api=api,
+            account_ids=account_ids,
+            start_date=start_date,
+            end_date=end_date,
+            insights_lookback_window=28,
+            max_concurrent_accounts=2,
+        )
+        managers = {}
+
+        def manager_side_effect(api, jobs, account_id):
+            managers[account_id] = mocker.Mock(jobs=list(jobs))
+            managers[account_id].completed_jobs.return_value = [f"{account_id}-{i}" for i in range(3)]
+            return managers[account_id]
+
+        mocker.patch(
+            "source_facebook_marketing.streams.base_insight_streams.InsightAsyncJobManager",
+            side_effect=manager_side_effect,
+        )
+
+        slices = list(stream.stream_slices(stream_state=None, sync_mode=SyncMode.incremental))
+
+        assert sorted(managers) == account_ids
+        for account_id in account_ids:
+            assert len(managers[account_id].jobs) == (end_date - start_date).days + 1
+            # the slices of every account keep the completion order and the account of the job
+            assert [s["insight_job"] for s in slices if s["account_id"] == account_id] == [f"{account_id}-{i}" for i in range(3)]
+        assert len(slices) == 9
+
     def test_stream_slices_no_state_close_to_now(self, api, async_manager_mock, recent_start_date, some_config):
         """Stream will use start_date when there is not state and start_date within 28d from now"""
         start_date = recent_start_date
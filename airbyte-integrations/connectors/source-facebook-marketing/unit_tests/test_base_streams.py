@@ -11,6 +11,9 @@ from facebook_business.api import FacebookAdsApi, FacebookAdsApiBatch
 from source_facebook_marketing.api import MyFacebookAdsApi
 from source_facebook_marketing.streams.base_streams import FBMarketingIncrementalStream, FBMarketingStream
 
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.utils.datetime_helpers import ab_datetime_parse
+
 
 @pytest.fixture(name="mock_batch_responses")
 def mock_batch_responses_fixture(requests_mock):
@@ -115,6 +118,68 @@ def incremental_class_instance(api):
     return ConcreteFBMarketingIncrementalStream(api=api, account_ids=["123", "456", "789"], start_date=None, end_date=None)
 
 
+class AccountRecordsIncrementalStream(ConcreteFBMarketingIncrementalStream):
+    def list_objects(self, params: Mapping[str, Any], account_id: str) -> Iterable:
+        for day in range(1, 21):
+            yield {"id": f"{account_id}-{day}", "date": f"2021-01-{day:02d}T00:00:00+00:00"}
+
+
+class TestFBMarketingStreamAccountParallel:
+    @pytest.fixture
+    def parallel_instance(self, api):
+        return AccountRecordsIncrementalStream(
+            api=api, account_ids=["123", "456", "789"], start_date=None, end_date=None, max_concurrent_accounts=2
+        )
+
+    def test_stream_slices_one_slice_per_account(self, parallel_instance):
+        stream_state = {"123": {"state_key": "state_value"}}
+        expected_slices = [
+            {"account_id": "123", "stream_state": {"state_key": "state_value"}},
+            {"account_id": "456", "stream_state": {}},
+            {"account_id": "789", "stream_state": {}},
+        ]
+        assert list(parallel_instance.stream_slices(stream_state)) == expected_slices
+        # the workers are released once the slices are done
+        assert parallel_instance._prefetcher is None
+
+    def test_stream_slices_single_account_is_not_parallel(self, parallel_instance):
+        parallel_instance._account_ids = ["123"]
+        assert not parallel_instance.account_parallel
+        assert list(parallel_instance.stream_slices()) == [{"account_id": "123", "stream_state": None}]
+
+    def test_read_records_lists_the_accounts_ahead_and_updates_the_state_per_account(self, mocker, parallel_instance):
+        list_objects = mocker.spy(parallel_instance, "list_objects")
+        states = []
+
+        for stream_slice in parallel_instance.stream_slices():
+            records = list(parallel_instance.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice))
+            account_id = stream_slice["account_id"]
+            assert [r["id"] for r in records] == [f"{account_id}-{day}" for day in range(1, 21)]
+            assert all(r["account_id"] == account_id for r in records)
+            states.append(set(parallel_instance.state) & {"123", "456", "789"})
+
+        # the state of an account is updated once its own slice is read, in the order of the slices
+        assert states == [{"123"}, {"123", "456"}, {"123", "456", "789"}]
+        for account_id in ["123", "456", "789"]:
+            assert ab_datetime_parse(parallel_instance.state[account_id]["date"]) == ab_datetime_parse("2021-01-20T00:00:00+00:00")
+        # every account is listed once, by the workers
+        assert sorted(call.kwargs["account_id"] for call in list_objects.call_args_list) == ["123", "456", "789"]
+
+    def test_read_records_raises_the_error_of_an_account_in_its_slice(self, mocker, parallel_instance):
+        def list_objects(params, account_id):
+            if account_id == "456":
+                raise ValueError("456 failed")
+            yield {"id": f"{account_id}-1", "date": "2021-01-01T00:00:00+00:00"}
+
+        mocker.patch.object(parallel_instance, "list_objects", side_effect=list_objects)
+        slices = parallel_instance.stream_slices()
+
+        assert len(list(parallel_instance.read_records(sync_mode=SyncMode.incremental, stream_slice=next(slices)))) == 1
+        with pytest.raises(ValueError, match="456 failed"):
+            list(parallel_instance.read_records(sync_mode=SyncMode.incremental, stream_slice=next(slices)))
+        slices.close()
+
+
 class TestFBMarketingIncrementalStreamSliceAndState:
     def test_stream_slices_multiple_accounts_with_state(self, incremental_class_instance):
         stream_state = {
@@ -6,22 +6,26 @@
 import json
 import logging
 import os
+import shutil
 import sys
 import tempfile
 import traceback
 import urllib
 import zipfile
 from os import environ
-from typing import Iterable
+from typing import Iterable, List
 from urllib.parse import urlparse
 from zipfile import BadZipFile
 
 import backoff
 import boto3
 import botocore
+import fastparquet
 import google
 import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
 import smart_open
 import smart_open.ssh
 from azure.storage.blob import BlobServiceClient
@@ -39,7 +43,7 @@ from airbyte_cdk.entrypoint import logger
 from airbyte_cdk.models import AirbyteStream, FailureType, SyncMode
 from airbyte_cdk.utils import AirbyteTracedException, is_cloud_environment
 
-from .utils import LOCAL_STORAGE_NAME, backoff_handler
+from .utils import LOCAL_STORAGE_NAME, backoff_handler, iter_json_items
 
 
 SSH_TIMEOUT = 60
@@ -257,7 +261,11 @@ class Client:
     """Class that manages reading and parsing data from streams"""
 
     CSV_CHUNK_SIZE = 10_000
+    # remote binary sources are copied to a local file this many bytes at a time
+    CACHE_BLOCK_SIZE = 8 * 1024 * 1024
     binary_formats = {"excel", "excel_binary", "feather", "parquet", "orc", "pickle"}
+    # the local copies of these formats are memory-mapped, their readers jump around the file
+    memory_map_formats = {"excel", "feather", "orc"}
 
     def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: dict = None):
         self._dataset_name = dataset_name
@@ -299,29 +307,30 @@ class Client:
         result["$schema"] = "http://json-schema.org/draft-07/schema#"
         return result
 
-    def load_nested_json(self, fp) -> list:
+    def load_nested_json(self, fp) -> Iterable[dict]:
         if self._reader_format == "jsonl":
-            result = []
-            line = fp.readline()
-            while line:
-                result.append(json.loads(line))
-                line = fp.readline()
+            for line in fp:
+                if not line.strip():
+                    continue
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # orjson is stricter than json, e.g. on NaN or integers over 64 bits
+                    yield json.loads(line)
         else:
-            result = json.load(fp)
-            if not isinstance(result, list):
-                result = [result]
-        return result
+            yield from iter_json_items(fp)
 
     def load_yaml(self, fp):
         if self._reader_format == "yaml":
             return pd.DataFrame(safe_load(fp))
 
-    def load_dataframes(self, fp, skip_data=False, read_sample_chunk: bool = False) -> Iterable:
+    def load_dataframes(self, fp, skip_data=False, read_sample_chunk: bool = False, fields: Iterable = None) -> Iterable:
         """load and return the appropriate pandas dataframe.
 
         :param fp: file-like object to read from
         :param skip_data: limit reading data
         :param read_sample_chunk: indicates whether a single chunk should only be read to generate schema
+        :param fields: the columns to read, all of them if not set, only used by the formats storing columns separately
         :return: a list of dataframe loaded from files described in the configuration
         """
         readers = {
@@ -357,13 +366,19 @@ class Client:
                     reader_options["nrows"] = 0
                     reader_options["index_col"] = 0
                 for record in reader(fp, **reader_options):
-                    bytes_read += sys.getsizeof(record)
                     yield record
-                    if read_sample_chunk and bytes_read >= self.CSV_CHUNK_SIZE:
-                        return
+                    # the deep size of the strings is slow to measure, only done for the sample
+                    if read_sample_chunk:
+                        bytes_read += sys.getsizeof(record)
+                        if bytes_read >= self.CSV_CHUNK_SIZE:
+                            return
             elif self._reader_format == "excel_binary":
                 reader_options["engine"] = "pyxlsb"
                 yield reader(fp, **reader_options)
+            elif self._reader_format == "parquet" and set(reader_options) <= {"columns"}:
+                yield from self.parquet_row_group_reader(
+                    fp, first_row_group_only=skip_data or read_sample_chunk, fields=fields, **reader_options
+                )
             elif self._reader_format == "parquet":
                 reader_options["engine"] = "fastparquet"
                 yield reader(fp, **reader_options)
@@ -409,6 +424,25 @@ class Client:
             return "date-time"
         return "string"
 
+    @staticmethod
+    def dataframe_to_records(df: pd.DataFrame) -> List[dict]:
+        """Convert a dataframe to records, with None for the missing values (NaN, NaT, NA).
+
+        Each column is converted to a list of Python objects at once, rather than each value by `df.to_dict`,
+        which is most of the read time of the tabular formats.
+        """
+        columns = []
+        for _, series in df.items():
+            values = series.to_numpy(dtype=object)
+            missing = series.isna().to_numpy()
+            if missing.any():
+                values = np.where(missing, None, values)
+            columns.append(values.tolist())
+        if not columns:
+            return [{} for _ in range(len(df))]
+        names = df.columns.tolist()
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
     @property
     def reader(self) -> reader_class:
         return self.reader_class(url=self._url, provider=self._provider, binary=self.binary_source, encoding=self.encoding)
@@ -432,10 +466,11 @@ class Client:
                         fp = self._cache_stream(fp)
                     if self._is_zip:
                         fp = self._unzip(fp)
-                    for df in self.load_dataframes(fp):
+                    if self._reader_format in self.memory_map_formats:
+                        fp = self._memory_map(fp)
+                    for df in self.load_dataframes(fp, fields=fields):
                         columns = fields.intersection(set(df.columns)) if fields else df.columns
-                        df.replace({np.nan: None}, inplace=True)
-                        yield from df[list(columns)].to_dict(orient="records")
+                        yield from self.dataframe_to_records(df[list(columns)])
             except ConnectionResetError:
                 logger.info(f"Catched `connection reset error - 104`, stream: {self.stream_name} ({self.reader.full_url})")
                 raise ConnectionResetError
@@ -447,24 +482,35 @@ class Client:
                 raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error) from err
 
     def _unzip(self, fp):
-        tmp_dir = tempfile.TemporaryDirectory()
-        with zipfile.ZipFile(str(fp.name), "r") as zip_ref:
-            zip_ref.extractall(tmp_dir.name)
-
-        logger.info("Temp dir content: " + str(os.listdir(tmp_dir.name)))
-        final_file: str = os.path.join(tmp_dir.name, os.listdir(tmp_dir.name)[0])
-        logger.info("Pick up first file: " + final_file)
-        fp_tmp = open(final_file, "rb")
-        return fp_tmp
+        """
+        Open the first file of the archive, decompressed while it is read rather than extracted.
+        The binary formats are read with random access, so they are cached to a file first.
+        """
+        zip_ref = zipfile.ZipFile(fp, "r")
+        logger.info("Zip archive content: " + str(zip_ref.namelist()))
+        member = [info for info in zip_ref.infolist() if not info.is_dir()][0]
+        logger.info("Pick up first file: " + member.filename)
+        fp_member = zip_ref.open(member)
+        if self._reader_format in self.binary_formats:
+            return self._cache_stream(fp_member)
+        return fp_member
 
     def _cache_stream(self, fp):
-        """cache stream to file"""
+        """cache stream to file, `CACHE_BLOCK_SIZE` bytes at a time"""
         fp_tmp = tempfile.NamedTemporaryFile(mode="w+b")
-        fp_tmp.write(fp.read())
+        shutil.copyfileobj(fp, fp_tmp, self.CACHE_BLOCK_SIZE)
         fp_tmp.seek(0)
         fp.close()
         return fp_tmp
 
+    @staticmethod
+    def _memory_map(fp):
+        """map the cached file in memory, so its pages are read by the OS on access rather than copied to Python buffers"""
+        if not os.fstat(fp.fileno()).st_size:
+            # empty files can't be mapped
+            return fp
+        return pa.memory_map(fp.name)
+
     def _stream_properties(self, fp, empty_schema: bool = False, read_sample_chunk: bool = False):
         """
         empty_schema param is used to check connectivity, i.e. we only read a header and do not produce stream properties
@@ -477,6 +523,8 @@ class Client:
                 fp = self._cache_stream(fp)
             if self._is_zip:
                 fp = self._unzip(fp)
+            if self._reader_format in self.memory_map_formats:
+                fp = self._memory_map(fp)
             df_list = self.load_dataframes(fp, skip_data=empty_schema, read_sample_chunk=read_sample_chunk)
         fields = {}
         for df in df_list:
@@ -506,6 +554,23 @@ class Client:
                 }
         yield AirbyteStream(name=self.stream_name, json_schema=json_schema, supported_sync_modes=[SyncMode.full_refresh])
 
+    def parquet_row_group_reader(self, fp, first_row_group_only: bool = False, fields: Iterable = None, columns: list = None):
+        """
+        Read a parquet file one row group at a time, with the same engine and types as `pd.read_parquet`.
+        Only the columns of the configured catalog and of the `columns` reader option are read, when set.
+        """
+        parquet_file = fastparquet.ParquetFile(fp)
+        selected_columns = [
+            column for column in parquet_file.columns if (not fields or column in fields) and (not columns or column in columns)
+        ] or None
+        if not parquet_file.row_groups:
+            yield parquet_file.to_pandas(columns=selected_columns)
+            return
+        for df in parquet_file.iter_row_groups(columns=selected_columns):
+            yield df
+            if first_row_group_only:
+                return
+
     def openpyxl_chunk_reader(self, file, **kwargs):
         """
         Use openpyxl's lazy loading feature to read Excel files (xlsx only) in chunks of 500 lines at a time.
@@ -2,7 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
+import json
 import logging
+import re
+from typing import IO, Any, Iterator, Union
 from urllib.parse import parse_qs, urlencode, urlparse
 
 
@@ -11,6 +15,9 @@ logger = logging.getLogger("airbyte")
 
 LOCAL_STORAGE_NAME = "local"
 
+JSON_READ_SIZE = 1024 * 1024
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
 
 def dropbox_force_download(url):
     """
@@ -27,3 +34,73 @@ def dropbox_force_download(url):
 
 def backoff_handler(details):
     logger.info(f"Caught retryable error after {details['tries']} tries. Waiting {details['wait']} seconds then retrying...")
+
+
+def _iter_text(fp: IO, read_size: int) -> Iterator[str]:
+    decoder = None
+    while True:
+        chunk = fp.read(read_size)
+        if isinstance(chunk, bytes):
+            decoder = decoder or codecs.getincrementaldecoder("utf-8")()
+            chunk = decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_json_items(fp: IO[Union[str, bytes]], read_size: int = JSON_READ_SIZE) -> Iterator[Any]:
+    """
+    Yield the items of a top-level JSON array one at a time, reading the file `read_size` characters at a time,
+    so only the item being parsed is held in memory. Any other top-level value is yielded as a whole.
+    """
+    decoder = json.JSONDecoder()
+    chunks = _iter_text(fp, read_size)
+    buffer, position = "", 0
+
+    def read_more() -> bool:
+        nonlocal buffer, position
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        buffer, position = buffer[position:] + chunk, 0
+        return True
+
+    def next_char() -> str:
+        # skip the whitespace to the next character, an empty string at the end of the file
+        nonlocal position
+        position = JSON_WHITESPACE.match(buffer, position).end()
+        while position == len(buffer) and read_more():
+            position = JSON_WHITESPACE.match(buffer, position).end()
+        return buffer[position : position + 1]
+
+    if next_char() != "[":
+        while read_more():
+            pass
+        yield json.loads(buffer)
+        return
+
+    position += 1
+    first_item = True
+    while True:
+        char = next_char()
+        if char == "]":
+            return
+        if not first_item:
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+            position += 1
+            next_char()
+        first_item = False
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if read_more():
+                    continue
+                raise
+            # the item is complete once followed by a delimiter, a number cut by the read, e.g. at "3.", goes on
+            following = JSON_WHITESPACE.match(buffer, end).end()
+            if buffer[following : following + 1] in (",", "]") or not read_more():
+                break
+        position = end
+        yield item
@@ -3,15 +3,26 @@
 #
 
 
+import io
+import json
+import logging
+import os
+import time
+import tracemalloc
+import zipfile
+from functools import partial
 from tempfile import NamedTemporaryFile
 from unittest.mock import patch, sentinel
 
+import fastparquet
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pandas import read_csv, read_excel, testing
 from paramiko import SSHException
 from source_file.client import Client, URLFile
-from source_file.utils import backoff_handler
+from source_file.utils import backoff_handler, iter_json_items
 from urllib3.exceptions import ProtocolError
 
 from airbyte_cdk.utils import AirbyteTracedException
@@ -344,3 +355,228 @@ def test_excel_reader_option_header(config):
         read_file = next(client.load_dataframes(fp=tmp.name))
         assert isinstance(read_file, pd.DataFrame)
         assert read_file.to_dict(orient="records") == expected_data
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '[{"a": 1, "b": [1, 2]}, {"a": "x, ]"}  ,\n {"a": 12345678}, 3.25, "s"]',
+        "  \n[ ]",
+        '{"a": {"b": [1, 2, 3]}}',
+    ],
+)
+def test_iter_json_items(content):
+    expected = json.loads(content)
+    expected = expected if isinstance(expected, list) else [expected]
+    for read_size in (1, 3, 1000):
+        assert list(iter_json_items(io.StringIO(content), read_size=read_size)) == expected
+        assert list(iter_json_items(io.BytesIO(content.encode()), read_size=read_size)) == expected
+
+
+@pytest.mark.parametrize("content", ['[{"a": 1} {"a": 2}]', '[{"a": 1},', ""])
+def test_iter_json_items_raises_on_invalid_json(content):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(io.StringIO(content), read_size=4))
+
+
+def _write_large_file(path, file_format, rows):
+    record = {"id": 0, "name": "x" * 200, "nested": {"values": list(range(20))}}
+    if file_format == "parquet":
+        df = pd.DataFrame({"id": range(rows), "name": ["x" * 200] * rows, "other": [1.5] * rows})
+        fastparquet.write(str(path), df, row_group_offsets=rows // 20)
+        return
+    with open(path, "w") as file:
+        if file_format == "json":
+            file.write("[")
+        for i in range(rows):
+            record["id"] = i
+            separator = ",\n" if file_format == "json" and i else ""
+            file.write(separator + json.dumps(record) + ("\n" if file_format == "jsonl" else ""))
+        if file_format == "json":
+            file.write("]")
+
+
+def _count_records_and_peak_memory(records):
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in records)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return count, peak
+
+
+@pytest.mark.parametrize("file_format", ["json", "jsonl"])
+def test_read_holds_a_bounded_part_of_the_file_in_memory(tmp_path, file_format):
+    rows = 20_000
+    path = tmp_path / f"large.{file_format}"
+    _write_large_file(path, file_format, rows)
+    client = Client(dataset_name="test", url=str(path), provider={"storage": "local"}, format=file_format)
+
+    # a smaller read size than the 1 MiB default keeps the fixture small
+    with patch("source_file.client.iter_json_items", partial(iter_json_items, read_size=64 * 1024)):
+        count, peak = _count_records_and_peak_memory(client.read(["id", "name"]))
+
+    assert count == rows
+    assert path.stat().st_size > 4_000_000
+    assert peak < path.stat().st_size / 4
+
+
+def test_parquet_row_group_reader_holds_one_row_group_in_memory(tmp_path):
+    rows = 20_000
+    path = tmp_path / "large.parquet"
+    _write_large_file(path, "parquet", rows)
+    client = Client(dataset_name="test", url=str(path), provider={"storage": "local"}, format="parquet")
+
+    with open(path, "rb") as fp:
+        count, peak = _count_records_and_peak_memory(
+            record for df in client.parquet_row_group_reader(fp, fields=["id", "name"]) for record in df.to_dict("records")
+        )
+
+    assert count == rows
+    assert path.stat().st_size > 4_000_000
+    assert peak < path.stat().st_size / 4
+
+
+def test_read_parquet_projects_the_configured_columns(tmp_path):
+    path = tmp_path / "projected.parquet"
+    _write_large_file(path, "parquet", 100)
+    client = Client(dataset_name="test", url=str(path), provider={"storage": "local"}, format="parquet")
+
+    iter_row_groups = fastparquet.ParquetFile.iter_row_groups
+    with patch.object(fastparquet.ParquetFile, "iter_row_groups", autospec=True, side_effect=iter_row_groups) as iter_row_groups:
+        records = list(client.read(["id", "missing"]))
+
+    assert records[:2] == [{"id": 0}, {"id": 1}]
+    assert iter_row_groups.call_args.kwargs["columns"] == ["id"]
+
+
+def _to_dict_records(df):
+    # the former conversion of the dataframes, the reference of `Client.dataframe_to_records`
+    df = df.copy()
+    df.replace({np.nan: None}, inplace=True)
+    return df.to_dict(orient="records")
+
+
+def test_dataframe_to_records_is_the_same_as_to_dict():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, np.nan, 2.0],
+            "string": ["a", np.nan, None],
+            "bool": [True, False, True],
+            "nullable_bool": [True, None, False],
+            "mixed": [1, "a", np.nan],
+            "datetime": pd.to_datetime(["2024-01-01", None, "2024-01-02"]),
+            "nullable_int": pd.array([1, None, 3], dtype="Int64"),
+        }
+    )
+
+    records = Client.dataframe_to_records(df)
+
+    assert records == _to_dict_records(df)
+    assert [[type(value) for value in record.values()] for record in records] == [
+        [type(value) for value in record.values()] for record in _to_dict_records(df)
+    ]
+    assert Client.dataframe_to_records(df[[]]) == [{}, {}, {}]
+
+
+@pytest.mark.skipif(not os.getenv("SOURCE_FILE_CSV_BENCHMARK_ROWS"), reason="set SOURCE_FILE_CSV_BENCHMARK_ROWS to run it")
+def test_benchmark_dataframe_to_records_against_to_dict(tmp_path):
+    rows = int(os.environ["SOURCE_FILE_CSV_BENCHMARK_ROWS"])
+    path = tmp_path / "benchmark.csv"
+    pd.DataFrame(
+        {
+            "id": range(rows),
+            "name": [f"name {i % 1000}" for i in range(rows)],
+            "amount": [i / 7 if i % 5 else None for i in range(rows)],
+            "flag": [bool(i % 2) for i in range(rows)],
+            "created": ["2024-01-01T10:00:00Z"] * rows,
+            "note": ["some note" if i % 3 else None for i in range(rows)],
+            "not_in_catalog": ["x" * 20] * rows,
+        }
+    ).to_csv(path, index=False)
+    client = Client(dataset_name="test", url=str(path), provider={"storage": "local"}, format="csv")
+    fields = ["id", "name", "amount", "flag", "created", "note"]
+
+    def to_dict_read():
+        # `Client.read` before the columnar conversion
+        with open(path) as fp:
+            for df in client.load_dataframes(fp):
+                yield from _to_dict_records(df[fields])
+
+    for name, read in [("to_dict", to_dict_read), ("dataframe_to_records", partial(client.read, fields))]:
+        start = time.perf_counter()
+        count = sum(1 for _ in read())
+        seconds = time.perf_counter() - start
+        _, peak = _count_records_and_peak_memory(read())
+        assert count == rows
+        logging.getLogger("airbyte").info(f"{name}: {count / seconds:.0f} records/s, peak traced memory {peak / 2**20:.1f} MiB")
+
+
+class _RecordingStream(io.BytesIO):
+    def __init__(self, content):
+        super().__init__(content)
+        self.read_sizes = []
+
+    def read(self, size=-1):
+        self.read_sizes.append(size)
+        return super().read(size)
+
+
+def test_cache_stream_copies_the_stream_by_blocks(client):
+    content = bytes(range(256)) * 1000
+    stream = _RecordingStream(content)
+
+    with patch.object(Client, "CACHE_BLOCK_SIZE", 1000):
+        fp = client._cache_stream(stream)
+
+    assert fp.read() == content
+    assert set(stream.read_sizes) == {1000}
+    assert stream.closed
+
+
+def test_cache_stream_holds_one_block_in_memory(client, tmp_path):
+    path = tmp_path / "large.bin"
+    path.write_bytes(os.urandom(40_000_000))
+
+    with open(path, "rb") as fp, patch.object(Client, "CACHE_BLOCK_SIZE", 1024 * 1024):
+        tracemalloc.start()
+        try:
+            cached = client._cache_stream(fp)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert os.fstat(cached.fileno()).st_size == path.stat().st_size
+    assert peak < 3 * 1024 * 1024
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_read_zip_without_extracting_the_archive(tmp_path, file_format):
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", None]})
+    path = tmp_path / f"data.{file_format}"
+    df.to_csv(path, index=False) if file_format == "csv" else fastparquet.write(str(path), df)
+    with zipfile.ZipFile(tmp_path / "data.zip", "w") as archive:
+        archive.writestr("folder/", "")
+        archive.write(path, f"folder/data.{file_format}")
+    client = Client(dataset_name="test", url=str(tmp_path / "data.zip"), provider={"storage": "local"}, format=file_format)
+
+    with patch.object(zipfile.ZipFile, "extractall", side_effect=AssertionError("the archive is extracted")):
+        records = list(client.read())
+
+    assert records == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": None}]
+
+
+@pytest.mark.parametrize("file_format", ["excel", "feather", "orc"])
+def test_read_memory_maps_the_local_copy(tmp_path, file_format):
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    path = tmp_path / f"data.{file_format}"
+    {"excel": partial(df.to_excel, index=False), "feather": df.to_feather, "orc": df.to_orc}[file_format](path)
+    client = Client(dataset_name="test", url=str(path), provider={"storage": "local"}, format=file_format)
+
+    with patch.object(Client, "load_dataframes", autospec=True, side_effect=Client.load_dataframes) as load_dataframes:
+        records = list(client.read())
+
+    assert records == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": "c"}]
+    assert isinstance(load_dataframes.call_args.args[1], pa.MemoryMappedFile)
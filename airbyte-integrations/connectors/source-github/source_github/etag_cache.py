@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Callable, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+logger = logging.getLogger("airbyte")
+
+# the headers of a cached page needed to read it again: the pagination is in `Link`
+_REPLAYED_HEADERS = ("Content-Type", "Link")
+
+
+@dataclass
+class CachedPage:
+    etag: str
+    headers: Mapping[str, str]
+    # base64 of the response body
+    content: str
+
+
+class ETagCache:
+    """
+    On-disk cache of the pages of the REST responses with their ETag, keyed by URL and `Accept` header,
+    so the next sync can revalidate them with `If-None-Match` instead of downloading them again.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def get(self, request: requests.PreparedRequest) -> Optional[CachedPage]:
+        try:
+            with open(self._path(request), "r") as cache_file:
+                return CachedPage(**json.load(cache_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning(f"Ignoring the unreadable cached response of {request.url}: {exc}")
+            return None
+
+    def set(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        cached_page = CachedPage(
+            etag=response.headers["ETag"],
+            headers={name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers},
+            content=base64.b64encode(response.content).decode("ascii"),
+        )
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temporary file first, so a concurrent reader never sees a partial entry
+            with tempfile.NamedTemporaryFile("w", dir=self.directory, delete=False) as cache_file:
+                json.dump(asdict(cached_page), cache_file)
+            os.replace(cache_file.name, self._path(request))
+        except OSError as exc:
+            logger.warning(f"Could not cache the response of {request.url}: {exc}")
+
+    def _path(self, request: requests.PreparedRequest) -> str:
+        digest = hashlib.sha256(json.dumps([request.url, request.headers.get("Accept")]).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+
+class ConditionalRequestAdapter(HTTPAdapter):
+    """
+    Sends the GET requests with the ETag of their cached response, and answers a `304 Not Modified` with the cached page,
+    so the streams parse and paginate it as if it had been downloaded. GitHub doesn't count the 304s against the rate limit,
+    `on_not_modified` is called with their request so the rate limiter can give the request back.
+    """
+
+    def __init__(self, cache: ETagCache, on_not_modified: Optional[Callable[[requests.PreparedRequest], None]] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._cache = cache
+        self._on_not_modified = on_not_modified
+        self.not_modified = 0
+        self.modified = 0
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        cached_page = self._cache.get(request)
+        if cached_page:
+            request.headers["If-None-Match"] = cached_page.etag
+        response = super().send(request, **kwargs)
+
+        if response.status_code == requests.codes.NOT_MODIFIED and cached_page:
+            self.not_modified += 1
+            if self._on_not_modified:
+                self._on_not_modified(request)
+            return self._replay(cached_page, response)
+        if response.status_code == requests.codes.OK and "ETag" in response.headers:
+            self.modified += 1
+            self._cache.set(request, response)
+        return response
+
+    @staticmethod
+    def _replay(cached_page: CachedPage, not_modified_response: requests.Response) -> requests.Response:
+        response = requests.Response()
+        response.status_code = requests.codes.OK
+        response.reason = "OK"
+        # the rate limit headers are the ones of the 304, the body and its pagination are the cached ones
+        response.headers = CaseInsensitiveDict(not_modified_response.headers)
+        response.headers.update(cached_page.headers)
+        response._content = base64.b64decode(cached_page.content)
+        response._content_consumed = True
+        response.headers["Content-Length"] = str(len(response._content))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = not_modified_response.url
+        response.request = not_modified_response.request
+        response.connection = not_modified_response.connection
+        response.elapsed = not_modified_response.elapsed
+        not_modified_response.close()
+        return response
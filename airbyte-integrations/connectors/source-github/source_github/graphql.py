@@ -4,16 +4,32 @@
 
 import heapq
 import itertools
+from functools import lru_cache
 from typing import Optional
 
 import sgqlc.operation
 from sgqlc.operation import Selector
+from sgqlc.types import Arg, String, Variable
 
-from . import github_schema
 
+# the get_query_* queries are built once per repository and page size, the cursor of a page is sent as the `$after` variable
+QUERY_CACHE_SIZE = 256
+AFTER = Variable("after")
 
-_schema = github_schema
-_schema_root = _schema.github_schema
+
+@lru_cache(maxsize=None)
+def _schema_root():
+    """
+    `github_schema` declares the whole GitHub GraphQL schema (40k+ lines), so it is only imported when the first query is built:
+    `spec`, `check`, `discover` and the syncs of REST streams never load it.
+    """
+    from . import github_schema
+
+    return github_schema.github_schema
+
+
+def _paged_operation():
+    return sgqlc.operation.Operation(_schema_root().query_type, variables={"after": Arg(String)})
 
 
 def select_user_fields(user):
@@ -27,16 +43,13 @@ def select_user_fields(user):
     )
 
 
-def get_query_pull_requests(owner, name, first, after, direction):
-    kwargs = {"first": first, "order_by": {"field": "UPDATED_AT", "direction": direction}}
-    if after:
-        kwargs["after"] = after
-
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def get_query_pull_requests(owner, name, first, direction):
+    op = _paged_operation()
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
-    pull_requests = repository.pull_requests(**kwargs)
+    pull_requests = repository.pull_requests(first=first, order_by={"field": "UPDATED_AT", "direction": direction}, after=AFTER)
     pull_requests.nodes.__fields__(
         id="node_id",
         database_id="id",
@@ -56,22 +69,19 @@ def get_query_pull_requests(owner, name, first, after, direction):
     reviews = pull_requests.nodes.reviews(first=100, __alias__="review_comments")
     reviews.total_count()
     reviews.nodes.comments.__fields__(total_count=True)
-    user = pull_requests.nodes.merged_by(__alias__="merged_by").__as__(_schema_root.User)
+    user = pull_requests.nodes.merged_by(__alias__="merged_by").__as__(_schema_root().User)
     select_user_fields(user)
     pull_requests.page_info.__fields__(has_next_page=True, end_cursor=True)
     return str(op)
 
 
-def get_query_projectsV2(owner, name, first, after, direction):
-    kwargs = {"first": first, "order_by": {"field": "UPDATED_AT", "direction": direction}}
-    if after:
-        kwargs["after"] = after
-
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def get_query_projectsV2(owner, name, first, direction):
+    op = _paged_operation()
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
-    projects_v2 = repository.projects_v2(**kwargs)
+    projects_v2 = repository.projects_v2(first=first, order_by={"field": "UPDATED_AT", "direction": direction}, after=AFTER)
     projects_v2.nodes.__fields__(
         closed=True,
         created_at="created_at",
@@ -96,26 +106,22 @@ def get_query_projectsV2(owner, name, first, after, direction):
     return str(op)
 
 
-def get_query_reviews(owner, name, first, after, number=None):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def get_query_reviews(owner, name, first, number=None):
+    op = _paged_operation()
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
     if number:
         pull_request = repository.pull_request(number=number)
     else:
-        kwargs = {"first": first, "order_by": {"field": "UPDATED_AT", "direction": "ASC"}}
-        if after:
-            kwargs["after"] = after
-        pull_requests = repository.pull_requests(**kwargs)
+        pull_requests = repository.pull_requests(first=first, order_by={"field": "UPDATED_AT", "direction": "ASC"}, after=AFTER)
         pull_requests.page_info.__fields__(has_next_page=True, end_cursor=True)
         pull_request = pull_requests.nodes
 
     pull_request.__fields__(number=True, url=True)
-    kwargs = {"first": first}
-    if number and after:
-        kwargs["after"] = after
-    reviews = pull_request.reviews(**kwargs)
+    # the cursor pages the reviews of a single pull request, or else the pull requests
+    reviews = pull_request.reviews(first=first, after=AFTER) if number else pull_request.reviews(first=first)
     reviews.page_info.__fields__(has_next_page=True, end_cursor=True)
     reviews.nodes.__fields__(
         id="node_id",
@@ -129,31 +135,27 @@ def get_query_reviews(owner, name, first, after, number=None):
         updated_at="updated_at",
     )
     reviews.nodes.commit.oid()
-    user = reviews.nodes.author(__alias__="user").__as__(_schema_root.User)
+    user = reviews.nodes.author(__alias__="user").__as__(_schema_root().User)
     select_user_fields(user)
     return str(op)
 
 
-def get_query_issue_reactions(owner, name, first, after, number=None):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def get_query_issue_reactions(owner, name, first, number=None):
+    op = _paged_operation()
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
     if number:
         issue = repository.issue(number=number)
     else:
-        kwargs = {"first": first}
-        if after:
-            kwargs["after"] = after
-        issues = repository.issues(**kwargs)
+        issues = repository.issues(first=first, after=AFTER)
         issues.page_info.__fields__(has_next_page=True, end_cursor=True)
         issue = issues.nodes
 
     issue.__fields__(number=True)
-    kwargs = {"first": first}
-    if number and after:
-        kwargs["after"] = after
-    reactions = issue.reactions(**kwargs)
+    # the cursor pages the reactions of a single issue, or else the issues
+    reactions = issue.reactions(first=first, after=AFTER) if number else issue.reactions(first=first)
     reactions.page_info.__fields__(has_next_page=True, end_cursor=True)
     reactions.nodes.__fields__(
         id="node_id",
@@ -223,7 +225,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        pull_request = op.node(id=node_id).__as__(_schema_root.PullRequest)
+        pull_request = op.node(id=node_id).__as__(_schema_root().PullRequest)
         pull_request.id(__alias__="node_id")
         pull_request.repository.name()
         pull_request.repository.owner.login()
@@ -246,7 +248,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        review = op.node(id=node_id).__as__(_schema_root.PullRequestReview)
+        review = op.node(id=node_id).__as__(_schema_root().PullRequestReview)
         review.id(__alias__="node_id")
         review.repository.name()
         review.repository.owner.login()
@@ -266,7 +268,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        comment = op.node(id=node_id).__as__(_schema_root.PullRequestReviewComment)
+        comment = op.node(id=node_id).__as__(_schema_root().PullRequestReviewComment)
         comment.id(__alias__="node_id")
         comment.database_id(__alias__="id")
         comment.repository.name()
@@ -308,7 +310,7 @@ class QueryReactions:
         return reviews
 
     def _get_operation(self):
-        return sgqlc.operation.Operation(_schema_root.query_type)
+        return sgqlc.operation.Operation(_schema_root().query_type)
 
 
 class CursorStorage:
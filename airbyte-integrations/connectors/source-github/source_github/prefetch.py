@@ -0,0 +1,120 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from queue import Full, Queue
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional
+
+
+MAX_BUFFERED_RECORDS = 1000  # records of a single repository read ahead of the sync
+QUEUE_PUT_TIMEOUT_SECONDS = 0.5
+
+
+class QueueEnd:
+    """Marks the end of the records of a repository."""
+
+
+class QueueFailure:
+    """Carries an exception raised in a worker to the consumer of the repository records."""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+@dataclass
+class PendingRepository:
+    records: Queue
+    cancelled: threading.Event = field(default_factory=threading.Event)
+
+
+class RepositoryPrefetcher:
+    """
+    Reads the records of the upcoming repositories of a stream in worker threads while the sync consumes the current one.
+
+    The repositories are submitted in the order of the slices, so the repository the sync waits for is always
+    being read or already done. Each repository buffers at most `max_buffered_records` records, the workers wait
+    for the sync to catch up once the buffer is full. The records are handed over in the thread of the sync which
+    keeps checkpointing the state of each repository after its records, as in the sequential read.
+    """
+
+    def __init__(
+        self,
+        fetch_records: Callable[[Mapping[str, Any]], Iterable[Mapping[str, Any]]],
+        stream_slices: List[Mapping[str, Any]],
+        max_workers: int,
+        max_buffered_records: int = MAX_BUFFERED_RECORDS,
+    ):
+        self._stop = threading.Event()
+        self._pending: "OrderedDict[str, PendingRepository]" = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="repositories")
+        for stream_slice in stream_slices:
+            pending = PendingRepository(records=Queue(maxsize=max_buffered_records))
+            self._pending[stream_slice["repository"]] = pending
+            self._executor.submit(self._fetch, fetch_records, stream_slice, pending)
+
+    def __enter__(self) -> "RepositoryPrefetcher":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def records(self, repository: str) -> Optional[Iterator[Mapping[str, Any]]]:
+        """
+        The records of a repository, None if it isn't read ahead.
+        The repositories before it are not going to be asked for anymore, their workers are released.
+        """
+        if repository not in self._pending:
+            return None
+        while True:
+            name, pending = self._pending.popitem(last=False)
+            if name == repository:
+                return self._drain(pending)
+            pending.cancelled.set()
+
+    @staticmethod
+    def _drain(pending: PendingRepository) -> Iterator[Mapping[str, Any]]:
+        try:
+            while True:
+                item = pending.records.get()
+                if isinstance(item, QueueEnd):
+                    return
+                if isinstance(item, QueueFailure):
+                    raise item.exception
+                yield item
+        finally:
+            # the sync may stop reading a repository early, e.g. the sorted semi incremental streams
+            pending.cancelled.set()
+
+    def _put(self, pending: PendingRepository, item: Any) -> bool:
+        while not (self._stop.is_set() or pending.cancelled.is_set()):
+            try:
+                pending.records.put(item, timeout=QUEUE_PUT_TIMEOUT_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _fetch(
+        self,
+        fetch_records: Callable[[Mapping[str, Any]], Iterable[Mapping[str, Any]]],
+        stream_slice: Mapping[str, Any],
+        pending: PendingRepository,
+    ) -> None:
+        if self._stop.is_set() or pending.cancelled.is_set():
+            return
+        try:
+            for record in fetch_records(stream_slice):
+                if not self._put(pending, record):
+                    return
+        except Exception as exc:
+            self._put(pending, QueueFailure(exc))
+            return
+        self._put(pending, QueueEnd())
@@ -132,7 +132,9 @@ class SourceGithub(AbstractSource):
     def _get_authenticator(self, config: Mapping[str, Any]):
         _, token = self.get_access_token(config)
         tokens = [t.strip() for t in token.split(constants.TOKEN_SEPARATOR)]
-        return MultipleTokenAuthenticatorWithRateLimiter(tokens=tokens)
+        # the concurrent reads spread their requests over all the tokens instead of draining them one by one
+        spread_requests = config.get("max_concurrent_repositories", 1) > 1
+        return MultipleTokenAuthenticatorWithRateLimiter(tokens=tokens, spread_requests=spread_requests)
 
     def _validate_and_transform_config(self, config: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
         config = self._ensure_default_values(config)
@@ -260,6 +262,7 @@ class SourceGithub(AbstractSource):
             "page_size_for_large_streams": page_size,
             "access_token_type": access_token_type,
             "max_waiting_time": max_waiting_time,
+            "max_concurrent_repositories": config.get("max_concurrent_repositories", 1),
         }
         repository_args_with_start_date = {**repository_args, "start_date": start_date}
 
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import os
 import re
 from abc import ABC, abstractmethod
 from datetime import timedelta, timezone
@@ -14,7 +15,9 @@ from dateutil.parser import parse as date_parse
 from airbyte_cdk import BackoffStrategy, StreamSlice
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level, SyncMode
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
+from airbyte_cdk.sources.streams.checkpoint.checkpoint_reader import FULL_REFRESH_COMPLETE_STATE
 from airbyte_cdk.sources.streams.checkpoint.substream_resumable_full_refresh_cursor import SubstreamResumableFullRefreshCursor
 from airbyte_cdk.sources.streams.core import CheckpointMixin, Stream
 from airbyte_cdk.sources.streams.http import HttpStream
@@ -33,6 +36,7 @@ from .errors_handlers import (
     GithubStreamABCErrorHandler,
     is_conflict_with_empty_repository,
 )
+from .etag_cache import ConditionalRequestAdapter, ETagCache
 from .graphql import (
     CursorStorage,
     QueryReactions,
@@ -41,9 +45,14 @@ from .graphql import (
     get_query_pull_requests,
     get_query_reviews,
 )
+from .prefetch import RepositoryPrefetcher
 from .utils import GitHubAPILimitException, getter
 
 
+# a persistent directory to keep the ETags and the pages of the `use_etag_cache` streams between the syncs
+ETAG_CACHE_DIR = os.getenv("GITHUB_ETAG_CACHE_DIR")
+
+
 class GithubStreamABC(HttpStream, ABC):
     primary_key = "id"
 
@@ -51,6 +60,8 @@ class GithubStreamABC(HttpStream, ABC):
     large_stream = False
     max_retries: int = 5
     stream_base_params = {}
+    # Full collections which rarely change: their pages are revalidated with `If-None-Match` when `ETAG_CACHE_DIR` is set
+    use_etag_cache = False
 
     def __init__(self, api_url: str = "https://api.github.com", access_token_type: str = "", **kwargs):
         if kwargs.get("authenticator"):
@@ -60,6 +71,8 @@ class GithubStreamABC(HttpStream, ABC):
         self.access_token_type = access_token_type
         self.api_url = api_url
         self.state = {}
+        if self.use_etag_cache and ETAG_CACHE_DIR:
+            self._mount_etag_cache(ETAG_CACHE_DIR)
 
         if not self.supports_incremental:
             self.cursor = SubstreamResumableFullRefreshCursor()
@@ -68,6 +81,17 @@ class GithubStreamABC(HttpStream, ABC):
     def url_base(self) -> str:
         return self.api_url
 
+    def _mount_etag_cache(self, directory: str) -> None:
+        session = self._http_client._session
+        self.etag_cache_adapter = ConditionalRequestAdapter(
+            ETagCache(directory),
+            # the 304s don't count against the rate limit, the rate limiter gets these requests back
+            on_not_modified=getattr(session.auth, "release_request", None),
+            pool_connections=MAX_CONNECTION_POOL_SIZE,
+            pool_maxsize=MAX_CONNECTION_POOL_SIZE,
+        )
+        session.mount(self.api_url, self.etag_cache_adapter)
+
     @property
     def availability_strategy(self) -> Optional["AvailabilityStrategy"]:
         return None
@@ -195,19 +219,84 @@ class GithubStreamABC(HttpStream, ABC):
 
 
 class GithubStream(GithubStreamABC):
-    def __init__(self, repositories: List[str], page_size_for_large_streams: int, **kwargs):
+    # Streams reading one repository per slice: the upcoming repositories are read ahead in worker threads
+    # when `max_concurrent_repositories` is above 1
+    concurrent_repositories = False
+
+    def __init__(self, repositories: List[str], page_size_for_large_streams: int, max_concurrent_repositories: int = 1, **kwargs):
         super().__init__(**kwargs)
         self.repositories = repositories
         # GitHub pagination could be from 1 to 100.
         # This parameter is deprecated and in future will be used sane default, page_size: 10
         self.page_size = page_size_for_large_streams if self.large_stream else constants.DEFAULT_PAGE_SIZE
+        self.max_concurrent_repositories = max_concurrent_repositories
+        self._prefetcher: Optional[RepositoryPrefetcher] = None
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/{self.name}"
 
     def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
-        for repository in self.repositories:
-            yield {"repository": repository}
+        stream_slices = [{"repository": repository} for repository in self.repositories]
+        slices_to_prefetch = self._get_slices_to_prefetch(stream_slices)
+        max_workers = self._get_prefetch_workers(len(slices_to_prefetch))
+        if max_workers <= 1:
+            yield from stream_slices
+            return
+
+        stream_state = kwargs.get("stream_state") or {}
+        self._prefetcher = RepositoryPrefetcher(
+            fetch_records=lambda stream_slice: self._fetch_repository_records(stream_slice, stream_state),
+            stream_slices=slices_to_prefetch,
+            max_workers=max_workers,
+        )
+        try:
+            yield from stream_slices
+        finally:
+            self._prefetcher.close()
+            self._prefetcher = None
+
+    def _get_slices_to_prefetch(self, stream_slices: List[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+        if not self.concurrent_repositories or self.max_concurrent_repositories <= 1:
+            return []
+        cursor = self.get_cursor()
+        if isinstance(cursor, SubstreamResumableFullRefreshCursor):
+            # the repositories completed by a previous attempt are skipped by the sync
+            return [
+                stream_slice
+                for stream_slice in stream_slices
+                if cursor.select_state(StreamSlice(partition=stream_slice, cursor_slice={})) != FULL_REFRESH_COMPLETE_STATE
+            ]
+        return stream_slices
+
+    def _get_prefetch_workers(self, repositories_count: int) -> int:
+        """One worker per repository up to `max_concurrent_repositories`, and no more than the requests left to all tokens"""
+        max_workers = min(self.max_concurrent_repositories, repositories_count)
+        remaining_requests = getattr(self._http_client._session.auth, "remaining_requests", None)
+        if remaining_requests:
+            max_workers = min(max_workers, remaining_requests())
+        return max_workers
+
+    def _fetch_repository_records(self, stream_slice: Mapping[str, Any], stream_state: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
+        """The pages loop of `HttpStream._read_pages`, the slice is closed once the sync consumed the records"""
+        next_page_token = None
+        while True:
+            _, response = self._fetch_next_page(stream_slice, stream_state, next_page_token)
+            yield from self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                return
+
+    def _read_pages(self, records_generator_fn, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None):
+        records = self._prefetcher.records(stream_slice["repository"]) if self._prefetcher else None
+        if records is None:
+            yield from super()._read_pages(records_generator_fn, stream_slice, stream_state)
+            return
+
+        yield from records
+        cursor = self.get_cursor()
+        if isinstance(cursor, SubstreamResumableFullRefreshCursor):
+            partition, _, _ = self._extract_slice_fields(stream_slice=stream_slice)
+            cursor.close_slice(StreamSlice(cursor_slice={}, partition=partition))
 
     def get_error_display_message(self, exception: BaseException) -> Optional[str]:
         if (
@@ -368,6 +457,9 @@ class RepositoryStats(GithubStream):
     API docs: https://docs.github.com/en/rest/reference/repos#get-a-repository
     """
 
+    concurrent_repositories = True
+    use_etag_cache = True
+
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}"
 
@@ -380,13 +472,18 @@ class Assignees(GithubStream):
     API docs: https://docs.github.com/en/rest/issues/assignees?apiVersion=2022-11-28#list-assignees
     """
 
+    concurrent_repositories = True
+    use_etag_cache = True
+
 
 class Branches(GithubStream):
     """
     API docs: https://docs.github.com/en/rest/branches/branches?apiVersion=2022-11-28#list-branches
     """
 
+    concurrent_repositories = True
     primary_key = ["repository", "name"]
+    use_etag_cache = True
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/branches"
@@ -397,12 +494,18 @@ class Collaborators(GithubStream):
     API docs: https://docs.github.com/en/rest/collaborators/collaborators?apiVersion=2022-11-28#list-repository-collaborators
     """
 
+    concurrent_repositories = True
+    use_etag_cache = True
+
 
 class IssueLabels(GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/labels?apiVersion=2022-11-28#list-labels-for-a-repository
     """
 
+    concurrent_repositories = True
+    use_etag_cache = True
+
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/labels"
 
@@ -465,7 +568,9 @@ class Tags(GithubStream):
     API docs: https://docs.github.com/en/rest/repos/repos?apiVersion=2022-11-28#list-repository-tags
     """
 
+    concurrent_repositories = True
     primary_key = ["repository", "name"]
+    use_etag_cache = True
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/tags"
@@ -477,6 +582,7 @@ class Teams(Organizations):
     """
 
     use_cache = True
+    use_etag_cache = True
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"orgs/{stream_slice['organization']}/teams"
@@ -507,6 +613,7 @@ class Releases(SemiIncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/releases/releases?apiVersion=2022-11-28#list-releases
     """
 
+    concurrent_repositories = True
     cursor_field = "created_at"
 
     def transform(self, record: MutableMapping[str, Any], stream_slice: Mapping[str, Any]) -> MutableMapping[str, Any]:
@@ -525,6 +632,7 @@ class Events(SemiIncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/activity/events?apiVersion=2022-11-28#list-repository-events
     """
 
+    concurrent_repositories = True
     cursor_field = "created_at"
 
 
@@ -582,6 +690,7 @@ class CommitComments(SemiIncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/commits/comments?apiVersion=2022-11-28#list-commit-comments-for-a-repository
     """
 
+    concurrent_repositories = True
     use_cache = True
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
@@ -593,6 +702,7 @@ class IssueMilestones(SemiIncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/issues/milestones?apiVersion=2022-11-28#list-milestones
     """
 
+    concurrent_repositories = True
     is_sorted = "desc"
     stream_base_params = {
         "state": "all",
@@ -609,6 +719,7 @@ class Stargazers(SemiIncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/activity/starring?apiVersion=2022-11-28#list-stargazers
     """
 
+    concurrent_repositories = True
     primary_key = "user_id"
     cursor_field = "starred_at"
 
@@ -635,6 +746,7 @@ class Projects(SemiIncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/projects/projects?apiVersion=2022-11-28#list-repository-projects
     """
 
+    concurrent_repositories = True
     use_cache = True
     stream_base_params = {
         "state": "all",
@@ -654,6 +766,7 @@ class IssueEvents(SemiIncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/issues/events?apiVersion=2022-11-28#list-issue-events-for-a-repository
     """
 
+    concurrent_repositories = True
     cursor_field = "created_at"
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
@@ -668,6 +781,7 @@ class Comments(IncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/issues/comments?apiVersion=2022-11-28#list-issue-comments-for-a-repository
     """
 
+    concurrent_repositories = True
     use_cache = True
     large_stream = True
     max_retries = 7
@@ -763,6 +877,7 @@ class Issues(IncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/issues/issues?apiVersion=2022-11-28#list-repository-issues
     """
 
+    concurrent_repositories = True
     use_cache = True
     large_stream = True
     is_sorted = "asc"
@@ -779,6 +894,7 @@ class ReviewComments(IncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/pulls/comments?apiVersion=2022-11-28#list-review-comments-in-a-repository
     """
 
+    concurrent_repositories = True
     use_cache = True
     large_stream = True
 
@@ -843,12 +959,8 @@ class PullRequestStats(SemiIncrementalMixin, GitHubGraphQLStream):
         next_page_token: Mapping[str, Any] = None,
     ) -> Optional[Mapping]:
         organization, name = stream_slice["repository"].split("/")
-        if next_page_token:
-            next_page_token = next_page_token["after"]
-        query = get_query_pull_requests(
-            owner=organization, name=name, first=self.page_size, after=next_page_token, direction=self.is_sorted.upper()
-        )
-        return {"query": query}
+        query = get_query_pull_requests(owner=organization, name=name, first=self.page_size, direction=self.is_sorted.upper())
+        return {"query": query, "variables": {"after": next_page_token["after"] if next_page_token else None}}
 
     def request_headers(self, **kwargs) -> Mapping[str, Any]:
         base_headers = super().request_headers(**kwargs)
@@ -925,10 +1037,9 @@ class Reviews(SemiIncrementalMixin, GitHubGraphQLStream):
         next_page_token: Mapping[str, Any] = None,
     ) -> Optional[Mapping]:
         organization, name = stream_slice["repository"].split("/")
-        if not next_page_token:
-            next_page_token = {"after": None}
-        query = get_query_reviews(owner=organization, name=name, first=self.page_size, **next_page_token)
-        return {"query": query}
+        next_page_token = next_page_token or {}
+        query = get_query_reviews(owner=organization, name=name, first=self.page_size, number=next_page_token.get("number"))
+        return {"query": query, "variables": {"after": next_page_token.get("after")}}
 
 
 class PullRequestCommits(GithubStream):
@@ -994,12 +1105,8 @@ class ProjectsV2(SemiIncrementalMixin, GitHubGraphQLStream):
         next_page_token: Mapping[str, Any] = None,
     ) -> Optional[Mapping]:
         organization, name = stream_slice["repository"].split("/")
-        if next_page_token:
-            next_page_token = next_page_token["after"]
-        query = get_query_projectsV2(
-            owner=organization, name=name, first=self.page_size, after=next_page_token, direction=self.is_sorted.upper()
-        )
-        return {"query": query}
+        query = get_query_projectsV2(owner=organization, name=name, first=self.page_size, direction=self.is_sorted.upper())
+        return {"query": query, "variables": {"after": next_page_token["after"] if next_page_token else None}}
 
 
 # Reactions streams
@@ -1157,10 +1264,9 @@ class IssueReactions(SemiIncrementalMixin, GitHubGraphQLStream):
         next_page_token: Mapping[str, Any] = None,
     ) -> Optional[Mapping]:
         organization, name = stream_slice["repository"].split("/")
-        if not next_page_token:
-            next_page_token = {"after": None}
-        query = get_query_issue_reactions(owner=organization, name=name, first=self.page_size, **next_page_token)
-        return {"query": query}
+        next_page_token = next_page_token or {}
+        query = get_query_issue_reactions(owner=organization, name=name, first=self.page_size, number=next_page_token.get("number"))
+        return {"query": query, "variables": {"after": next_page_token.get("after")}}
 
 
 class PullRequestCommentReactions(SemiIncrementalMixin, GitHubGraphQLStream):
@@ -1284,6 +1390,8 @@ class Deployments(SemiIncrementalMixin, GithubStream):
     API docs: https://docs.github.com/en/rest/deployments/deployments?apiVersion=2022-11-28#list-deployments
     """
 
+    concurrent_repositories = True
+
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/deployments"
 
@@ -1441,6 +1549,8 @@ class Workflows(SemiIncrementalMixin, GithubStream):
     API documentation: https://docs.github.com/en/rest/actions/workflows?apiVersion=2022-11-28#list-repository-workflows
     """
 
+    concurrent_repositories = True
+
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/actions/workflows"
 
@@ -1460,6 +1570,8 @@ class WorkflowRuns(SemiIncrementalMixin, GithubStream):
     API documentation: https://docs.github.com/en/rest/actions/workflow-runs?apiVersion=2022-11-28#list-workflow-runs-for-a-repository
     """
 
+    concurrent_repositories = True
+
     # key for accessing slice value from record
     record_slice_key = ["repository", "full_name"]
 
@@ -1637,6 +1749,8 @@ class ContributorActivity(GithubStream):
     API docs: https://docs.github.com/en/rest/metrics/statistics?apiVersion=2022-11-28#get-all-contributor-commit-activity
     """
 
+    concurrent_repositories = True
+
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/stats/contributors"
 
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from datetime import timedelta
@@ -56,14 +57,19 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
     If a token exceeds the capacity limit, the system switches to another token.
     If all tokens are exhausted, the system will enter a sleep state until
     the first token becomes available again.
+    With `spread_requests` every request takes the token with the most remaining requests instead,
+    so the repositories read concurrently are spread over all the tokens.
     """
 
     DURATION = timedelta(seconds=3600)  # Duration at which the current rate limit window resets
 
-    def __init__(self, tokens: List[str], auth_method: str = "token", auth_header: str = "Authorization"):
+    def __init__(self, tokens: List[str], auth_method: str = "token", auth_header: str = "Authorization", spread_requests: bool = False):
         self._logger = logging.getLogger("airbyte")
         self._auth_method = auth_method
         self._auth_header = auth_header
+        self._spread_requests = spread_requests
+        # the requests of the concurrent reads are counted against the tokens one at a time
+        self._lock = threading.RLock()
         self._tokens = {t: Token() for t in tokens}
         # It would've been nice to instantiate a single client on this authenticator. However, we are checking
         # the limits of each token which is associated with a TokenAuthenticator. And each HttpClient can only
@@ -97,25 +103,42 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
 
     def __call__(self, request):
         """Attach the HTTP headers required to authenticate on the HTTP request"""
-        while True:
-            current_token = self._tokens[self.current_active_token]
-            if "graphql" in request.path_url:
-                if self.process_token(current_token, "count_graphql", "reset_at_graphql"):
-                    break
-            else:
-                if self.process_token(current_token, "count_rest", "reset_at_rest"):
+        count_attr, reset_attr = ("count_graphql", "reset_at_graphql") if "graphql" in request.path_url else ("count_rest", "reset_at_rest")
+        with self._lock:
+            while True:
+                if self._spread_requests:
+                    self._active_token = max(self._tokens, key=lambda token: getattr(self._tokens[token], count_attr))
+                current_token = self._tokens[self.current_active_token]
+                if self.process_token(current_token, count_attr, reset_attr):
                     break
+            auth_header = self.get_auth_header()
 
-        request.headers.update(self.get_auth_header())
+        request.headers.update(auth_header)
 
         return request
 
+    def release_request(self, request) -> None:
+        """Give back a request which didn't count against the rate limit of its token, e.g. a `304 Not Modified`"""
+        token = self._tokens.get(request.headers.get(self.auth_header, "").removeprefix(f"{self._auth_method} "))
+        if token:
+            with self._lock:
+                if "graphql" in request.path_url:
+                    token.count_graphql += 1
+                else:
+                    token.count_rest += 1
+
+    def remaining_requests(self, count_attr: str = "count_rest") -> int:
+        """The requests left to all the tokens in the current rate limit windows"""
+        with self._lock:
+            return sum(getattr(token, count_attr) for token in self._tokens.values())
+
     @property
     def current_active_token(self) -> str:
         return self._active_token
 
     def update_token(self) -> None:
-        self._active_token = next(self._tokens_iter)
+        with self._lock:
+            self._active_token = next(self._tokens_iter)
 
     @property
     def token(self) -> str:
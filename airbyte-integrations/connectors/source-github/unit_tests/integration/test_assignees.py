@@ -79,9 +79,9 @@ class AssigneesTest(TestCase):
             HttpResponse(json.dumps({"full_name": "airbytehq/mock-test-2", "default_branch": "master"}), 200),
         )
 
-    def teardown(self):
+    def tearDown(self):
         """Stops and resets HttpMocker instance."""
-        self.r_mock.__exit__()
+        self.r_mock.__exit__(None, None, None)
 
     def test_read_full_refresh_emits_per_partition_state(self):
         """Ensure http integration and per-partition state is emitted correctly"""
@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+import responses
+from source_github import streams
+from source_github.streams import Branches
+from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
+
+
+_BRANCHES_URL = "https://api.github.com/repos/airbytehq/airbyte/branches"
+_RATE_LIMIT_RESPONSE = {
+    "resources": {
+        "core": {"limit": 5000, "used": 0, "remaining": 5000, "reset": 4070908800},
+        "graphql": {"limit": 5000, "used": 0, "remaining": 5000, "reset": 4070908800},
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def etag_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(streams, "ETAG_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _branches_stream(authenticator=None) -> Branches:
+    return Branches(repositories=["airbytehq/airbyte"], page_size_for_large_streams=100, authenticator=authenticator)
+
+
+def _add_branch_pages(first_page_status: int = 200, second_page_status: int = 200) -> None:
+    responses.add(
+        responses.GET,
+        f"{_BRANCHES_URL}?per_page=100",
+        body='[{"name": "master"}]' if first_page_status == 200 else "",
+        status=first_page_status,
+        headers={"ETag": '"etag-1"', "Link": f'<{_BRANCHES_URL}?per_page=100&page=2>; rel="next"'},
+        match=[responses.matchers.query_string_matcher("per_page=100")],
+    )
+    responses.add(
+        responses.GET,
+        f"{_BRANCHES_URL}?per_page=100&page=2",
+        body='[{"name": "develop"}]' if second_page_status == 200 else "",
+        status=second_page_status,
+        headers={"ETag": '"etag-2"'},
+        match=[responses.matchers.query_string_matcher("per_page=100&page=2")],
+    )
+
+
+@responses.activate
+def test_not_modified_pages_are_replayed_from_cache():
+    _add_branch_pages()
+    first_sync = list(read_full_refresh(_branches_stream()))
+
+    responses.reset()
+    _add_branch_pages(first_page_status=304, second_page_status=304)
+    stream = _branches_stream()
+    second_sync = list(read_full_refresh(stream))
+
+    assert [record["name"] for record in first_sync] == ["master", "develop"]
+    assert second_sync == first_sync
+    assert [call.request.headers["If-None-Match"] for call in responses.calls] == ['"etag-1"', '"etag-2"']
+    assert stream.etag_cache_adapter.not_modified == 2
+
+
+@responses.activate
+def test_modified_page_is_downloaded_and_cached_again():
+    _add_branch_pages()
+    list(read_full_refresh(_branches_stream()))
+
+    responses.reset()
+    _add_branch_pages(first_page_status=304)
+    responses.replace(
+        responses.GET,
+        f"{_BRANCHES_URL}?per_page=100&page=2",
+        json=[{"name": "release"}],
+        headers={"ETag": '"etag-3"'},
+        match=[responses.matchers.query_string_matcher("per_page=100&page=2")],
+    )
+    stream = _branches_stream()
+    records = list(read_full_refresh(stream))
+
+    assert [record["name"] for record in records] == ["master", "release"]
+    assert (stream.etag_cache_adapter.not_modified, stream.etag_cache_adapter.modified) == (1, 1)
+
+
+@responses.activate
+def test_not_modified_requests_are_released_to_the_rate_limiter():
+    responses.add(responses.GET, "https://api.github.com/rate_limit", json=_RATE_LIMIT_RESPONSE)
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1"])
+    _add_branch_pages()
+    list(read_full_refresh(_branches_stream(authenticator)))
+    assert authenticator._tokens["token1"].count_rest == 4998
+
+    responses.reset()
+    _add_branch_pages(first_page_status=304, second_page_status=304)
+    list(read_full_refresh(_branches_stream(authenticator)))
+
+    assert authenticator._tokens["token1"].count_rest == 4998
+
+
+def test_streams_without_etag_cache_do_not_mount_the_adapter():
+    stream = streams.Releases(repositories=["airbytehq/airbyte"], page_size_for_large_streams=100)
+
+    assert not hasattr(stream, "etag_cache_adapter")
@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import re
+import threading
+import time
+from typing import List
+from unittest.mock import patch
+
+import responses
+from source_github.streams import Tags
+from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
+
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.core import StreamSlice
+
+
+_REPOSITORIES = ["airbytehq/airbyte", "airbytehq/integration-test", "airbytehq/connector-test", "airbytehq/docs"]
+
+
+def _tags_stream(max_concurrent_repositories: int, authenticator=None) -> Tags:
+    return Tags(
+        repositories=_REPOSITORIES,
+        page_size_for_large_streams=100,
+        max_concurrent_repositories=max_concurrent_repositories,
+        authenticator=authenticator,
+    )
+
+
+def _mock_tags(delay: float = 0.0, repositories: List[str] = _REPOSITORIES) -> dict:
+    # `responses` rather than `requests_mock`, the latter sends the requests one at a time
+    concurrency = {"current": 0, "max": 0}
+    lock = threading.Lock()
+
+    def tags(request):
+        with lock:
+            concurrency["current"] += 1
+            concurrency["max"] = max(concurrency["max"], concurrency["current"])
+        time.sleep(delay)
+        with lock:
+            concurrency["current"] -= 1
+        repository = request.path_url.split("/")[3]
+        if "page=2" in request.url:
+            return 200, {}, json.dumps([{"name": f"{repository}-2"}])
+        link = f'<https://api.github.com/repos/airbytehq/{repository}/tags?per_page=100&page=2>; rel="next"'
+        return 200, {"Link": link}, json.dumps([{"name": f"{repository}-1"}])
+
+    for repository in repositories:
+        responses.add_callback(responses.GET, re.compile(re.escape(f"https://api.github.com/repos/{repository}/tags")), callback=tags)
+    return concurrency
+
+
+@responses.activate
+def test_repositories_are_read_concurrently_in_the_order_of_the_slices():
+    concurrency = _mock_tags(delay=0.1)
+
+    records = list(read_full_refresh(_tags_stream(max_concurrent_repositories=4)))
+
+    assert [record["name"] for record in records] == [
+        f"{repository.split('/')[1]}-{page}" for repository in _REPOSITORIES for page in (1, 2)
+    ]
+    assert [record["repository"] for record in records[::2]] == _REPOSITORIES
+    assert concurrency["max"] > 1
+
+
+@responses.activate
+def test_repositories_are_read_one_after_another_by_default():
+    concurrency = _mock_tags(delay=0.01)
+
+    stream = _tags_stream(max_concurrent_repositories=1)
+    records = list(read_full_refresh(stream))
+
+    assert len(records) == 8
+    assert concurrency["max"] == 1
+
+
+@responses.activate
+def test_repositories_are_checkpointed_once_their_records_are_consumed():
+    _mock_tags()
+    stream = _tags_stream(max_concurrent_repositories=4)
+
+    slices = stream.stream_slices(sync_mode=SyncMode.full_refresh)
+    first_slice = StreamSlice(partition=next(slices), cursor_slice={})
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=first_slice))
+    slices.close()
+
+    assert [record["name"] for record in records] == ["airbyte-1", "airbyte-2"]
+    assert stream.state == {
+        "states": [{"partition": {"repository": "airbytehq/airbyte"}, "cursor": {"__ab_full_refresh_sync_complete": True}}]
+    }
+
+
+@responses.activate
+def test_completed_repositories_are_not_read_ahead():
+    _mock_tags()
+    stream = _tags_stream(max_concurrent_repositories=4)
+    stream.state = {"states": [{"partition": {"repository": "airbytehq/airbyte"}, "cursor": {"__ab_full_refresh_sync_complete": True}}]}
+
+    slices = stream.stream_slices(sync_mode=SyncMode.full_refresh)
+    next(slices)
+
+    assert stream._prefetcher.records("airbytehq/airbyte") is None
+    assert [record["name"] for record in stream._prefetcher.records("airbytehq/docs")] == ["docs-1", "docs-2"]
+    slices.close()
+    assert stream._prefetcher is None
+
+
+@responses.activate
+@patch("time.sleep")
+def test_failed_repository_is_reported_in_its_slice(sleep_mock):
+    responses.add(responses.GET, "https://api.github.com/repos/airbytehq/connector-test/tags", status=404, json={"message": "Not Found"})
+    _mock_tags(repositories=["airbytehq/airbyte", "airbytehq/integration-test", "airbytehq/docs"])
+
+    records = list(read_full_refresh(_tags_stream(max_concurrent_repositories=4)))
+
+    assert [record["repository"] for record in records[::2]] == ["airbytehq/airbyte", "airbytehq/integration-test", "airbytehq/docs"]
+
+
+def test_workers_are_limited_by_the_remaining_requests(requests_mock):
+    rate_limit = {"limit": 5000, "used": 4999, "remaining": 1, "reset": 4070908800}
+    requests_mock.get("https://api.github.com/rate_limit", json={"resources": {"core": rate_limit, "graphql": rate_limit}})
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2"], spread_requests=True)
+
+    assert authenticator.remaining_requests() == 2
+    assert _tags_stream(max_concurrent_repositories=4, authenticator=authenticator)._get_prefetch_workers(4) == 2
+
+
+@responses.activate
+def test_spread_requests_take_the_token_with_the_most_remaining_requests():
+    rate_limit = {"limit": 5000, "used": 0, "remaining": 5000, "reset": 4070908800}
+    responses.add(responses.GET, "https://api.github.com/rate_limit", json={"resources": {"core": rate_limit, "graphql": rate_limit}})
+    _mock_tags()
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2", "token3"], spread_requests=True)
+    authenticator._tokens["token1"].count_rest = 4000
+
+    list(read_full_refresh(_tags_stream(max_concurrent_repositories=4, authenticator=authenticator)))
+
+    assert [token.count_rest for token in authenticator._tokens.values()] == [4000, 4996, 4996]
@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+
+_CONNECTOR_DIR = Path(__file__).parent.parent
+# times the startup of the connector and its `spec` and `check`, in a fresh interpreter so nothing is imported yet
+_STARTUP_SCRIPT = """
+import json, logging, sys, time
+
+start = time.perf_counter()
+from source_github import SourceGithub
+import_seconds = time.perf_counter() - start
+
+import requests_mock
+
+logger = logging.getLogger("airbyte")
+source = SourceGithub()
+start = time.perf_counter()
+source.spec(logger)
+spec_seconds = time.perf_counter() - start
+
+with requests_mock.Mocker() as mocker:
+    rate_limit = {"limit": 5000, "used": 0, "remaining": 5000, "reset": 4070908800}
+    mocker.get("https://api.github.com/rate_limit", json={"resources": {"core": rate_limit, "graphql": rate_limit}})
+    mocker.get("https://api.github.com/repos/airbytehq/airbyte", json={"full_name": "airbytehq/airbyte"})
+    start = time.perf_counter()
+    status = source.check(logger, {"access_token": "test_token", "repository": "airbytehq/airbyte"})
+    check_seconds = time.perf_counter() - start
+
+schema_imported = "source_github.github_schema" in sys.modules
+start = time.perf_counter()
+import source_github.github_schema
+schema_import_seconds = time.perf_counter() - start
+
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "spec_seconds": spec_seconds,
+    "check_seconds": check_seconds,
+    "status": status.status.value,
+    "schema_imported": schema_imported,
+    "schema_import_seconds": schema_import_seconds,
+}))
+"""
+
+
+def test_benchmark_spec_and_check_startup_do_not_import_graphql_schema():
+    output = subprocess.run([sys.executable, "-c", _STARTUP_SCRIPT], cwd=_CONNECTOR_DIR, capture_output=True, check=True, text=True)
+    startup = json.loads(output.stdout.strip().splitlines()[-1])
+
+    assert startup["status"] == "SUCCEEDED"
+    assert not startup["schema_imported"]
+    logging.getLogger("airbyte").info(
+        f"import {startup['import_seconds']:.3f}s, spec {startup['spec_seconds']:.3f}s, check {startup['check_seconds']:.3f}s, "
+        f"deferred GraphQL schema import {startup['schema_import_seconds']:.3f}s"
+    )
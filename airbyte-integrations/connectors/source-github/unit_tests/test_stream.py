@@ -1493,3 +1493,14 @@ def test_pull_request_stats(requests_mock):
 
     list(read_full_refresh(stream))
     assert query == expected_query
+
+
+def test_pull_request_stats_query_is_the_same_for_each_page():
+    stream = PullRequestStats(page_size_for_large_streams=10, repositories=["airbytehq/airbyte"])
+    stream_slice = {"repository": "airbytehq/airbyte"}
+
+    first_page = stream.request_body_json(stream_state={}, stream_slice=stream_slice)
+    next_page = stream.request_body_json(stream_state={}, stream_slice=stream_slice, next_page_token={"after": "Y3Vyc29yOjEw"})
+
+    assert next_page["query"] is first_page["query"]
+    assert (first_page["variables"], next_page["variables"]) == ({"after": None}, {"after": "Y3Vyc29yOjEw"})
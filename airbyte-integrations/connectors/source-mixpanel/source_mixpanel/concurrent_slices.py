@@ -0,0 +1,133 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Callable, Deque, Iterator, List, Mapping, Optional, Tuple
+
+
+SPOOL_READ_SIZE = 1024 * 1024
+
+
+class TokenBucket:
+    """
+    Paces the requests shared by several threads: a token is added every `1 / rate` seconds, up to `capacity` tokens.
+    With a capacity of 1 two requests are never closer than `1 / rate` seconds, as with a sleep after each request.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1, clock: Callable[[], float] = time.monotonic):
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, stop: threading.Event) -> bool:
+        """Wait for a token, False if `stop` is set in the meantime"""
+        while not stop.is_set():
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                delay = (1 - self._tokens) / self._rate
+            stop.wait(delay)
+        return False
+
+
+def slice_key(stream_slice: Mapping[str, Any]) -> Tuple[str, str]:
+    return stream_slice["start_date"], stream_slice["end_date"]
+
+
+class ConcurrentSliceReader:
+    """
+    Downloads the upcoming date windows of a stream in worker threads while the sync decodes the current one.
+
+    The windows are submitted in the order of the slices, at most `max_ahead` of them ahead of the sync, and each
+    request waits for a token of the shared `limiter`. `download` spools the response body of a window to a temporary
+    file, so the connections aren't held open while the sync catches up. The bodies are handed over in the order of the
+    slices in the thread of the sync, which keeps the records and the state checkpoints in the order of the sequential read.
+    """
+
+    def __init__(
+        self,
+        download: Callable[[Mapping[str, Any]], Optional[IO[bytes]]],
+        stream_slices: List[Mapping[str, Any]],
+        max_workers: int,
+        limiter: Optional[TokenBucket] = None,
+        max_ahead: Optional[int] = None,
+    ):
+        self._download = download
+        self._limiter = limiter
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._slices = iter(stream_slices)
+        self._pending: Deque[Tuple[Tuple[str, str], Future]] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export")
+        for _ in range(max_ahead or 2 * max_workers):
+            self._submit_next()
+
+    def __enter__(self) -> "ConcurrentSliceReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            while self._pending:
+                _, future = self._pending.popleft()
+                future.add_done_callback(self._discard)
+
+    def chunks(self, stream_slice: Mapping[str, Any]) -> Optional[Iterator[bytes]]:
+        """
+        The response body of a window by chunks, None if it isn't downloaded ahead.
+        The windows before it are not going to be asked for anymore, their downloads are dropped.
+        """
+        key = slice_key(stream_slice)
+        with self._lock:
+            if all(pending_key != key for pending_key, _ in self._pending):
+                return None
+            while True:
+                pending_key, future = self._pending.popleft()
+                self._submit_next()
+                if pending_key == key:
+                    return self._read(future)
+                future.add_done_callback(self._discard)
+
+    def _submit_next(self) -> None:
+        stream_slice = next(self._slices, None)
+        if stream_slice is not None:
+            self._pending.append((slice_key(stream_slice), self._executor.submit(self._fetch, stream_slice)))
+
+    def _fetch(self, stream_slice: Mapping[str, Any]) -> Optional[IO[bytes]]:
+        if self._limiter and not self._limiter.acquire(self._stop):
+            return None
+        if self._stop.is_set():
+            return None
+        return self._download(stream_slice)
+
+    @staticmethod
+    def _read(future: Future) -> Iterator[bytes]:
+        # re-raises the error of the download in the slice it belongs to
+        spooled = future.result()
+        if spooled is None:
+            return
+        with spooled:
+            spooled.seek(0)
+            while True:
+                chunk = spooled.read(SPOOL_READ_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+
+    @staticmethod
+    def _discard(future: Future) -> None:
+        if not future.cancelled() and future.exception() is None and future.result() is not None:
+            future.result().close()
@@ -3,7 +3,12 @@
 #
 
 from collections import defaultdict
-from typing import Iterable, Iterator, NamedTuple
+from functools import lru_cache
+from typing import Iterable, Iterator, NamedTuple, Tuple
+
+
+# the distinct property name sets kept, Export events of the same kind share the same set
+PROPERTY_NAMES_CACHE_SIZE = 4096
 
 
 class TransformationResult(NamedTuple):
@@ -36,3 +41,12 @@ def transform_property_names(property_names: Iterable[str]) -> Iterator[Transfor
 
         lowercase_properties.add(lowercase_property_name)
         yield TransformationResult(source_name=property_name, transformed_name=property_name_transformed)
+
+
+@lru_cache(maxsize=PROPERTY_NAMES_CACHE_SIZE)
+def transform_property_names_cached(property_names: Tuple[str, ...]) -> Tuple[TransformationResult, ...]:
+    """
+    Same as `transform_property_names`, memoized by the property names,
+    which repeat for every record of the same kind.
+    """
+    return tuple(transform_property_names(property_names))
@@ -1,11 +1,12 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 
 import json
+import tempfile
 import time
 from abc import ABC
 from datetime import timedelta
 from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import IO, Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 import pendulum
 import requests
@@ -17,9 +18,19 @@ from airbyte_cdk.models import FailureType, SyncMode
 from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler, ErrorResolution, HttpStatusErrorHandler, ResponseAction
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
-from source_mixpanel.property_transformation import transform_property_names
+from source_mixpanel.concurrent_slices import ConcurrentSliceReader, TokenBucket, slice_key
+from source_mixpanel.property_transformation import transform_property_names, transform_property_names_cached
 
-from .utils import fix_date_time
+from .utils import fix_date_time, iter_lines, json_loads, timestamp_to_iso8601
+
+
+# the Export API responses are read by chunks of this many bytes, rather than the 512 bytes of `response.iter_lines`
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
+
+def is_timezone_mismatch(response: requests.Response) -> bool:
+    """The date window ends after today in the timezone of the Mixpanel project"""
+    return response.status_code == requests.codes.bad_request and "to_date cannot be later than today" in response.text
 
 
 class MixpanelStreamBackoffStrategy(BackoffStrategy):
@@ -181,10 +192,14 @@ class DateSlicesMixin:
         super().__init__(*args, **kwargs)
         self._timezone_mismatch = False
 
-    def parse_response(self, *args, **kwargs):
+    def parse_response(self, response: requests.Response, *args, **kwargs):
         if self._timezone_mismatch:
             return []
-        yield from super().parse_response(*args, **kwargs)
+        if is_timezone_mismatch(response):
+            # the sync stops at this window, the error handler has ignored the response
+            self._timezone_mismatch = True
+            return []
+        yield from super().parse_response(response, *args, **kwargs)
 
     def stream_slices(
         self, sync_mode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
@@ -255,8 +270,7 @@ class ExportErrorHandler(HttpStatusErrorHandler):
     def interpret_response(self, response_or_exception: Optional[Union[requests.Response, Exception]] = None) -> ErrorResolution:
         if isinstance(response_or_exception, requests.Response):
             if response_or_exception.status_code == requests.codes.bad_request:
-                if "to_date cannot be later than today" in response_or_exception.text:
-                    self.stream._timezone_mismatch = True
+                if is_timezone_mismatch(response_or_exception):
                     message = (
                         "Your project timezone must be misconfigured. Please set it to the one defined in your Mixpanel project settings. "
                         "Stopping current stream sync."
@@ -379,6 +393,9 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
     Raw Export API Rate Limit (https://help.mixpanel.com/hc/en-us/articles/115004602563-Rate-Limits-for-API-Endpoints):
      A maximum of 100 concurrent queries,
      3 queries per second and 60 queries per hour.
+
+    With `num_workers` above 1 the date windows are downloaded concurrently, the requests are spaced by the hourly limit
+    rather than by a sleep after reading each response.
     """
 
     primary_key: str = None
@@ -386,6 +403,13 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
 
     transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
 
+    def __init__(self, *args, num_workers: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_workers = num_workers
+        self._slice_reader: Optional[ConcurrentSliceReader] = None
+        # the windows downloaded ahead which end after today in the project timezone, the sync stops when it reaches one
+        self._mismatched_windows: Set[Tuple[str, str]] = set()
+
     @property
     def url_base(self):
         prefix = "-eu" if self.region == "EU" else ""
@@ -397,19 +421,24 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
     def get_error_handler(self) -> Optional[ErrorHandler]:
         return ExportErrorHandler(logger=self.logger, stream=self)
 
+    def request_headers(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Mapping[str, Any]:
+        return {**super().request_headers(stream_state, stream_slice, next_page_token), "Accept-Encoding": "gzip"}
+
     def iter_dicts(self, lines):
         """
-        The incoming stream has to be JSON lines format.
+        The incoming stream has to be JSON lines format, the lines are either bytes or strings.
         From time to time for some reason, the one record can be split into multiple lines.
         We try to combine such split parts into one record only if parts go nearby.
         """
         parts = []
         for record_line in lines:
-            if record_line == "terminated early":
+            if record_line in ("terminated early", b"terminated early"):
                 self.logger.warning(f"Couldn't fetch data from Export API. Response: {record_line}")
                 return
             try:
-                yield json.loads(record_line)
+                yield json_loads(record_line)
             except ValueError:
                 parts.append(record_line)
             else:
@@ -417,12 +446,25 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
 
             if len(parts) > 1:
                 try:
-                    yield json.loads("".join(parts))
+                    yield json_loads(parts[0][:0].join(parts))
                 except ValueError:
                     pass
                 else:
                     parts = []
 
+    def transform_record(self, record: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Flatten an Export event, its property names are transformed and its values converted to strings"""
+        item = {"event": record["event"]}
+        properties = record["properties"]
+        # Convert all values to string (this is default property type)
+        # because API does not provide properties type information
+        property_names = transform_property_names_cached(tuple(properties))
+        item.update({transformed_name: str(properties[source_name]) for source_name, transformed_name in property_names})
+
+        # convert timestamp to datetime string
+        item["time"] = timestamp_to_iso8601(int(item["time"]))
+        return item
+
     def process_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
         """Export API return response in JSONL format but each line is a valid JSON object
         Raw item example:
@@ -443,20 +485,67 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
             }
         """
 
-        # We prefer response.iter_lines() to response.text.split_lines() as the later can missparse text properties embeding linebreaks
-        for record in self.iter_dicts(response.iter_lines(decode_unicode=True)):
-            # transform record into flat dict structure
-            item = {"event": record["event"]}
-            properties = record["properties"]
-            for result in transform_property_names(properties.keys()):
-                # Convert all values to string (this is default property type)
-                # because API does not provide properties type information
-                item[result.transformed_name] = str(properties[result.source_name])
+        yield from self.process_chunks(response.iter_content(chunk_size=EXPORT_CHUNK_SIZE))
 
-            # convert timestamp to datetime string
-            item["time"] = pendulum.from_timestamp(int(item["time"]), tz="UTC").to_iso8601_string()
+    def process_chunks(self, chunks: Iterable[bytes]) -> Iterable[Mapping]:
+        """The records of an Export API response body read by chunks, either plain or gzip compressed"""
+        # The bytes are split at "\n" only, rather than by str.splitlines(), which also splits at the unicode line separators
+        # of text properties. The lines are parsed from bytes, without decoding them first.
+        for record in self.iter_dicts(iter_lines(chunks)):
+            yield self.transform_record(record)
 
-            yield item
+    def stream_slices(
+        self, sync_mode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        stream_slices = super().stream_slices(sync_mode, cursor_field=cursor_field, stream_state=stream_state)
+        if self.num_workers <= 1:
+            yield from stream_slices
+            return
+
+        stream_slices = list(stream_slices)
+        # a single token: two requests are never closer than the sleep of the sequential read
+        limiter = TokenBucket(rate=self.reqs_per_hour_limit / 3600) if self.reqs_per_hour_limit > 0 else None
+        self._slice_reader = ConcurrentSliceReader(
+            download=lambda stream_slice: self._download_slice(stream_slice, stream_state or {}),
+            stream_slices=stream_slices,
+            max_workers=min(self.num_workers, len(stream_slices)) or 1,
+            limiter=limiter,
+        )
+        try:
+            for stream_slice in stream_slices:
+                if self._timezone_mismatch:
+                    return
+                yield stream_slice
+        finally:
+            self._slice_reader.close()
+            self._slice_reader = None
+
+    def _download_slice(self, stream_slice: Mapping[str, Any], stream_state: Mapping[str, Any]) -> Optional[IO[bytes]]:
+        """Spool the response body of a date window to a temporary file, None if the window is skipped"""
+        _, response = self._fetch_next_page(stream_slice, stream_state)
+        with response:
+            if is_timezone_mismatch(response):
+                self._mismatched_windows.add(slice_key(stream_slice))
+                return None
+            # the gzip bodies are kept compressed, `iter_lines` decompresses them
+            decode_content = response.headers.get("Content-Encoding", "identity").lower() not in ("gzip", "identity")
+            spooled = tempfile.TemporaryFile()
+            try:
+                for chunk in response.raw.stream(EXPORT_CHUNK_SIZE, decode_content=decode_content):
+                    spooled.write(chunk)
+            except BaseException:
+                spooled.close()
+                raise
+        return spooled
+
+    def _read_pages(self, records_generator_fn, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None):
+        chunks = self._slice_reader.chunks(stream_slice) if self._slice_reader else None
+        if chunks is None:
+            yield from super()._read_pages(records_generator_fn, stream_slice, stream_state)
+            return
+        yield from self.process_chunks(chunks)
+        if slice_key(stream_slice) in self._mismatched_windows:
+            self._timezone_mismatch = True
 
     @cache
     def get_json_schema(self) -> Mapping[str, Any]:
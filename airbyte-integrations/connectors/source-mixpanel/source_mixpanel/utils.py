@@ -2,7 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import re
+import zlib
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Iterable, Iterator, Union
+
+import orjson
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams import Stream
@@ -61,3 +69,78 @@ def fix_date_time(record):
     elif isinstance(record, list):
         for entry in record:
             fix_date_time(entry)
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+# decompress the gzip format, with its header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+SECONDS_PER_DAY = 24 * 60 * 60
+# at least as many digits as the integers out of the 64 bits range, also found in strings but rarely
+LONG_NUMBER_PATTERN = re.compile(r"\d{19}")
+LONG_NUMBER_BYTES_PATTERN = re.compile(rb"\d{19}")
+EPOCH = date(1970, 1, 1)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson, falling back to json for the documents orjson rejects, like NaN,
+    and for the ones with a long number, as orjson parses the integers out of the 64 bits range as floats.
+    """
+    long_number_pattern = LONG_NUMBER_BYTES_PATTERN if isinstance(data, bytes) else LONG_NUMBER_PATTERN
+    if long_number_pattern.search(data):
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _gunzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    for chunk in chunks:
+        while chunk:
+            yield decompressor.decompress(chunk)
+            if not decompressor.eof:
+                break
+            # concatenated gzip members
+            chunk = decompressor.unused_data
+            decompressor = zlib.decompressobj(GZIP_WBITS)
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Split the chunks of a JSON lines response into lines, skipping the empty ones.
+    A body compressed with gzip without `Content-Encoding` header, so not decoded by `requests`, is decompressed on the fly.
+    """
+    chunks = iter(chunks)
+    first_chunk = next(chunks, b"")
+    chunks = chain([first_chunk], chunks)
+    if first_chunk.startswith(GZIP_MAGIC):
+        chunks = _gunzip(chunks)
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if line:
+                yield line
+    pending = pending.rstrip(b"\r")
+    if pending:
+        yield pending
+
+
+@lru_cache(maxsize=1024)
+def _iso8601_day(days_since_epoch: int) -> str:
+    return (EPOCH + timedelta(days=days_since_epoch)).isoformat()
+
+
+def timestamp_to_iso8601(timestamp: int) -> str:
+    """
+    Format a UTC timestamp in seconds like `pendulum.from_timestamp(timestamp, tz="UTC").to_iso8601_string()`,
+    the date part is cached as the events of an export come from a few days.
+    """
+    days, seconds = divmod(timestamp, SECONDS_PER_DAY)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return f"{_iso8601_day(days)}T{hours:02d}:{minutes:02d}:{seconds:02d}Z"
@@ -0,0 +1,103 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import tempfile
+import threading
+import time
+
+import pytest
+from source_mixpanel.concurrent_slices import ConcurrentSliceReader, TokenBucket
+
+
+def _slices(count):
+    return [{"start_date": f"2024-01-{day:02}", "end_date": f"2024-01-{day:02}"} for day in range(1, count + 1)]
+
+
+def _spooled(content: bytes):
+    spooled = tempfile.TemporaryFile()
+    spooled.write(content)
+    return spooled
+
+
+def test_token_bucket_spaces_the_requests():
+    clock = [0.0]
+    bucket = TokenBucket(rate=2, capacity=1, clock=lambda: clock[0])
+    stop = threading.Event()
+    waits = []
+    # the wait of the bucket moves the clock forward
+    stop.wait = lambda delay: waits.append(delay) or clock.__setitem__(0, clock[0] + delay)
+
+    assert all(bucket.acquire(stop) for _ in range(3))
+    assert waits == [0.5, 0.5]
+
+
+def test_token_bucket_stops_waiting_once_stopped():
+    bucket = TokenBucket(rate=1 / 3600)
+    stop = threading.Event()
+    assert bucket.acquire(stop)
+
+    threading.Timer(0.05, stop.set).start()
+    start = time.monotonic()
+    assert not bucket.acquire(stop)
+    assert time.monotonic() - start < 5
+
+
+def test_reader_hands_over_the_bodies_in_slice_order():
+    stream_slices = _slices(4)
+    last_downloaded = threading.Event()
+
+    def download(stream_slice):
+        if stream_slice is stream_slices[0]:
+            # the first window is the last one to be downloaded
+            assert last_downloaded.wait(5)
+        if stream_slice is stream_slices[-1]:
+            last_downloaded.set()
+        return _spooled(stream_slice["start_date"].encode())
+
+    with ConcurrentSliceReader(download, stream_slices, max_workers=4) as reader:
+        bodies = [b"".join(reader.chunks(stream_slice)) for stream_slice in stream_slices]
+
+    assert bodies == [stream_slice["start_date"].encode() for stream_slice in stream_slices]
+
+
+def test_reader_keeps_a_bounded_number_of_windows_ahead():
+    stream_slices = _slices(6)
+    downloaded = []
+
+    def download(stream_slice):
+        downloaded.append(stream_slice["start_date"])
+        return None
+
+    with ConcurrentSliceReader(download, stream_slices, max_workers=1, max_ahead=2) as reader:
+        # time.sleep is mocked in the tests
+        threading.Event().wait(0.1)
+        assert len(downloaded) == 2
+        # taking a window submits the next one
+        assert list(reader.chunks(stream_slices[0])) == []
+        threading.Event().wait(0.1)
+        assert downloaded == ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+def test_reader_raises_the_error_in_its_slice():
+    stream_slices = _slices(3)
+
+    def download(stream_slice):
+        if stream_slice is stream_slices[1]:
+            raise ValueError("second window failed")
+        return _spooled(b"records")
+
+    with ConcurrentSliceReader(download, stream_slices, max_workers=3) as reader:
+        assert b"".join(reader.chunks(stream_slices[0])) == b"records"
+        with pytest.raises(ValueError, match="second window failed"):
+            list(reader.chunks(stream_slices[1]))
+
+
+def test_reader_skips_the_windows_it_does_not_hold():
+    stream_slices = _slices(3)
+
+    with ConcurrentSliceReader(lambda stream_slice: _spooled(b"records"), stream_slices, max_workers=2) as reader:
+        assert reader.chunks({"start_date": "2023-12-31", "end_date": "2023-12-31"}) is None
+        # the windows before the asked one are dropped
+        assert b"".join(reader.chunks(stream_slices[1])) == b"records"
+        assert reader.chunks(stream_slices[0]) is None
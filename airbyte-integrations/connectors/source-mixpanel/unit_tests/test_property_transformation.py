@@ -11,6 +11,7 @@ that will conflict in further data normalization, like:
 from unittest.mock import MagicMock
 
 import pytest
+from source_mixpanel.property_transformation import transform_property_names, transform_property_names_cached
 from source_mixpanel.streams import Export
 
 from airbyte_cdk.models import SyncMode
@@ -62,3 +63,10 @@ def test_export_stream_conflict_names(requests_mock, export_response, config):
     assert record["userName"] == "1"
     assert record["_userName"] == "2"
     assert record["__username"] == "3"
+
+
+def test_transform_property_names_cached():
+    property_names = ("$userName", "userName", "username", "$browser", "time")
+
+    assert transform_property_names_cached(property_names) == tuple(transform_property_names(property_names))
+    assert transform_property_names_cached(property_names) is transform_property_names_cached(property_names)
@@ -2,8 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import gzip
+import io
 import json
 import logging
+import os
+import random
+import threading
+import time
 import urllib.parse
 from datetime import timedelta
 from unittest import mock
@@ -11,10 +17,12 @@ from unittest.mock import MagicMock
 
 import pendulum
 import pytest
+import requests
 import responses
 import source_mixpanel
 from source_mixpanel import SourceMixpanel
 from source_mixpanel.components import iter_dicts
+from source_mixpanel.property_transformation import transform_property_names
 from source_mixpanel.streams import Export
 from source_mixpanel.utils import read_full_refresh
 
@@ -869,3 +877,164 @@ def test_export_stream_lookback_window(requests_mock, export_response, config_ra
     # Verify updated state is set to the latest record time
     new_state = stream.get_updated_state(stream_state, records[-1])
     assert new_state["time"] == "2021-06-16T17:28:00Z"
+
+
+def test_export_stream_reads_gzip_body(requests_mock, config):
+    stream = Export(authenticator=MagicMock(), **config)
+    events = [{"event": "Viewed Page", "properties": {"time": 1623860880 + index, "$browser": "Chrome"}} for index in range(3)]
+    body = gzip.compress(b"\n".join(json.dumps(event).encode() for event in events))
+    requests_mock.register_uri("GET", get_url_to_mock(stream), content=body)
+    stream_slice = {"start_date": "2017-01-25T00:00:00Z", "end_date": "2017-02-25T00:00:00Z"}
+
+    records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice))
+
+    assert records == [{"event": "Viewed Page", "time": f"2021-06-16T16:28:0{index}Z", "browser": "Chrome"} for index in range(3)]
+    assert requests_mock.last_request.headers["Accept-Encoding"] == "gzip"
+
+
+def _read_export_windows(stream):
+    records = []
+    for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={}):
+        records.append([record["time"] for record in stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice)])
+    return records
+
+
+@responses.activate
+def test_export_stream_reads_the_date_windows_concurrently(config):
+    stream = Export(authenticator=MagicMock(), **{**config, "date_window_size": 10}, num_workers=4, reqs_per_hour_limit=0)
+    from_dates = [stream_slice["start_date"] for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental)]
+    last_window_served = threading.Event()
+
+    def export_body(request):
+        # requests_mock answers one request at a time, responses answers them concurrently
+        index = from_dates.index(urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)["from_date"][0])
+        if index == 0:
+            # the first window is answered once the last one is
+            assert last_window_served.wait(5)
+        if index == len(from_dates) - 1:
+            last_window_served.set()
+        events = [{"event": "Viewed Page", "properties": {"time": 1704067200 + 86400 * index + second}} for second in range(2)]
+        return 200, {"Content-Encoding": "gzip"}, gzip.compress(b"\n".join(json.dumps(event).encode() for event in events))
+
+    responses.add_callback(responses.GET, get_url_to_mock(stream), callback=export_body)
+
+    records = _read_export_windows(stream)
+
+    assert len(from_dates) == 4
+    assert records == [
+        [pendulum.from_timestamp(1704067200 + 86400 * index + second).to_iso8601_string() for second in range(2)]
+        for index in range(len(from_dates))
+    ]
+    assert stream._slice_reader is None
+
+
+@responses.activate
+def test_export_stream_stops_at_the_concurrent_window_with_a_timezone_mismatch(config):
+    stream = Export(authenticator=MagicMock(), **{**config, "date_window_size": 10}, num_workers=4, reqs_per_hour_limit=0)
+    from_dates = [stream_slice["start_date"] for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental)]
+    last_window_served = threading.Event()
+
+    def export_body(request):
+        index = from_dates.index(urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)["from_date"][0])
+        if index == len(from_dates) - 1:
+            # the mismatch of the last window is known before the earlier windows are read
+            last_window_served.set()
+            return 400, {}, "to_date cannot be later than today"
+        assert last_window_served.wait(5)
+        return 200, {}, json.dumps({"event": "Viewed Page", "properties": {"time": 1704067200 + 86400 * index}})
+
+    responses.add_callback(responses.GET, get_url_to_mock(stream), callback=export_body)
+
+    records = _read_export_windows(stream)
+
+    assert len(from_dates) == 4
+    assert records == [[pendulum.from_timestamp(1704067200 + 86400 * index).to_iso8601_string()] for index in range(3)] + [[]]
+    assert stream._timezone_mismatch
+
+
+def test_export_stream_raises_the_error_of_a_concurrent_window_in_its_slice(requests_mock, config):
+    stream = Export(authenticator=MagicMock(), **{**config, "date_window_size": 10}, num_workers=4, reqs_per_hour_limit=0)
+    from_dates = [stream_slice["start_date"] for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental)]
+    event = {"event": "Viewed Page", "properties": {"time": 1704067200}}
+    requests_mock.register_uri("GET", get_url_to_mock(stream), json=event)
+    requests_mock.register_uri(
+        "GET", f"{get_url_to_mock(stream)}?from_date={from_dates[1]}", status_code=400, text="Unable to authenticate request"
+    )
+
+    records = []
+    with pytest.raises(Exception, match="Your credentials might have expired"):
+        for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={}):
+            records.extend(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice))
+
+    assert len(records) == 1
+
+
+def _export_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _former_export_records(response: requests.Response):
+    # the decoding of the Export records before the orjson lines and the cached property names
+    for record in iter_dicts(response.iter_lines(decode_unicode=True)):
+        item = {"event": record["event"]}
+        properties = record["properties"]
+        for result in transform_property_names(properties.keys()):
+            item[result.transformed_name] = str(properties[result.source_name])
+        item["time"] = pendulum.from_timestamp(int(item["time"]), tz="UTC").to_iso8601_string()
+        yield item
+
+
+def _export_dump(events: int) -> bytes:
+    # an Export dump with the shape of the recorded ones: a few kinds of events sharing most of their properties
+    random.seed(42)
+    event_names = ["Viewed Page", "Clicked Button", "Signed Up", "Purchased", "Searched"]
+    lines = []
+    for index in range(events):
+        event_name = event_names[index % len(event_names)]
+        properties = {
+            "time": 1704067200 + index,
+            "distinct_id": f"user-{random.randint(0, 10_000)}",
+            "$insert_id": f"{random.getrandbits(128):032x}",
+            "$browser": random.choice(["Chrome", "Firefox", "Safari"]),
+            "$browser_version": 120.0,
+            "$city": random.choice(["Paris", "Zürich", "São Paulo"]),
+            "$current_url": f"https://example.com/page/{index % 100}",
+            "$device_id": f"device-{index % 1000}",
+            "$mp_api_endpoint": "api.mixpanel.com",
+            "$os": "Mac OS X",
+            "$screen_height": 1080,
+            "$screen_width": 1920,
+            "mp_lib": "web",
+            "mp_processing_time_ms": 1704067200000 + index,
+            "utm_source": random.choice(["google", "newsletter", None]),
+            "noninteraction": random.choice([True, False]),
+            "tags": ["a", "b"],
+        }
+        properties.update({f"{event_name} property {number}": number * index for number in range(10)})
+        lines.append(json.dumps({"event": event_name, "properties": properties}))
+    return "\n".join(lines).encode()
+
+
+def test_export_decoding_matches_former_decoding(config):
+    stream = Export(authenticator=MagicMock(), **config)
+    dump = _export_dump(1000)
+
+    assert list(stream.process_response(_export_response(dump))) == list(_former_export_records(_export_response(dump)))
+
+
+@pytest.mark.skipif(not os.getenv("MIXPANEL_EXPORT_BENCHMARK_EVENTS"), reason="set MIXPANEL_EXPORT_BENCHMARK_EVENTS to run it")
+def test_benchmark_export_decoding_against_former_decoding(config):
+    events = int(os.environ["MIXPANEL_EXPORT_BENCHMARK_EVENTS"])
+    stream = Export(authenticator=MagicMock(), **config)
+    dump = _export_dump(events)
+
+    for name, decode in [("former decoding", _former_export_records), ("Export.process_response", stream.process_response)]:
+        start = time.perf_counter()
+        count = sum(1 for _ in decode(_export_response(dump)))
+        seconds = time.perf_counter() - start
+        assert count == events
+        logging.getLogger("airbyte").info(f"{name}: {count / seconds:.0f} events/s over {len(dump) / 2**20:.0f} MiB")
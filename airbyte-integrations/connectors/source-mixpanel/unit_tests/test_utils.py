@@ -2,8 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import gzip
+import math
+
+import pendulum
 import pytest
-from source_mixpanel.utils import fix_date_time
+from source_mixpanel.utils import fix_date_time, iter_lines, json_loads, timestamp_to_iso8601
 
 
 @pytest.mark.parametrize(
@@ -44,3 +48,41 @@ from source_mixpanel.utils import fix_date_time
 def test_fix_date_time(input_record, expected_record):
     fix_date_time(input_record)
     assert input_record == expected_record
+
+
+@pytest.mark.parametrize("timestamp", [0, 1, 59, 86399, 86400, 951782400, 1623860880, 1709251199, 4102444800, -1, -86401])
+def test_timestamp_to_iso8601(timestamp):
+    assert timestamp_to_iso8601(timestamp) == pendulum.from_timestamp(timestamp, tz="UTC").to_iso8601_string()
+
+
+LINES = [b'{"event": "first"}', b'{"event": "second \\u2028"}', b'{"event": "third"}']
+
+
+def _chunks(data, size):
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"\n".join(LINES),
+        b"\r\n".join(LINES) + b"\r\n\n",
+        gzip.compress(b"\n".join(LINES) + b"\n"),
+        gzip.compress(LINES[0] + b"\n") + gzip.compress(b"\n".join(LINES[1:])),
+    ],
+    ids=["plain", "crlf", "gzip", "concatenated_gzip"],
+)
+@pytest.mark.parametrize("chunk_size", [3, 1024])
+def test_iter_lines(body, chunk_size):
+    assert list(iter_lines(_chunks(body, chunk_size))) == LINES
+
+
+def test_iter_lines_of_empty_body():
+    assert list(iter_lines([])) == []
+
+
+def test_json_loads_falls_back_to_json():
+    assert json_loads(b'{"big": 123456789012345678901234567890}') == {"big": 123456789012345678901234567890}
+    assert json_loads('{"big": -9223372036854775809}') == {"big": -9223372036854775809}
+    assert json_loads(b'{"list": [1, 18446744073709551616]}') == {"list": [1, 18446744073709551616]}
+    assert math.isnan(json_loads('{"nan": NaN}')["nan"])
@@ -65,6 +65,17 @@ class Config(AbstractFileBasedSpec):
         order=5,
     )
 
+    listing_concurrency: Optional[int] = Field(
+        title="Listing Concurrency",
+        default=None,
+        description="The number of threads listing the bucket objects at the same time. The prefixes derived from the globs "
+        "are split further by their sub-folders and listed side by side. Leave empty to list the prefixes one after another.",
+        ge=1,
+        le=64,
+        order=7,
+        group="advanced",
+    )
+
     delivery_method: DeliverRecords | DeliverRawFiles = Field(
         title="Delivery Method",
         discriminator="delivery_type",
@@ -3,12 +3,15 @@
 #
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import IOBase
 from os import getenv
 from os.path import basename, dirname
-from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
+from queue import Full, Queue
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, cast
 
 import boto3.session
 import pendulum
@@ -29,18 +32,27 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFile
 from airbyte_cdk.sources.file_based.file_record_data import FileRecordData
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from source_s3.v4.config import Config
-from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
+from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipCentralDirectoryCache, ZipContentReader, ZipFileHandler
 
 
 AWS_EXTERNAL_ID = getenv("AWS_ASSUME_ROLE_EXTERNAL_ID")
+# a local directory to keep the central directories of the ZIP archives between the runs
+ZIP_CENTRAL_DIRECTORY_CACHE_DIR = getenv("ZIP_CENTRAL_DIRECTORY_CACHE_DIR")
+# the default size of the botocore connection pool
+MAX_POOL_CONNECTIONS = 10
 
 
 class SourceS3StreamReader(AbstractFileBasedStreamReader):
     FILE_SIZE_LIMIT = 1_500_000_000
+    # how many folder levels below the glob-derived prefixes are discovered to shard the concurrent listing
+    LISTING_PREFIX_SPLIT_DEPTH = 3
+    # how many pages of matching files may wait for the consumer, per listing thread
+    LISTING_PAGES_PER_THREAD = 4
 
     def __init__(self):
         super().__init__()
         self._s3_client = None
+        self._zip_central_directory_cache = ZipCentralDirectoryCache(directory=ZIP_CENTRAL_DIRECTORY_CACHE_DIR)
 
     @property
     def config(self) -> Config:
@@ -74,6 +86,11 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
             if self.config.region_name:
                 client_kv_args["region_name"] = self.config.region_name
 
+            # the concurrent listing needs a connection per thread
+            if self.config.listing_concurrency and self.config.listing_concurrency > MAX_POOL_CONNECTIONS:
+                pool_config = ClientConfig(max_pool_connections=self.config.listing_concurrency)
+                client_kv_args["config"] = client_kv_args["config"].merge(pool_config) if "config" in client_kv_args else pool_config
+
             if self.config.role_arn:
                 self._s3_client = self._get_iam_s3_client(client_kv_args)
             else:
@@ -143,10 +160,17 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         total_n_keys = 0
 
         try:
-            for current_prefix in prefixes if prefixes else [None]:
-                for remote_file in self._page(s3, globs, self.config.bucket, current_prefix, seen, logger):
-                    total_n_keys += 1
-                    yield remote_file
+            if self.config.listing_concurrency and self.config.listing_concurrency > 1:
+                for remote_file in self._list_concurrently(s3, globs, self.config.bucket, prefixes or [None], logger):
+                    if remote_file.uri not in seen:
+                        seen.add(remote_file.uri)
+                        total_n_keys += 1
+                        yield remote_file
+            else:
+                for current_prefix in prefixes if prefixes else [None]:
+                    for remote_file in self._page(s3, globs, self.config.bucket, current_prefix, seen, logger):
+                        total_n_keys += 1
+                        yield remote_file
 
             logger.info(f"Finished listing objects from S3. Found {total_n_keys} objects total ({len(seen)} unique objects).")
         except ClientError as exc:
@@ -317,18 +341,10 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
             logger.info(f"Received {key_count} objects from S3 for prefix '{prefix}'.")
 
             if "Contents" in response:
-                for file in response["Contents"]:
-                    if self._is_folder(file):
-                        continue
-
-                    for remote_file in self._handle_file(file):
-                        if (
-                            self.file_matches_globs(remote_file, globs)
-                            and self.is_modified_after_start_date(remote_file.last_modified)
-                            and remote_file.uri not in seen
-                        ):
-                            seen.add(remote_file.uri)
-                            yield remote_file
+                for remote_file in self._matching_files(response["Contents"], globs):
+                    if remote_file.uri not in seen:
+                        seen.add(remote_file.uri)
+                        yield remote_file
             else:
                 logger.warning(f"Invalid response from S3; missing 'Contents' key. kwargs={kwargs}.")
 
@@ -338,6 +354,94 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
                 logger.info(f"Finished listing objects from S3 for prefix={prefix}. Found {total_n_keys_for_prefix} objects.")
                 break
 
+    def _matching_files(self, contents: Iterable[Mapping[str, Any]], globs: List[str]) -> Iterable[RemoteFile]:
+        """
+        The files of a `list_objects_v2` page matching the globs and the start date.
+        """
+        for file in contents:
+            if self._is_folder(file):
+                continue
+
+            for remote_file in self._handle_file(file):
+                if self.file_matches_globs(remote_file, globs) and self.is_modified_after_start_date(remote_file.last_modified):
+                    yield remote_file
+
+    def _list_concurrently(
+        self, s3: BaseClient, globs: List[str], bucket: str, prefixes: List[Optional[str]], logger: logging.Logger
+    ) -> Iterable[RemoteFile]:
+        """
+        List the prefixes on a thread pool of `listing_concurrency` threads, yielding the matching files as soon as they are found.
+
+        Every prefix is first listed with the "/" delimiter, down to LISTING_PREFIX_SPLIT_DEPTH levels: the files at that level
+        are matched right away and every sub-folder becomes a listing task of its own. Below that depth, the sub-folders are
+        paged through without the delimiter. The files are not deduplicated here, it is up to the caller.
+        """
+        concurrency = self.config.listing_concurrency
+        pages: Queue = Queue(maxsize=concurrency * self.LISTING_PAGES_PER_THREAD)
+        stop = threading.Event()
+        pending_lock = threading.Lock()
+        # the listing tasks not finished yet, plus the one of the initial submission
+        pending = 1
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="s3-listing")
+
+        def put(item: Any) -> bool:
+            # blocking put, which gives up when the consumer has gone away
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def submit(prefix: Optional[str], depth: int) -> None:
+            nonlocal pending
+            with pending_lock:
+                pending += 1
+            executor.submit(list_prefix, prefix, depth)
+
+        def list_prefix(prefix: Optional[str], depth: int) -> None:
+            try:
+                split = depth < self.LISTING_PREFIX_SPLIT_DEPTH
+                kwargs = {"Bucket": bucket, **({"Prefix": prefix} if prefix else {}), **({"Delimiter": "/"} if split else {})}
+                while not stop.is_set():
+                    response = s3.list_objects_v2(**kwargs)
+                    if split:
+                        for common_prefix in response.get("CommonPrefixes", []):
+                            submit(common_prefix["Prefix"], depth + 1)
+                    if not put(list(self._matching_files(response.get("Contents", []), globs))):
+                        return
+                    if next_token := response.get("NextContinuationToken"):
+                        kwargs["ContinuationToken"] = next_token
+                    else:
+                        break
+            except Exception as exc:
+                put(exc)
+            finally:
+                task_done()
+
+        def task_done() -> None:
+            nonlocal pending
+            with pending_lock:
+                pending -= 1
+                finished = pending == 0
+            if finished:
+                put(None)
+
+        try:
+            for prefix in prefixes:
+                submit(prefix, 0)
+            task_done()
+            while (page := pages.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                yield from page
+        finally:
+            # release the blocked threads, when the consumer has gone away or failed
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"Finished listing objects from S3 with {concurrency} threads for prefixes {prefixes}.")
+
     def is_modified_after_start_date(self, last_modified_date: Optional[datetime]) -> bool:
         """Returns True if given date higher or equal than start date or something is missing"""
         if not (self.config.start_date and last_modified_date):
@@ -351,8 +455,8 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
             yield self._handle_regular_file(file)
 
     def _handle_zip_file(self, file):
-        zip_handler = ZipFileHandler(self.s3_client, self.config)
-        zip_members, cd_start = zip_handler.get_zip_files(file["Key"])
+        zip_handler = ZipFileHandler(self.s3_client, self.config, self._zip_central_directory_cache)
+        zip_members, cd_start = zip_handler.get_zip_files(file["Key"], etag=file.get("ETag"), size=file.get("Size"))
 
         for zip_member in zip_members:
             remote_file = RemoteFileInsideArchive(
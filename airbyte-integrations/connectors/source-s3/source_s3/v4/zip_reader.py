@@ -1,8 +1,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
+import hashlib
 import io
+import logging
+import os
 import struct
+import tempfile
+import threading
 import zipfile
+from collections import OrderedDict
 from typing import IO, List, Optional, Tuple, Union
 
 from botocore.client import BaseClient
@@ -15,6 +21,8 @@ from source_s3.v4.config import Config
 BUFFER_SIZE_DEFAULT = 1024 * 1024
 MAX_BUFFER_SIZE_DEFAULT: int = 16 * BUFFER_SIZE_DEFAULT
 
+logger = logging.getLogger("airbyte")
+
 
 class RemoteFileInsideArchive(RemoteFile):
     """
@@ -27,6 +35,87 @@ class RemoteFileInsideArchive(RemoteFile):
     compression_method: int
 
 
+class ZipCentralDirectoryCache:
+    """
+    Cache of the parsed central directories of the ZIP archives, keyed by bucket, key, ETag and size, so an unchanged
+    archive is not fetched again on the next listing. The entries are kept in memory (the least recently used
+    are evicted past `max_entries`) and, when `directory` is set, the raw central directories are also written
+    to the local disk to be shared with the next runs.
+    """
+
+    def __init__(self, max_entries: int = 1000, directory: Optional[str] = None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries: "OrderedDict[Tuple[str, str, str, int], Tuple[List[zipfile.ZipInfo], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, bucket: str, filename: str, etag: str, size: int) -> Optional[Tuple[List[zipfile.ZipInfo], int]]:
+        """
+        :return: The ZipInfo objects and the central directory start of the archive or None if it is not cached.
+        """
+        key = (bucket, filename, etag, size)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        entry = self._read_from_disk(key)
+        if entry:
+            self._remember(key, entry)
+        return entry
+
+    def set(
+        self,
+        bucket: str,
+        filename: str,
+        etag: str,
+        size: int,
+        zip_infos: List[zipfile.ZipInfo],
+        central_dir_data: bytes,
+        central_dir_start: int,
+    ) -> None:
+        key = (bucket, filename, etag, size)
+        self._remember(key, (zip_infos, central_dir_start))
+        self._write_to_disk(key, central_dir_data, central_dir_start)
+
+    def _remember(self, key: Tuple[str, str, str, int], entry: Tuple[List[zipfile.ZipInfo], int]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: Tuple[str, str, str, int]) -> str:
+        digest = hashlib.sha256("\0".join(map(str, key)).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.cd")
+
+    def _read_from_disk(self, key: Tuple[str, str, str, int]) -> Optional[Tuple[List[zipfile.ZipInfo], int]]:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), "rb") as cache_file:
+                central_dir_start = struct.unpack("<Q", cache_file.read(8))[0]
+                return ZipFileHandler.parse_central_directory(cache_file.read()), central_dir_start
+        except FileNotFoundError:
+            return None
+        except (OSError, struct.error, zipfile.BadZipFile) as exc:
+            logger.warning(f"Ignoring the unreadable cached central directory of {key[1]}: {exc}")
+            return None
+
+    def _write_to_disk(self, key: Tuple[str, str, str, int], central_dir_data: bytes, central_dir_start: int) -> None:
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temporary file first, so a concurrent reader never sees a partial entry
+            with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as cache_file:
+                cache_file.write(struct.pack("<Q", central_dir_start))
+                cache_file.write(central_dir_data)
+            os.replace(cache_file.name, self._path(key))
+        except OSError as exc:
+            logger.warning(f"Could not cache the central directory of {key[1]} on disk: {exc}")
+
+
 class ZipFileHandler:
     """
     Handler class for extracting information from ZIP files stored in AWS S3.
@@ -38,21 +127,28 @@ class ZipFileHandler:
 
     # Standard ZIP constants
     EOCD_CENTRAL_DIR_START_OFFSET: int = 16
+    ZIP64_LOCATOR_SIZE: int = 20
 
     # ZIP64 constants
     ZIP64_EOCD_OFFSET: int = 8
     ZIP64_EOCD_SIZE: int = 56
     ZIP64_CENTRAL_DIR_START_OFFSET: int = 48
 
-    def __init__(self, s3_client: BaseClient, config: Config):
+    # The tail of the archive fetched at once: the EOCD record (up to 64 KiB with the comment) and,
+    # for most of the archives, the whole central directory
+    TAIL_SIZE: int = BUFFER_SIZE_DEFAULT
+
+    def __init__(self, s3_client: BaseClient, config: Config, cache: Optional[ZipCentralDirectoryCache] = None):
         """
         Initialize the ZipFileHandler with an S3 client and configuration.
 
         :param s3_client: The AWS S3 client.
         :param config: Configuration containing bucket and other details.
+        :param cache: The cache of the central directories, shared between the handlers (optional).
         """
         self.s3_client = s3_client
         self.config = config
+        self.cache = cache
 
     def _fetch_data_from_s3(self, filename: str, start: int, size: Optional[int] = None) -> bytes:
         """
@@ -125,20 +221,89 @@ class ZipFileHandler:
 
         return central_dir_start
 
-    def get_zip_files(self, filename: str) -> Tuple[List[zipfile.ZipInfo], int]:
+    def _fetch_tail_from_s3(self, filename: str, size: Optional[int] = None) -> Tuple[bytes, int]:
+        """
+        Fetch the last TAIL_SIZE bytes of a file in S3 with a single suffix range request.
+
+        :param filename: The name of the file in S3.
+        :param size: The size of the file, if known from the listing.
+        :return: The fetched bytes and their position in the file.
+        """
+        response = self.s3_client.get_object(Bucket=self.config.bucket, Key=filename, Range=f"bytes=-{self.TAIL_SIZE}")
+        tail = response["Body"].read()
+        content_range = response.get("ContentRange")
+        if size is None and content_range:
+            # e.g. "bytes 1048576-2097151/2097152"
+            size = int(content_range.rsplit("/", 1)[1])
+        if size is None:
+            size = self.s3_client.head_object(Bucket=self.config.bucket, Key=filename)["ContentLength"]
+        return tail, size - len(tail)
+
+    def _fetch_central_directory(self, filename: str, size: Optional[int] = None) -> Tuple[bytes, int]:
+        """
+        Fetch the central directory (up to the end of the file) of a ZIP file.
+        The EOCD and ZIP64 records and the central directory are taken from the tail of the file when they are in it,
+        so a single request is enough for most of the archives.
+
+        :param filename: The name of the file in S3.
+        :param size: The size of the file, if known from the listing.
+        :return: The data from the start of the central directory to the end of the file and the central directory start.
+        """
+        tail, tail_start = self._fetch_tail_from_s3(filename, size)
+        eocd_index = tail.rfind(self.EOCD_SIGNATURE)
+        if eocd_index == -1:
+            central_dir_start = self._get_central_directory_start(filename)
+            return self._fetch_data_from_s3(filename, central_dir_start), central_dir_start
+
+        central_dir_start = struct.unpack_from("<L", tail, eocd_index + self.EOCD_CENTRAL_DIR_START_OFFSET)[0]
+        locator_index = eocd_index - self.ZIP64_LOCATOR_SIZE
+        if central_dir_start == 0xFFFFFFFF and locator_index >= 0 and tail.startswith(self.ZIP64_LOCATOR_SIGNATURE, locator_index):
+            zip64_eocd_offset = struct.unpack_from("<Q", tail, locator_index + self.ZIP64_EOCD_OFFSET)[0]
+            if zip64_eocd_offset >= tail_start:
+                zip64_data = tail[zip64_eocd_offset - tail_start :]
+            else:
+                zip64_data = self._fetch_data_from_s3(filename, zip64_eocd_offset, self.ZIP64_EOCD_SIZE)
+            central_dir_start = struct.unpack_from("<Q", zip64_data, self.ZIP64_CENTRAL_DIR_START_OFFSET)[0]
+        elif central_dir_start == 0xFFFFFFFF:
+            central_dir_start = struct.unpack_from("<Q", self._fetch_zip64_data(filename), self.ZIP64_CENTRAL_DIR_START_OFFSET)[0]
+
+        if central_dir_start >= tail_start:
+            return tail[central_dir_start - tail_start :], central_dir_start
+        # the central directory is larger than the tail: fetch the missing head of it only
+        return self._fetch_data_from_s3(filename, central_dir_start, tail_start - central_dir_start) + tail, central_dir_start
+
+    @staticmethod
+    def parse_central_directory(central_dir_data: bytes) -> List[zipfile.ZipInfo]:
+        """
+        :param central_dir_data: The data from the start of the central directory to the end of the ZIP file.
+        :return: The ZipInfo objects of the files inside the archive, with offsets relative to the central directory start.
+        """
+        with io.BytesIO(central_dir_data) as bytes_io:
+            with zipfile.ZipFile(bytes_io, "r") as zf:
+                return zf.infolist()
+
+    def get_zip_files(self, filename: str, etag: Optional[str] = None, size: Optional[int] = None) -> Tuple[List[zipfile.ZipInfo], int]:
         """
         Extract metadata about the files inside a ZIP archive stored in S3.
+        The central directory is served from the cache when the ETag and the size of the archive are known and unchanged.
 
         :param filename: The name of the ZIP file in S3.
+        :param etag: The ETag of the ZIP file, from the listing (optional).
+        :param size: The size of the ZIP file, from the listing (optional).
         :return: A tuple containing a list of ZipInfo objects representing the files inside the ZIP archive
                  and the starting position of the central directory.
         """
-        central_dir_start = self._get_central_directory_start(filename)
-        central_dir_data = self._fetch_data_from_s3(filename, central_dir_start)
-
-        with io.BytesIO(central_dir_data) as bytes_io:
-            with zipfile.ZipFile(bytes_io, "r") as zf:
-                return zf.infolist(), central_dir_start
+        cacheable = self.cache is not None and etag is not None and size is not None
+        if cacheable:
+            cached = self.cache.get(self.config.bucket, filename, etag, size)
+            if cached:
+                return cached
+
+        central_dir_data, central_dir_start = self._fetch_central_directory(filename, size)
+        zip_infos = self.parse_central_directory(central_dir_data)
+        if cacheable:
+            self.cache.set(self.config.bucket, filename, etag, size, zip_infos, central_dir_data, central_dir_start)
+        return zip_infos, central_dir_start
 
 
 class DecompressedStream(io.IOBase):
@@ -3,12 +3,15 @@
 #
 
 
+import bisect
 import io
 import logging
+import os
+import time
 from datetime import datetime, timedelta
 from itertools import product
 from typing import Any, Dict, List, Optional, Set
-from unittest.mock import ANY, MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, PropertyMock, patch
 
 import pytest
 from botocore.stub import Stubber
@@ -357,3 +360,138 @@ def test_filter_file_by_start_date(start_date: datetime, last_modified_date: dat
     )
 
     assert expected_result == reader.is_modified_after_start_date(last_modified_date)
+
+
+class InMemoryS3ListingClient:
+    """
+    A local S3 stand-in for `list_objects_v2`: pages of `MaxKeys`, `Delimiter` grouping and continuation tokens
+    over a sorted key space, with an optional latency per request.
+    """
+
+    def __init__(self, keys: List[str], latency: float = 0.0, max_keys: int = 1000):
+        self.keys = sorted(keys)
+        self.latency = latency
+        self.max_keys = max_keys
+        self.last_modified = datetime.now()
+        self.calls = 0
+
+    def list_objects_v2(self, Bucket: str, Prefix: str = "", Delimiter: Optional[str] = None, ContinuationToken: Optional[str] = None):
+        self.calls += 1
+        time.sleep(self.latency)
+        index = bisect.bisect_left(self.keys, ContinuationToken or Prefix)
+        contents, common_prefixes = [], []
+        while index < len(self.keys) and self.keys[index].startswith(Prefix) and len(contents) + len(common_prefixes) < self.max_keys:
+            key = self.keys[index]
+            if Delimiter and Delimiter in key[len(Prefix) :]:
+                common_prefix = key[: key.index(Delimiter, len(Prefix)) + 1]
+                common_prefixes.append({"Prefix": common_prefix})
+                # skip the rest of the sub-folder
+                index = bisect.bisect_left(self.keys, common_prefix[:-1] + chr(ord(Delimiter) + 1))
+            else:
+                contents.append({"Key": key, "LastModified": self.last_modified})
+                index += 1
+        response = {"KeyCount": len(contents) + len(common_prefixes), "Contents": contents, "CommonPrefixes": common_prefixes}
+        if index < len(self.keys) and self.keys[index].startswith(Prefix):
+            response["NextContinuationToken"] = self.keys[index]
+        return response
+
+
+def _date_partitioned_keys(days: int, files_per_day: int) -> List[str]:
+    start = datetime(2024, 1, 1)
+    keys = []
+    for day in range(days):
+        date = start + timedelta(days=day)
+        for file in range(files_per_day):
+            keys.append(f"data/year={date.year}/month={date.month:02d}/day={date.day:02d}/part-{file:04d}.csv")
+            keys.append(f"data/year={date.year}/month={date.month:02d}/day={date.day:02d}/part-{file:04d}.jsonl")
+    return keys + ["data/_SUCCESS", "data/manifest.csv", "other/file.csv"]
+
+
+def _listing_reader(listing_concurrency: Optional[int]) -> SourceS3StreamReader:
+    reader = SourceS3StreamReader()
+    reader.config = Config(
+        bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[], listing_concurrency=listing_concurrency
+    )
+    return reader
+
+
+def _list_uris(reader: SourceS3StreamReader, client: InMemoryS3ListingClient, globs: List[str]) -> List[str]:
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=PropertyMock, return_value=client):
+        return [f.uri for f in reader.get_matching_files(globs, None, logger)]
+
+
+@pytest.mark.parametrize(
+    "globs",
+    [
+        pytest.param(["**"], id="all-files"),
+        pytest.param(["data/**/*.csv"], id="single-prefix"),
+        pytest.param(["data/year=2024/month=01/**/*.csv", "data/year=2024/month=02/**/*.jsonl"], id="multiple-prefixes"),
+        pytest.param(["data/**/*.csv", "data/year=2024/month=01/**/*.csv"], id="overlapping-prefixes"),
+    ],
+)
+def test_get_matching_files_concurrently(globs: List[str]) -> None:
+    client = InMemoryS3ListingClient(_date_partitioned_keys(days=45, files_per_day=5), max_keys=7)
+
+    expected_uris = _list_uris(_listing_reader(None), client, globs)
+    uris = _list_uris(_listing_reader(4), client, globs)
+
+    assert expected_uris
+    # every file is listed once
+    assert sorted(uris) == sorted(expected_uris)
+    assert len(set(uris)) == len(uris)
+
+
+def test_get_matching_files_concurrently_exception() -> None:
+    client = InMemoryS3ListingClient(_date_partitioned_keys(days=3, files_per_day=1))
+    client.list_objects_v2 = Mock(side_effect=ValueError("listing failed"))
+
+    with pytest.raises(ErrorListingFiles):
+        _list_uris(_listing_reader(4), client, ["**"])
+
+
+def test_get_matching_files_concurrently_stops_when_consumer_is_gone() -> None:
+    client = InMemoryS3ListingClient(_date_partitioned_keys(days=60, files_per_day=5), max_keys=5)
+    reader = _listing_reader(2)
+
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=PropertyMock, return_value=client):
+        files = reader.get_matching_files(["**"], None, logger)
+        next(files)
+        files.close()
+    calls = client.calls
+    time.sleep(1)
+
+    assert client.calls - calls <= 2, "the listing threads should stop when the consumer is gone"
+
+
+def test_get_matching_files_concurrently_lists_a_large_bucket() -> None:
+    """
+    Lists a synthetic date-partitioned key space (~37k keys) from the local S3 stand-in, 100 keys per page:
+    the month folders listed side by side return the same files as the sequential listing of the whole bucket.
+    """
+    client = InMemoryS3ListingClient(_date_partitioned_keys(days=365, files_per_day=50), max_keys=100)
+
+    sequential_uris = _list_uris(_listing_reader(None), client, ["data/**/*.csv"])
+    concurrent_uris = _list_uris(_listing_reader(16), client, ["data/**/*.csv"])
+
+    assert len(sequential_uris) == 365 * 50 + 1
+    assert sorted(concurrent_uris) == sorted(sequential_uris)
+    assert len(set(concurrent_uris)) == len(concurrent_uris)
+
+
+@pytest.mark.skipif(not os.getenv("S3_LISTING_BENCHMARK_DAYS"), reason="set S3_LISTING_BENCHMARK_DAYS to run it")
+def test_benchmark_get_matching_files_concurrently() -> None:
+    """
+    Lists a synthetic date-partitioned key space from the local S3 stand-in, 100 keys per page and 10ms latency per request:
+    the sequential listing pages through the whole bucket, the concurrent one lists the month folders side by side.
+    """
+    days = int(os.environ["S3_LISTING_BENCHMARK_DAYS"])
+    client = InMemoryS3ListingClient(_date_partitioned_keys(days=days, files_per_day=50), latency=0.01, max_keys=100)
+
+    def _elapsed(listing_concurrency: Optional[int]) -> float:
+        started = time.perf_counter()
+        assert len(_list_uris(_listing_reader(listing_concurrency), client, ["data/**/*.csv"])) == days * 50 + 1
+        return time.perf_counter() - started
+
+    sequential = _elapsed(None)
+    concurrent = _elapsed(16)
+    logging.getLogger("airbyte").info(f"Listed {days * 50 + 1} files: sequential {sequential:.2f}s, 16 threads {concurrent:.2f}s.")
@@ -7,7 +7,13 @@ import zipfile
 from unittest.mock import MagicMock, patch
 
 import pytest
-from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
+from source_s3.v4.zip_reader import (
+    DecompressedStream,
+    RemoteFileInsideArchive,
+    ZipCentralDirectoryCache,
+    ZipContentReader,
+    ZipFileHandler,
+)
 
 
 # Mocking the S3 client and config for testing
@@ -48,14 +54,119 @@ def test_get_central_directory_start(zip_file_handler):
 
 
 def test_get_zip_files(zip_file_handler):
-    zip_file_handler._get_central_directory_start = MagicMock(return_value=0)
-    zip_file_handler._fetch_data_from_s3 = MagicMock(return_value=b"dummy_data")
+    zip_file_handler._fetch_central_directory = MagicMock(return_value=(b"dummy_data", 0))
     with patch("io.BytesIO", return_value=MagicMock(spec=io.BytesIO)):
         with patch("zipfile.ZipFile", return_value=MagicMock(spec=zipfile.ZipFile)):
             result, cd_start = zip_file_handler.get_zip_files("test_file")
             assert cd_start == 0
 
 
+def _zip_archive(files_count: int) -> bytes:
+    with io.BytesIO() as archive:
+        with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for i in range(files_count):
+                zf.writestr(f"folder/file_{i}.csv", f"id,value\n{i},{'x' * i}\n")
+        return archive.getvalue()
+
+
+class RangeS3Client:
+    """Serves the range requests of `get_object` from the bytes of a single archive."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.get_object = MagicMock(side_effect=self._get_object)
+        self.head_object = MagicMock(return_value={"ContentLength": len(data)})
+
+    def _get_object(self, Bucket: str, Key: str, Range: str):
+        start, end = Range[len("bytes=") :].split("-")
+        if not start:
+            start, end = max(len(self.data) - int(end), 0), len(self.data) - 1
+        start, end = int(start), int(end) if end else len(self.data) - 1
+        return {"Body": io.BytesIO(self.data[start : end + 1]), "ContentRange": f"bytes {start}-{end}/{len(self.data)}"}
+
+
+def _assert_zip_infos(archive: bytes, zip_infos, cd_start: int) -> None:
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        expected = [(info.filename, info.header_offset, info.compress_size) for info in zf.infolist()]
+    assert [(info.filename, info.header_offset + cd_start, info.compress_size) for info in zip_infos] == expected
+
+
+def test_get_zip_files_fetches_the_tail_once(mock_config):
+    archive = _zip_archive(files_count=20)
+    s3_client = RangeS3Client(archive)
+
+    zip_infos, cd_start = ZipFileHandler(s3_client, mock_config).get_zip_files("test.zip")
+
+    _assert_zip_infos(archive, zip_infos, cd_start)
+    s3_client.get_object.assert_called_once_with(Bucket="test-bucket", Key="test.zip", Range=f"bytes=-{ZipFileHandler.TAIL_SIZE}")
+    s3_client.head_object.assert_not_called()
+
+
+def test_get_zip_files_central_directory_larger_than_the_tail(mock_config):
+    archive = _zip_archive(files_count=200)
+    s3_client = RangeS3Client(archive)
+
+    with patch.object(ZipFileHandler, "TAIL_SIZE", 1024):
+        zip_infos, cd_start = ZipFileHandler(s3_client, mock_config).get_zip_files("test.zip", size=len(archive))
+
+    _assert_zip_infos(archive, zip_infos, cd_start)
+    assert s3_client.get_object.call_count == 2
+    assert s3_client.get_object.call_args.kwargs["Range"] == f"bytes={cd_start}-{len(archive) - 1024 - 1}"
+
+
+def test_get_zip_files_from_cache(mock_config):
+    archive = _zip_archive(files_count=20)
+    s3_client = RangeS3Client(archive)
+    cache = ZipCentralDirectoryCache()
+
+    first = ZipFileHandler(s3_client, mock_config, cache).get_zip_files("test.zip", etag='"etag-1"', size=len(archive))
+    second = ZipFileHandler(s3_client, mock_config, cache).get_zip_files("test.zip", etag='"etag-1"', size=len(archive))
+    assert second == first
+    assert s3_client.get_object.call_count == 1
+
+    # the archive has changed
+    ZipFileHandler(s3_client, mock_config, cache).get_zip_files("test.zip", etag='"etag-2"', size=len(archive))
+    assert s3_client.get_object.call_count == 2
+
+
+def test_get_zip_files_without_etag_is_not_cached(mock_config):
+    archive = _zip_archive(files_count=20)
+    s3_client = RangeS3Client(archive)
+    cache = ZipCentralDirectoryCache()
+
+    ZipFileHandler(s3_client, mock_config, cache).get_zip_files("test.zip")
+    ZipFileHandler(s3_client, mock_config, cache).get_zip_files("test.zip")
+    assert s3_client.get_object.call_count == 2
+
+
+def test_get_zip_files_from_disk_cache(mock_config, tmp_path):
+    archive = _zip_archive(files_count=20)
+    s3_client = RangeS3Client(archive)
+
+    ZipFileHandler(s3_client, mock_config, ZipCentralDirectoryCache(directory=str(tmp_path))).get_zip_files(
+        "test.zip", etag='"etag-1"', size=len(archive)
+    )
+    # e.g. the next run
+    zip_infos, cd_start = ZipFileHandler(s3_client, mock_config, ZipCentralDirectoryCache(directory=str(tmp_path))).get_zip_files(
+        "test.zip", etag='"etag-1"', size=len(archive)
+    )
+
+    _assert_zip_infos(archive, zip_infos, cd_start)
+    assert s3_client.get_object.call_count == 1
+
+
+def test_zip_central_directory_cache_evicts_least_recently_used():
+    cache = ZipCentralDirectoryCache(max_entries=2)
+    for filename in ("a.zip", "b.zip"):
+        cache.set("bucket", filename, "etag", 1, [], b"", 0)
+    cache.get("bucket", "a.zip", "etag", 1)
+    cache.set("bucket", "c.zip", "etag", 1, [], b"", 0)
+
+    assert cache.get("bucket", "a.zip", "etag", 1) is not None
+    assert cache.get("bucket", "b.zip", "etag", 1) is None
+    assert cache.get("bucket", "c.zip", "etag", 1) is not None
+
+
 def test_decompressed_stream_seek():
     mock_file = MagicMock(spec=io.IOBase)
     mock_file.read = MagicMock()
@@ -4,6 +4,8 @@
 
 import concurrent.futures
 import logging
+from email.utils import formatdate, parsedate_to_datetime
+from os import getenv
 from typing import Any, List, Mapping, Optional, Tuple
 
 import requests  # type: ignore[import]
@@ -14,6 +16,7 @@ from airbyte_cdk.models import ConfiguredAirbyteCatalog, FailureType, StreamDesc
 from airbyte_cdk.sources.streams.http import HttpClient
 from airbyte_cdk.utils import AirbyteTracedException
 
+from .describe_cache import CachedDescribe, DescribeCache
 from .exceptions import TypeSalesforceException
 from .rate_limiting import SalesforceErrorHandler, default_backoff_handler
 from .utils import filter_streams_by_criteria
@@ -235,6 +238,9 @@ UNSUPPORTED_STREAMS = ["ActivityMetric", "ActivityMetricRollup"]
 #                                                        ^^^^^
 API_VERSION = "v62.0"
 
+# a local directory to keep the describe responses between check, discover and read
+DESCRIBE_CACHE_DIR = getenv("SALESFORCE_DESCRIBE_CACHE_DIR")
+
 
 class Salesforce:
     logger = logging.getLogger("airbyte")
@@ -252,6 +258,7 @@ class Salesforce:
         client_secret: str = None,
         is_sandbox: bool = None,
         start_date: str = None,
+        describe_cache_dir: str = None,
         **kwargs: Any,
     ) -> None:
         self.refresh_token = refresh_token
@@ -260,6 +267,8 @@ class Salesforce:
         self.client_secret = client_secret
         self.access_token = None
         self.instance_url = ""
+        # the identity URL of the authenticated user, https://login.salesforce.com/id/<org id>/<user id>
+        self.identity_url = ""
         self.session = requests.Session()
         # Change the connection pool size. Default value is not enough for parallel tasks
         adapter = request_adapters.HTTPAdapter(pool_connections=self.parallel_tasks_size, pool_maxsize=self.parallel_tasks_size)
@@ -270,6 +279,10 @@ class Salesforce:
         if self.is_sandbox:
             self.logger.info("using SANDBOX of Salesforce")
         self.start_date = start_date
+        describe_cache_dir = describe_cache_dir or DESCRIBE_CACHE_DIR
+        self._describe_cache = DescribeCache(describe_cache_dir) if describe_cache_dir else None
+        # when the global describe was revalidated, the `If-Modified-Since` it was revalidated with
+        self._metadata_unchanged_since: Optional[str] = None
 
     def _get_standard_headers(self) -> Mapping[str, str]:
         return {"Authorization": "Bearer {}".format(self.access_token)}
@@ -334,6 +347,7 @@ class Salesforce:
         auth = resp.json()
         self.access_token = auth["access_token"]
         self.instance_url = auth["instance_url"]
+        self.identity_url = auth.get("id", "")
 
     def describe(self, sobject: str = None, sobject_options: Mapping[str, Any] = None) -> Mapping[str, Any]:
         """Describes all objects or a specific object"""
@@ -342,12 +356,39 @@ class Salesforce:
         endpoint = "sobjects" if not sobject else f"sobjects/{sobject}/describe"
 
         url = f"{self.instance_url}/services/data/{self.version}/{endpoint}"
+        # without the identity of the user the cached describes of another user could be served
+        describe_cache = self._describe_cache if self.identity_url else None
+        cached = describe_cache.get(self.identity_url, self.instance_url, self.version, sobject) if describe_cache else None
+        if cached and sobject and self._cached_after_metadata_unchanged(cached):
+            # the global describe has told no metadata has changed since this response was cached
+            describe_cache.record(hit=True)
+            return cached.response
+        if cached:
+            headers = {**headers, "If-Modified-Since": cached.fetched_at}
+
+        fetched_at = formatdate(usegmt=True)
         resp = self._make_request("GET", url, headers=headers)
+        if cached and resp.status_code == 304:
+            describe_cache.record(hit=True)
+            if not sobject:
+                self._metadata_unchanged_since = cached.fetched_at
+            return cached.response
         if resp.status_code == 404 and sobject:
             self.logger.error(f"not found a description for the sobject '{sobject}'. Sobject options: {sobject_options}")
         resp_json: Mapping[str, Any] = resp.json()
+        if describe_cache:
+            describe_cache.record(hit=False)
+            if not sobject:
+                self._metadata_unchanged_since = None
+            if resp.status_code == 200:
+                describe_cache.set(self.identity_url, self.instance_url, self.version, sobject, CachedDescribe(fetched_at, resp_json))
         return resp_json
 
+    def _cached_after_metadata_unchanged(self, cached: CachedDescribe) -> bool:
+        if not self._metadata_unchanged_since:
+            return False
+        return parsedate_to_datetime(cached.fetched_at) >= parsedate_to_datetime(self._metadata_unchanged_since)
+
     def generate_schema(self, stream_name: str = None, stream_options: Mapping[str, Any] = None) -> Mapping[str, Any]:
         response = self.describe(stream_name, stream_options)
         schema = {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object", "additionalProperties": True, "properties": {}}
@@ -383,6 +424,8 @@ class Salesforce:
                             stream_descriptor=StreamDescriptor(name=stream_name),
                         )
                     stream_schemas[stream_name] = schema
+        if self._describe_cache:
+            self._describe_cache.log_summary()
         return stream_schemas
 
     @staticmethod
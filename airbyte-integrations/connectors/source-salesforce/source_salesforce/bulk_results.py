@@ -0,0 +1,221 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import logging
+import tempfile
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from queue import Empty, Full, Queue
+from typing import Any, Iterable, Mapping, Optional
+
+import pandas as pd
+import requests  # type: ignore[import]
+from numpy import nan
+
+from airbyte_cdk import HttpRequester, StreamSlice
+from source_salesforce.columnar import ColumnarTypeCoercer
+
+
+logger = logging.getLogger("airbyte")
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 64
+# the columnar coercion is vectorized, so it gets much larger chunks than the per-record one
+COLUMNAR_CHUNK_SIZE = 10_000
+# how long a blocked thread waits before checking whether the read has been stopped
+_WAIT_TIMEOUT_SECONDS = 0.5
+
+
+class StreamedResultPage(io.RawIOBase):
+    """
+    The body of a result page, appended to a temporary file by a download thread while it is being read.
+    A read blocks until more data is downloaded, so the CSV is parsed as it comes in from the socket
+    and the page is never held in memory as a whole.
+    """
+
+    def __init__(self, encoding: str) -> None:
+        super().__init__()
+        self.encoding = encoding
+        self._file = tempfile.TemporaryFile()
+        self._condition = threading.Condition()
+        self._written = 0
+        self._position = 0
+        self._complete = False
+        self._error: Optional[BaseException] = None
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        with self._condition:
+            if self.closed:
+                raise ValueError("The result page has been closed")
+            self._file.seek(self._written)
+            self._file.write(data)
+            self._written += len(data)
+            self._condition.notify_all()
+        return len(data)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        with self._condition:
+            self._complete = True
+            self._error = error
+            self._condition.notify_all()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        with self._condition:
+            while self._position == self._written and not self._complete:
+                self._condition.wait()
+            if self._error:
+                raise self._error
+            if self._position == self._written:
+                return 0
+            self._file.seek(self._position)
+            read = self._file.readinto(memoryview(buffer)[: self._written - self._position])
+            self._position += read
+            return read
+
+    def close(self) -> None:
+        with self._condition:
+            if not self.closed:
+                self._file.close()
+                super().close()
+
+
+class BulkResultsDownloader:
+    """
+    Reads the CSV results of a Bulk API 2.0 job, prefetching the next result pages while the current one is parsed.
+
+    The `Sforce-Locator` of the next page is in the headers of the current one, so the locator chain is followed by a
+    thread as soon as the headers come in, while the bodies are downloaded concurrently by up to `prefetch_pages`
+    threads, into temporary files. The pages are parsed in the locator order, hence the records are emitted in the
+    same order as with the sequential download.
+
+    With a `coercer`, the records are converted to the types of the stream schema column by column while they are parsed.
+    """
+
+    def __init__(
+        self, download_requester: HttpRequester, prefetch_pages: int, encoding: str, coercer: Optional[ColumnarTypeCoercer] = None
+    ) -> None:
+        self._download_requester = download_requester
+        self._prefetch_pages = prefetch_pages
+        self._default_encoding = encoding
+        self._coercer = coercer
+
+    def read_records(self, records_schema: Mapping[str, Any], stream_slice: Optional[StreamSlice] = None) -> Iterable[Mapping[str, Any]]:
+        """
+        Same interface as `SimpleRetriever.read_records`, which is all the AsyncHttpJobRepository needs.
+        """
+        stop = threading.Event()
+        pages: Queue = Queue(maxsize=self._prefetch_pages)
+        executor = ThreadPoolExecutor(max_workers=self._prefetch_pages + 1, thread_name_prefix="bulk-results")
+        executor.submit(self._request_pages, stream_slice, pages, executor, stop)
+        try:
+            while True:
+                page = pages.get()
+                if page is None:
+                    break
+                if isinstance(page, BaseException):
+                    raise page
+                with closing(page):
+                    yield from self._parse(page)
+        finally:
+            # the consumer is gone or failed: release the blocked threads and drop the pages not read yet
+            stop.set()
+            while True:
+                try:
+                    page = pages.get_nowait()
+                except Empty:
+                    break
+                if isinstance(page, StreamedResultPage):
+                    page.close()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _request_pages(
+        self, stream_slice: Optional[StreamSlice], pages: Queue, executor: ThreadPoolExecutor, stop: threading.Event
+    ) -> None:
+        locator = None
+        try:
+            while not stop.is_set():
+                response = self._download_requester.send_request(
+                    stream_slice=stream_slice, request_params={"locator": locator} if locator else {}
+                )
+                if response is None:
+                    break
+                page = StreamedResultPage(self._get_response_encoding(response))
+                executor.submit(self._download, response, page, stop)
+                if not self._put(pages, page, stop):
+                    page.close()
+                    return
+                locator = response.headers.get("Sforce-Locator")
+                if not locator or locator == "null":
+                    break
+        except Exception as exc:
+            self._put(pages, exc, stop)
+            return
+        self._put(pages, None, stop)
+
+    @staticmethod
+    def _put(pages: Queue, item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=_WAIT_TIMEOUT_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _download(self, response: requests.Response, page: StreamedResultPage, stop: threading.Event) -> None:
+        # same handling of the compressed responses and the null bytes as the CDK `ResponseToFileExtractor`
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        needs_decompression = True
+        error = None
+        try:
+            with closing(response):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if stop.is_set() or page.closed:
+                        return
+                    if needs_decompression:
+                        try:
+                            page.write(decompressor.decompress(chunk))
+                            continue
+                        except zlib.error:
+                            needs_decompression = False
+                    page.write(self._filter_null_bytes(chunk))
+        except Exception as exc:
+            error = exc
+        finally:
+            page.finish(error)
+
+    @staticmethod
+    def _filter_null_bytes(chunk: bytes) -> bytes:
+        filtered = chunk.replace(b"\x00", b"")
+        if len(filtered) < len(chunk):
+            logger.warning("Filter 'null' bytes from string, size reduced %d -> %d chars", len(chunk), len(filtered))
+        return filtered
+
+    def _get_response_encoding(self, response: requests.Response) -> str:
+        content_type = response.headers.get("content-type") or ""
+        for parameter in content_type.split(";")[1:]:
+            key, _, value = parameter.strip().partition("=")
+            if key.lower() == "charset":
+                return value.strip("'\"")
+        return self._default_encoding
+
+    def _parse(self, page: StreamedResultPage) -> Iterable[Mapping[str, Any]]:
+        """
+        Parse the page the same way as the CDK `ResponseToFileExtractor`, but from the stream being downloaded.
+        """
+        chunk_size = COLUMNAR_CHUNK_SIZE if self._coercer else 100
+        with io.TextIOWrapper(io.BufferedReader(page), encoding=page.encoding) as data:
+            try:
+                for chunk in pd.read_csv(data, chunksize=chunk_size, iterator=True, dialect="unix", dtype=object):
+                    if self._coercer:
+                        yield from self._coercer.to_records(chunk)
+                    else:
+                        yield from chunk.replace({nan: None}).to_dict(orient="records")
+            except pd.errors.EmptyDataError as e:
+                logger.info(f"Empty data received. {e}")
@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger("airbyte")
+
+# same spellings as the `TypeTransformer` boolean conversion
+_TRUTHY_STRINGS = ("y", "yes", "t", "true", "on", "1")
+_FALSEY_STRINGS = ("n", "no", "f", "false", "off", "0")
+# what `int()` accepts from a CSV cell, a decimal one like "1.0" stays a string
+_INTEGER_PATTERN = r"\s*[+-]?\d+\s*"
+# `transform_empty_string_to_none`, applied element-wise without the overhead of a pandas string method
+_is_blank = np.frompyfunc(lambda value: isinstance(value, str) and not value.strip(), 1, 1)
+
+
+class ColumnarTypeCoercer:
+    """
+    Converts a page of BULK CSV records to the types of the stream schema (as built by `Salesforce.field_to_property_schema`)
+    one column at a time, with vectorized pandas operations instead of a `TypeTransformer` pass over every value of every record.
+
+    The result is the same as the default schema normalization followed by `transform_empty_string_to_none`:
+    a value which can't be converted is left as a string, and blank strings and missing values become None.
+    """
+
+    def __init__(self, schema: Mapping[str, Any]):
+        self._column_types: Dict[str, Optional[str]] = {
+            name: self._get_target_type(property_schema) for name, property_schema in schema.get("properties", {}).items()
+        }
+        self._reported_columns: Set[str] = set()
+
+    @staticmethod
+    def _get_target_type(property_schema: Mapping[str, Any]) -> Optional[str]:
+        target_type = property_schema.get("type", [])
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            # the values of the columns with an ambiguous type are not converted
+            if len(target_type) != 1:
+                return None
+            target_type = target_type[0]
+        return target_type
+
+    def to_records(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        columns = list(frame.columns)
+        values = [self.coerce_column(name, frame[name]).tolist() for name in columns]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+
+    def coerce_column(self, name: str, column: pd.Series) -> np.ndarray:
+        """
+        :return: The values of the column as an array of python objects.
+        """
+        values = column.to_numpy(dtype=object, copy=True)
+        present = column.notna().to_numpy()
+        values[~present] = None
+        if name not in self._column_types or not present.any():
+            return values
+
+        strings = values[present]
+        target_type = self._column_types[name]
+        converted = np.zeros(len(strings), dtype=bool)
+        if target_type == "number":
+            numbers = pd.to_numeric(strings, errors="coerce")
+            converted = ~np.isnan(numbers)
+            strings[converted] = numbers[converted].astype(float).astype(object)
+        elif target_type == "integer":
+            converted = pd.Series(strings).str.fullmatch(_INTEGER_PATTERN).to_numpy(dtype=bool)
+            strings[converted] = self._to_integers(strings[converted])
+        elif target_type == "boolean":
+            lowered = pd.Series(strings).str.strip().str.lower()
+            truthy = lowered.isin(_TRUTHY_STRINGS).to_numpy()
+            falsey = lowered.isin(_FALSEY_STRINGS).to_numpy()
+            strings[truthy] = True
+            strings[falsey] = False
+            converted = truthy | falsey
+
+        blank = np.zeros(len(strings), dtype=bool)
+        blank[~converted] = _is_blank(strings[~converted]).astype(bool)
+        strings[blank] = None
+        values[present] = strings
+        if target_type in ("number", "integer", "boolean"):
+            self._report_unconverted(name, target_type, int((~blank & ~converted).sum()))
+        return values
+
+    @staticmethod
+    def _to_integers(strings: np.ndarray) -> np.ndarray:
+        integers = pd.to_numeric(strings, errors="coerce")
+        if integers.dtype.kind in "iu":
+            return integers.astype(object)
+        # out of the int64 range (or with non-ASCII digits), pandas falls back to floats which would lose digits
+        return np.array([int(value) for value in strings], dtype=object)
+
+    def _report_unconverted(self, name: str, target_type: str, count: int) -> None:
+        if count and name not in self._reported_columns:
+            self._reported_columns.add(name)
+            logger.warning(f"Failed to transform {count} value(s) of column '{name}' to type '{target_type}', they are kept as strings.")
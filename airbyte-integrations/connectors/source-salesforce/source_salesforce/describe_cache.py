@@ -0,0 +1,72 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+
+logger = logging.getLogger("airbyte")
+
+
+@dataclass
+class CachedDescribe:
+    # the `If-Modified-Since` value to revalidate the response with, an HTTP date
+    fetched_at: str
+    response: Mapping[str, Any]
+
+
+class DescribeCache:
+    """
+    On-disk cache of the describe responses, keyed by the identity URL of the authenticated user (it holds the org and the
+    user ids, as the describes depend on the permissions of the user), instance URL, API version and sObject (None for the
+    global describe).
+    A cached response is revalidated with an `If-Modified-Since` request, so check, discover and read share the cache
+    and only the sObjects whose metadata changed since are downloaded again.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, identity: str, instance_url: str, version: str, sobject: Optional[str]) -> Optional[CachedDescribe]:
+        try:
+            with open(self._path(identity, instance_url, version, sobject), "r") as cache_file:
+                return CachedDescribe(**json.load(cache_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning(f"Ignoring the unreadable cached describe of {sobject or 'all sObjects'}: {exc}")
+            return None
+
+    def set(self, identity: str, instance_url: str, version: str, sobject: Optional[str], cached_describe: CachedDescribe) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temporary file first, so a concurrent reader never sees a partial entry
+            with tempfile.NamedTemporaryFile("w", dir=self.directory, delete=False) as cache_file:
+                json.dump({"fetched_at": cached_describe.fetched_at, "response": cached_describe.response}, cache_file)
+            os.replace(cache_file.name, self._path(identity, instance_url, version, sobject))
+        except (OSError, TypeError) as exc:
+            logger.warning(f"Could not cache the describe of {sobject or 'all sObjects'}: {exc}")
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def log_summary(self) -> None:
+        logger.info(f"Describe cache: {self.hits} hit(s), {self.misses} miss(es).")
+
+    def _path(self, identity: str, instance_url: str, version: str, sobject: Optional[str]) -> str:
+        digest = hashlib.sha256(json.dumps([identity, instance_url, version, sobject]).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
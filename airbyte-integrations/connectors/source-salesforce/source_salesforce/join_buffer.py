@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import shutil
+import sqlite3
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, MutableMapping, Optional, Tuple
+
+
+class PropertyChunkJoinBuffer:
+    """
+    Sticks together the parts of the records read by property chunks, by their primary key.
+
+    The partial records are kept in memory up to `max_records_in_memory`. Past that, the oldest ones are spilled to
+    a SQLite database in a temporary directory, so a backfill of a wide object has a bounded memory footprint
+    whatever the number of records waiting for their other chunks.
+    """
+
+    def __init__(self, chunks_count: int, max_records_in_memory: int = 100_000):
+        self.chunks_count = chunks_count
+        self.max_records_in_memory = max_records_in_memory
+        self._records: "OrderedDict[Any, Tuple[MutableMapping[str, Any], int]]" = OrderedDict()
+        self._records_on_disk = 0
+        self._directory: Optional[str] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self.completed_records = 0
+        self.peak_size = 0
+        self.spilled_records = 0
+
+    @property
+    def size(self) -> int:
+        """The number of the partial records waiting for their other chunks."""
+        return len(self._records) + self._records_on_disk
+
+    def add(self, record_id: Any, record: MutableMapping[str, Any]) -> Optional[MutableMapping[str, Any]]:
+        """
+        :return: The complete record once its parts of all the chunks are added, None otherwise.
+        """
+        if record_id in self._records:
+            partial_record, counter = self._records.pop(record_id)
+        else:
+            partial_record, counter = self._pop_from_disk(record_id) or ({}, 0)
+        if counter:
+            partial_record.update(record)
+        else:
+            partial_record = record
+        counter += 1
+
+        if counter == self.chunks_count:
+            self.completed_records += 1
+            return partial_record
+
+        self._records[record_id] = (partial_record, counter)
+        self.peak_size = max(self.peak_size, self.size)
+        if len(self._records) > self.max_records_in_memory:
+            self._spill()
+        return None
+
+    def incomplete_record_ids(self) -> List[Any]:
+        record_ids = list(self._records)
+        if self._records_on_disk:
+            record_ids.extend(json.loads(row[0]) for row in self._connection.execute("SELECT id FROM partial_records"))
+        return record_ids
+
+    def close(self) -> None:
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+        if self._directory:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def _spill(self) -> None:
+        """Move the oldest tenth of the records in memory to the disk."""
+        if not self._connection:
+            self._directory = tempfile.mkdtemp(prefix="salesforce-join-")
+            self._connection = sqlite3.connect(str(Path(self._directory) / "partial_records.db"))
+            self._connection.execute("CREATE TABLE partial_records (id TEXT PRIMARY KEY, record TEXT, counter INTEGER)")
+
+        rows = []
+        for _ in range(max(1, self.max_records_in_memory // 10)):
+            record_id, (partial_record, counter) = self._records.popitem(last=False)
+            rows.append((json.dumps(record_id), json.dumps(partial_record), counter))
+        self._connection.executemany("INSERT INTO partial_records VALUES (?, ?, ?)", rows)
+        self._records_on_disk += len(rows)
+        self.spilled_records += len(rows)
+
+    def _pop_from_disk(self, record_id: Any) -> Optional[Tuple[MutableMapping[str, Any], int]]:
+        if not self._records_on_disk:
+            return None
+        key = json.dumps(record_id)
+        row = self._connection.execute("SELECT record, counter FROM partial_records WHERE id = ?", (key,)).fetchone()
+        if not row:
+            return None
+        self._connection.execute("DELETE FROM partial_records WHERE id = ?", (key,))
+        self._records_on_disk -= 1
+        return json.loads(row[0]), row[1]
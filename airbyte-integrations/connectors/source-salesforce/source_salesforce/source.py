@@ -158,6 +158,9 @@ class SourceSalesforce(ConcurrentSourceAdapter):
             "start_date": config.get("start_date"),
             "job_tracker": self._job_tracker,
             "message_repository": self.message_repository,
+            "property_chunk_concurrency": config.get("property_chunk_concurrency"),
+            "bulk_results_prefetch_pages": config.get("bulk_results_prefetch_pages"),
+            "bulk_columnar_type_coercion": config.get("bulk_columnar_type_coercion", False),
         }
 
         api_type = self._get_api_type(stream_name, json_schema, config.get("force_use_bulk_api", False))
@@ -6,6 +6,7 @@ import csv
 import ctypes
 import urllib.parse
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
@@ -52,6 +53,9 @@ from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 from .api import PARENT_SALESFORCE_OBJECTS, UNSUPPORTED_FILTERING_STREAMS, Salesforce
 from .availability_strategy import SalesforceAvailabilityStrategy
+from .bulk_results import BulkResultsDownloader
+from .columnar import ColumnarTypeCoercer
+from .join_buffer import PropertyChunkJoinBuffer
 from .rate_limiting import BulkNotSupportedException, SalesforceErrorHandler, default_backoff_handler
 
 
@@ -80,6 +84,9 @@ class SalesforceStream(HttpStream, ABC):
         sobject_options: Mapping[str, Any] = None,
         schema: dict = None,
         start_date=None,
+        property_chunk_concurrency: Optional[int] = None,
+        bulk_results_prefetch_pages: Optional[int] = None,
+        bulk_columnar_type_coercion: bool = False,
         **kwargs,
     ):
         self.stream_name = stream_name
@@ -89,6 +96,9 @@ class SalesforceStream(HttpStream, ABC):
         self.schema: Mapping[str, Any] = schema  # type: ignore[assignment]
         self.sobject_options = sobject_options
         self.start_date = self.format_start_date(start_date)
+        self.property_chunk_concurrency = property_chunk_concurrency
+        self.bulk_results_prefetch_pages = bulk_results_prefetch_pages
+        self.bulk_columnar_type_coercion = bulk_columnar_type_coercion
         self._job_tracker = job_tracker
         self._message_repository = message_repository
         self._http_client = HttpClient(
@@ -182,6 +192,8 @@ class PropertyChunk:
 
 class RestSalesforceStream(SalesforceStream):
     state_converter = IsoMillisConcurrentStreamStateConverter(is_sequential_state=False)
+    # the partial records kept in memory when the property chunks are read concurrently, the older ones are spilled to disk
+    JOIN_BUFFER_MAX_RECORDS_IN_MEMORY = 100_000
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -274,6 +286,10 @@ class RestSalesforceStream(SalesforceStream):
         stream_slice: Mapping[str, Any] = None,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[StreamData]:
+        if self.property_chunk_concurrency and self.too_many_properties:
+            yield from self._read_pages_concurrently(records_generator_fn, stream_slice, stream_state)
+            return
+
         stream_state = stream_state or {}
         records_by_primary_key = {}
         property_chunks: Mapping[int, PropertyChunk] = {
@@ -335,6 +351,64 @@ class RestSalesforceStream(SalesforceStream):
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
+    def _read_pages_concurrently(
+        self,
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]
+        ],
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[StreamData]:
+        """
+        Request the next page of all the property chunks at once, up to `property_chunk_concurrency` at the same time.
+        As every chunk is ordered by the primary key, the pages of a round cover about the same records, which are
+        stuck together in a join buffer spilling to disk, so its memory footprint stays bounded on backfills.
+        """
+        stream_state = stream_state or {}
+        property_chunks = [PropertyChunk(properties=properties) for properties in self.chunk_properties()]
+        join_buffer = PropertyChunkJoinBuffer(len(property_chunks), max_records_in_memory=self.JOIN_BUFFER_MAX_RECORDS_IN_MEMORY)
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.property_chunk_concurrency, len(property_chunks)), thread_name_prefix=f"{self.name}-property-chunks"
+        )
+        try:
+            while True:
+                non_exhausted_chunks = [chunk for chunk in property_chunks if chunk.first_time or chunk.next_page]
+                if not non_exhausted_chunks:
+                    # pagination complete
+                    break
+
+                futures = [
+                    executor.submit(
+                        self._fetch_next_page_for_chunk, stream_slice, stream_state, property_chunk.next_page, property_chunk.properties
+                    )
+                    for property_chunk in non_exhausted_chunks
+                ]
+                # the pages are joined in the order of the chunks, as they would be read one by one
+                for property_chunk, future in zip(non_exhausted_chunks, futures):
+                    request, response = future.result()
+                    property_chunk.first_time = False
+                    property_chunk.next_page = self.next_page_token(response)
+                    for record in records_generator_fn(request, response, stream_state, stream_slice):
+                        property_chunk.record_counter += 1
+                        complete_record = join_buffer.add(record[self.primary_key], record)
+                        if complete_record is not None:
+                            yield complete_record
+
+            # see `_read_pages` about the records missing in some of the chunks
+            incomplete_record_ids = join_buffer.incomplete_record_ids()
+            if incomplete_record_ids:
+                self.logger.warning(
+                    f"Inconsistent record(s) with primary keys {','.join(str(key) for key in incomplete_record_ids)} found. Skipping them."
+                )
+            self.logger.info(
+                f"Joined {join_buffer.completed_records} records of {self.name} from {len(property_chunks)} property chunks: "
+                f"join buffer peak size {join_buffer.peak_size} records ({join_buffer.spilled_records} spilled to disk), "
+                f"{len(incomplete_record_ids)} incomplete records."
+            )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            join_buffer.close()
+
     @default_backoff_handler(max_tries=5)  # FIXME remove once HttpStream relies on the HttpClient
     def _fetch_next_page_for_chunk(
         self,
@@ -506,6 +580,9 @@ class BulkSalesforceStream(SalesforceStream):
         self._switch_from_bulk_to_rest = False
         self._rest_stream = None
         super().__init__(**kwargs)
+        if self.bulk_columnar_type_coercion:
+            # the BULK records are already converted while their CSV page is parsed
+            self.transformer = TypeTransformer(TransformConfig.NoTransform)
 
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         """
@@ -707,7 +784,16 @@ class BulkSalesforceStream(SalesforceStream):
         job_repository = AsyncHttpJobRepository(
             creation_requester=creation_requester,
             polling_requester=polling_requester,
-            download_retriever=download_retriever,
+            download_retriever=(
+                BulkResultsDownloader(
+                    download_requester,
+                    self.bulk_results_prefetch_pages or 1,
+                    self.encoding,
+                    coercer=ColumnarTypeCoercer(self.get_json_schema()) if self.bulk_columnar_type_coercion else None,
+                )
+                if self.bulk_results_prefetch_pages or self.bulk_columnar_type_coercion
+                else download_retriever
+            ),
             abort_requester=abort_requester,
             delete_requester=delete_requester,
             status_extractor=status_extractor,
@@ -807,6 +893,12 @@ class BulkSalesforceStream(SalesforceStream):
                 pass
             else:
                 yield from self._bulk_job_stream.read_records(sync_mode, cursor_field, stream_slice, stream_state)
+        elif self.bulk_columnar_type_coercion:
+            # the REST records don't go through the columnar coercion, normalize them as the BULK stream otherwise would
+            schema = self.get_json_schema()
+            for record in self._rest_stream.read_records(sync_mode, cursor_field, stream_slice, stream_state):
+                BulkSalesforceStream.transformer.transform(record, schema)
+                yield record
         else:
             yield from self._rest_stream.read_records(sync_mode, cursor_field, stream_slice, stream_state)
 
@@ -843,6 +935,7 @@ class BulkSalesforceStream(SalesforceStream):
             authenticator=self._http_client._session.auth,
             job_tracker=self._job_tracker,
             message_repository=self._message_repository,
+            property_chunk_concurrency=self.property_chunk_concurrency,
         )
         new_cls: Type[SalesforceStream] = RestSalesforceStream
         if isinstance(self, BulkIncrementalSalesforceStream):
@@ -9,6 +9,7 @@ import re
 from datetime import datetime, timedelta
 from typing import List
 from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
 
 import freezegun
 import pytest
@@ -532,6 +533,34 @@ def test_too_many_properties(stream_config, stream_api_v2_pk_too_many_properties
         assert len(call.url) < Salesforce.REQUEST_SIZE_LIMITS
 
 
+def test_too_many_properties_read_concurrently(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
+    stream = generate_stream("Account", {**stream_config, "property_chunk_concurrency": 4}, stream_api_v2_pk_too_many_properties)
+    chunks = [",".join(chunk) for chunk in stream.chunk_properties()]
+    assert stream.too_many_properties
+    assert type(stream) == RestSalesforceStream
+
+    def first_page(request, context):
+        chunk_id = chunks.index(parse_qs(urlparse(request.url).query)["q"][0].split(" ")[1])
+        return {
+            "records": [{"Id": 1, f"property{chunk_id}": chunk_id}, {"Id": 2, f"property{chunk_id}": chunk_id}],
+            "nextRecordsUrl": f"/services/data/{API_VERSION}/query/next-{chunk_id}",
+        }
+
+    def next_page(request, context):
+        chunk_id = int(request.path.rsplit("-", 1)[1])
+        # the record 4 is missing in the first chunk
+        record_ids = [3] if chunk_id == 0 else [3, 4]
+        return {"records": [{"Id": record_id, f"property{chunk_id}": chunk_id} for record_id in record_ids]}
+
+    requests_mock.get(f"https://fase-account.salesforce.com/services/data/{API_VERSION}/queryAll", json=first_page)
+    requests_mock.get(re.compile(r"/query/next-\d+$"), json=next_page)
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert records == [{"Id": record_id, **{f"property{chunk_id}": chunk_id for chunk_id in range(len(chunks))}} for record_id in (1, 2, 3)]
+    assert requests_mock.call_count == 2 * len(chunks)
+
+
 def test_stream_with_no_records_in_response(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
     stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
     chunks = list(stream.chunk_properties())
@@ -23,6 +23,14 @@ class ConfigBuilder:
         self._config["stream_slice_step"] = stream_slice_step
         return self
 
+    def bulk_results_prefetch_pages(self, prefetch_pages: int) -> "ConfigBuilder":
+        self._config["bulk_results_prefetch_pages"] = prefetch_pages
+        return self
+
+    def bulk_columnar_type_coercion(self, enabled: bool = True) -> "ConfigBuilder":
+        self._config["bulk_columnar_type_coercion"] = enabled
+        return self
+
     def client_id(self, client_id: str) -> "ConfigBuilder":
         self._config["client_id"] = client_id
         return self
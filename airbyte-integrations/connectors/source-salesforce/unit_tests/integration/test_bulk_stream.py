@@ -275,6 +275,79 @@ class BulkStreamTest(TestCase):
 
         assert len(output.records) == 2
 
+    @freezegun.freeze_time(_NOW.isoformat())
+    def test_given_locators_and_prefetch_when_read_then_extract_records_from_all_pages_in_order(self):
+        given_stream(self._http_mocker, _BASE_URL, _STREAM_NAME, SalesforceDescribeResponseBuilder().field(_A_FIELD_NAME))
+        self._http_mocker.post(
+            _make_full_job_request([_A_FIELD_NAME]),
+            JobCreateResponseBuilder().with_id(_JOB_ID).build(),
+        )
+        self._http_mocker.get(
+            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}"),
+            JobInfoResponseBuilder().with_id(_JOB_ID).with_state("JobComplete").build(),
+        )
+        self._http_mocker.get(
+            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}/results"),
+            HttpResponse(f"{_A_FIELD_NAME}\nvalue_0\nvalue_1", headers={"Sforce-Locator": "locator-1"}),
+        )
+        for page in range(1, 5):
+            self._http_mocker.get(
+                HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}/results", query_params={"locator": f"locator-{page}"}),
+                HttpResponse(
+                    f"{_A_FIELD_NAME}\nvalue_{page * 2}\nvalue_{page * 2 + 1}",
+                    headers={"Sforce-Locator": f"locator-{page + 1}" if page < 4 else "null"},
+                ),
+            )
+        self._mock_delete_job(_JOB_ID)
+
+        output = read(_STREAM_NAME, SyncMode.full_refresh, self._config.bulk_results_prefetch_pages(2))
+
+        assert [record.record.data[_A_FIELD_NAME] for record in output.records] == [f"value_{i}" for i in range(10)]
+
+    @freezegun.freeze_time(_NOW.isoformat())
+    def test_given_columnar_type_coercion_when_read_then_fields_are_casted_with_schema_types(self):
+        given_stream(
+            self._http_mocker,
+            _BASE_URL,
+            _STREAM_NAME,
+            SalesforceDescribeResponseBuilder()
+            .field(_A_FIELD_NAME)
+            .field("an_int_field", "int")
+            .field("a_double_field", "double")
+            .field("a_boolean_field", "boolean"),
+        )
+        self._http_mocker.post(
+            _make_full_job_request([_A_FIELD_NAME, "an_int_field", "a_double_field", "a_boolean_field"]),
+            JobCreateResponseBuilder().with_id(_JOB_ID).build(),
+        )
+        self._http_mocker.get(
+            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}"),
+            JobInfoResponseBuilder().with_id(_JOB_ID).with_state("JobComplete").build(),
+        )
+        self._http_mocker.get(
+            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}/results"),
+            HttpResponse(
+                "\n".join(
+                    [
+                        f"{_A_FIELD_NAME},an_int_field,a_double_field,a_boolean_field",
+                        'value," 12 ",1.5,true',
+                        '" ",not_an_int,,false',
+                        "",
+                    ]
+                )
+            ),
+        )
+        self._mock_delete_job(_JOB_ID)
+
+        output = read(_STREAM_NAME, SyncMode.full_refresh, self._config.bulk_columnar_type_coercion())
+
+        fields = [_A_FIELD_NAME, "an_int_field", "a_double_field", "a_boolean_field"]
+        # the null fields are not emitted
+        assert [{field: record.record.data.get(field) for field in fields} for record in output.records] == [
+            {_A_FIELD_NAME: "value", "an_int_field": 12, "a_double_field": 1.5, "a_boolean_field": True},
+            {_A_FIELD_NAME: None, "an_int_field": "not_an_int", "a_double_field": None, "a_boolean_field": False},
+        ]
+
     @freezegun.freeze_time(_NOW.isoformat())
     def test_given_job_creation_have_transient_error_when_read_then_sync_properly(self):
         given_stream(self._http_mocker, _BASE_URL, _STREAM_NAME, SalesforceDescribeResponseBuilder().field(_A_FIELD_NAME))
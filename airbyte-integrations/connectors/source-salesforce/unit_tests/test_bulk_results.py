@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from source_salesforce.bulk_results import BulkResultsDownloader, StreamedResultPage
+
+
+def _response(body: bytes, locator: str = None, content_type: str = "text/csv") -> Mock:
+    response = Mock()
+    response.headers = {"Sforce-Locator": locator, "content-type": content_type} if locator else {"content-type": content_type}
+    response.iter_content.return_value = [body[i : i + 5] for i in range(0, len(body), 5)]
+    return response
+
+
+def test_streamed_result_page_is_read_while_written() -> None:
+    page = StreamedResultPage("utf-8")
+
+    def write() -> None:
+        for line in (b"a_field\n", b"first\n", b"second\n"):
+            time.sleep(0.01)
+            page.write(line)
+        page.finish()
+
+    threading.Thread(target=write).start()
+    assert page.readall().endswith(b"second\n")
+    page.close()
+
+
+def test_streamed_result_page_raises_download_error() -> None:
+    page = StreamedResultPage("utf-8")
+    page.write(b"a_field\n")
+    page.finish(ConnectionError("connection reset"))
+
+    with pytest.raises(ConnectionError):
+        page.readall()
+
+
+def test_read_records_follows_locators_in_order() -> None:
+    requester = Mock()
+    requester.send_request.side_effect = [
+        _response(b"a_field,another_field\n1,\n2,b\n", locator="locator-1"),
+        _response(b"a_field,another_field\n3,c\n", locator="locator-2"),
+        _response(b"a_field,another_field\n4,d\n", locator="null"),
+    ]
+
+    records = list(BulkResultsDownloader(requester, prefetch_pages=2, encoding="utf-8").read_records({}, None))
+
+    assert records == [
+        {"a_field": "1", "another_field": None},
+        {"a_field": "2", "another_field": "b"},
+        {"a_field": "3", "another_field": "c"},
+        {"a_field": "4", "another_field": "d"},
+    ]
+    assert [call.kwargs["request_params"] for call in requester.send_request.call_args_list] == [
+        {},
+        {"locator": "locator-1"},
+        {"locator": "locator-2"},
+    ]
+
+
+def test_read_records_uses_charset_and_filters_null_bytes() -> None:
+    requester = Mock()
+    requester.send_request.return_value = _response(b'"\xc4"\n"4"\n\x00"\xca \xfc"\n', content_type="text/csv; charset=ISO-8859-1")
+
+    records = list(BulkResultsDownloader(requester, prefetch_pages=1, encoding="utf-8").read_records({}, None))
+
+    assert records == [{"Ä": "4"}, {"Ä": "Ê ü"}]
+
+
+def test_read_records_raises_request_error() -> None:
+    requester = Mock()
+    requester.send_request.side_effect = [_response(b"a_field\n1\n", locator="locator-1"), ValueError("request failed")]
+
+    with pytest.raises(ValueError):
+        list(BulkResultsDownloader(requester, prefetch_pages=2, encoding="utf-8").read_records({}, None))
@@ -0,0 +1,133 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import csv
+import logging
+import os
+import random
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from numpy import nan
+from source_salesforce.api import Salesforce
+from source_salesforce.bulk_results import COLUMNAR_CHUNK_SIZE
+from source_salesforce.columnar import ColumnarTypeCoercer
+from source_salesforce.streams import BulkSalesforceStream
+
+
+_SALESFORCE_TYPES = ["string", "double", "int", "boolean", "datetime", "currency", "picklist", "percent"]
+
+
+def _schema(fields):
+    return {"type": "object", "properties": {name: Salesforce.field_to_property_schema({"type": sf_type}) for name, sf_type in fields}}
+
+
+def _type_transformer_records(frame: pd.DataFrame, schema):
+    records = frame.replace({nan: None}).to_dict(orient="records")
+    for record in records:
+        BulkSalesforceStream.transformer.transform(record, schema)
+    return records
+
+
+def test_coercion_is_the_same_as_the_type_transformer() -> None:
+    schema = _schema([("a_string", "string"), ("a_double", "double"), ("an_int", "int"), ("a_boolean", "boolean"), ("a_date", "date")])
+    frame = pd.DataFrame(
+        {
+            "a_string": ["value", " ", "", " padded ", None, "12", "true"],
+            "a_double": ["1.5", " 2 ", "", "not_a_number", None, "-1e3", "12"],
+            "an_int": ["12", " 3 ", "", "1.0", None, "+7", "-0"],
+            "a_boolean": ["true", " YES ", "", "maybe", None, "0", "Off"],
+            "a_date": ["2024-01-01", " ", "", "not_a_date", None, "2024-01-01", "2024-01-02"],
+            "not_in_schema": ["value", " ", "", "1", None, "2", "3"],
+        },
+        dtype=object,
+    )
+
+    records = ColumnarTypeCoercer(schema).to_records(frame)
+
+    expected_records = _type_transformer_records(frame, schema)
+    assert records == expected_records
+    # 1 == 1.0 == True, the types are compared on their own
+    assert [{key: type(value) for key, value in record.items()} for record in records] == [
+        {key: type(value) for key, value in record.items()} for record in expected_records
+    ]
+
+
+def test_integer_out_of_int64_range_keeps_all_digits() -> None:
+    schema = _schema([("an_int", "int")])
+    frame = pd.DataFrame({"an_int": ["123456789012345678901234567890", "1"]}, dtype=object)
+
+    assert ColumnarTypeCoercer(schema).to_records(frame) == [{"an_int": 123456789012345678901234567890}, {"an_int": 1}]
+
+
+def test_unconverted_values_are_reported_once_per_column(caplog) -> None:
+    coercer = ColumnarTypeCoercer(_schema([("a_double", "double")]))
+
+    with caplog.at_level(logging.WARNING):
+        coercer.to_records(pd.DataFrame({"a_double": ["not_a_number", "1"]}, dtype=object))
+        coercer.to_records(pd.DataFrame({"a_double": ["still_not_a_number"]}, dtype=object))
+
+    assert [record.message for record in caplog.records] == [
+        "Failed to transform 1 value(s) of column 'a_double' to type 'number', they are kept as strings."
+    ]
+
+
+def _write_csv(path: Path, fields, rows: int) -> None:
+    generators = {
+        "string": lambda: random.choice(["a value", "another value", "", " "]),
+        "double": lambda: random.choice([f"{random.uniform(-1000, 1000):.2f}", ""]),
+        "int": lambda: random.choice([str(random.randint(-1000, 1000)), ""]),
+        "boolean": lambda: random.choice(["true", "false"]),
+        "datetime": lambda: "2024-01-18T21:18:20.000Z",
+        "currency": lambda: f"{random.uniform(0, 100):.2f}",
+        "picklist": lambda: random.choice(["Open", "Closed", ""]),
+        "percent": lambda: random.choice(["12.5", "100", ""]),
+    }
+    row_generators = [generators[sf_type] for _, sf_type in fields]
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file, dialect="unix")
+        writer.writerow([name for name, _ in fields])
+        for _ in range(rows):
+            writer.writerow([generate() for generate in row_generators])
+
+
+def _fields(columns: int):
+    return [(f"field_{index}", _SALESFORCE_TYPES[index % len(_SALESFORCE_TYPES)]) for index in range(columns)]
+
+
+def test_columnar_coercion_matches_type_transformer_on_a_csv(tmp_path) -> None:
+    random.seed(42)
+    fields = _fields(columns=2 * len(_SALESFORCE_TYPES))
+    schema = _schema(fields)
+    csv_path = tmp_path / "results.csv"
+    _write_csv(csv_path, fields, rows=200)
+
+    coercer = ColumnarTypeCoercer(schema)
+    for frame in pd.read_csv(csv_path, chunksize=COLUMNAR_CHUNK_SIZE, iterator=True, dialect="unix", dtype=object):
+        assert coercer.to_records(frame) == _type_transformer_records(frame, schema)
+
+
+@pytest.mark.skipif(not os.getenv("SALESFORCE_COLUMNAR_BENCHMARK_ROWS"), reason="set SALESFORCE_COLUMNAR_BENCHMARK_ROWS to run it")
+def test_benchmark_columnar_coercion_against_type_transformer(tmp_path) -> None:
+    rows = int(os.environ["SALESFORCE_COLUMNAR_BENCHMARK_ROWS"])
+    random.seed(42)
+    fields = _fields(columns=200)
+    schema = _schema(fields)
+    csv_path = tmp_path / "results.csv"
+    _write_csv(csv_path, fields, rows)
+
+    coercer = ColumnarTypeCoercer(schema)
+    columnar_seconds = transformer_seconds = 0.0
+    for frame in pd.read_csv(csv_path, chunksize=COLUMNAR_CHUNK_SIZE, iterator=True, dialect="unix", dtype=object):
+        start = time.perf_counter()
+        coercer.to_records(frame)
+        columnar_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        _type_transformer_records(frame, schema)
+        transformer_seconds += time.perf_counter() - start
+
+    logging.getLogger("airbyte").info(
+        f"{rows} rows x {len(fields)} columns: columnar coercion {columnar_seconds:.2f}s, TypeTransformer {transformer_seconds:.2f}s"
+    )
@@ -0,0 +1,116 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import logging
+
+import pytest
+from config_builder import ConfigBuilder
+from source_salesforce.api import API_VERSION, Salesforce
+
+
+_INSTANCE_URL = "https://instance.salesforce.com"
+_IDENTITY_URL = "https://login.salesforce.com/id/00D000000000001/005000000000001"
+_GLOBAL_DESCRIBE_URL = f"{_INSTANCE_URL}/services/data/{API_VERSION}/sobjects"
+_GLOBAL_DESCRIBE = {"sobjects": [{"name": "Account", "queryable": True}, {"name": "Contact", "queryable": True}]}
+
+
+def _describe_url(sobject: str) -> str:
+    return f"{_INSTANCE_URL}/services/data/{API_VERSION}/sobjects/{sobject}/describe"
+
+
+def _describe(sobject: str, field: str = "Id"):
+    return {"name": sobject, "fields": [{"name": field, "type": "id"}]}
+
+
+def _salesforce(cache_dir: str) -> Salesforce:
+    salesforce = Salesforce(**ConfigBuilder().build(), describe_cache_dir=cache_dir)
+    salesforce.access_token = "an_access_token"
+    salesforce.instance_url = _INSTANCE_URL
+    salesforce.identity_url = _IDENTITY_URL
+    return salesforce
+
+
+@pytest.fixture
+def first_run(tmp_path, requests_mock):
+    requests_mock.get(_GLOBAL_DESCRIBE_URL, json=_GLOBAL_DESCRIBE)
+    requests_mock.get(_describe_url("Account"), json=_describe("Account"))
+    requests_mock.get(_describe_url("Contact"), json=_describe("Contact"))
+    salesforce = _salesforce(str(tmp_path))
+    salesforce.generate_schemas(salesforce.get_validated_streams(config={}))
+    requests_mock.reset_mock()
+    return str(tmp_path)
+
+
+def test_describe_is_not_cached_by_default(requests_mock):
+    requests_mock.get(_describe_url("Account"), json=_describe("Account"))
+    salesforce = _salesforce(None)
+
+    salesforce.describe("Account")
+    salesforce.describe("Account")
+
+    assert requests_mock.call_count == 2
+    assert "If-Modified-Since" not in requests_mock.last_request.headers
+
+
+def test_given_metadata_unchanged_when_generate_schemas_then_only_global_describe_is_requested(first_run, requests_mock, caplog):
+    requests_mock.get(_GLOBAL_DESCRIBE_URL, status_code=304)
+    salesforce = _salesforce(first_run)
+
+    with caplog.at_level(logging.INFO):
+        schemas = salesforce.generate_schemas(salesforce.get_validated_streams(config={}))
+
+    assert set(schemas) == {"Account", "Contact"}
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.headers["If-Modified-Since"]
+    assert "Describe cache: 3 hit(s), 0 miss(es)." in caplog.messages
+
+
+def test_given_metadata_changed_when_generate_schemas_then_only_changed_sobjects_are_downloaded(first_run, requests_mock):
+    requests_mock.get(_GLOBAL_DESCRIBE_URL, json=_GLOBAL_DESCRIBE)
+    requests_mock.get(_describe_url("Account"), status_code=304)
+    requests_mock.get(_describe_url("Contact"), json=_describe("Contact", field="Email"))
+    salesforce = _salesforce(first_run)
+
+    schemas = salesforce.generate_schemas(salesforce.get_validated_streams(config={}))
+
+    assert list(schemas["Account"]["properties"]) == ["Id"]
+    assert list(schemas["Contact"]["properties"]) == ["Email"]
+    assert all("If-Modified-Since" in request.headers for request in requests_mock.request_history)
+    assert (salesforce._describe_cache.hits, salesforce._describe_cache.misses) == (1, 2)
+
+    # the changed describe is cached as well
+    requests_mock.get(_GLOBAL_DESCRIBE_URL, status_code=304)
+    salesforce = _salesforce(first_run)
+    salesforce.describe()
+    assert list(salesforce.generate_schema("Contact")["properties"]) == ["Email"]
+    assert requests_mock.last_request.url == _GLOBAL_DESCRIBE_URL
+
+
+def test_cache_is_keyed_by_instance_url(first_run, requests_mock):
+    another_instance_url = "https://another-instance.salesforce.com"
+    requests_mock.get(f"{another_instance_url}/services/data/{API_VERSION}/sobjects/Account/describe", json=_describe("Account"))
+    salesforce = _salesforce(first_run)
+    salesforce.instance_url = another_instance_url
+
+    salesforce.describe("Account")
+
+    assert "If-Modified-Since" not in requests_mock.last_request.headers
+
+
+def test_cache_is_keyed_by_user(first_run, requests_mock):
+    salesforce = _salesforce(first_run)
+    salesforce.identity_url = "https://login.salesforce.com/id/00D000000000001/005000000000002"
+
+    salesforce.describe("Account")
+
+    assert "If-Modified-Since" not in requests_mock.last_request.headers
+
+
+def test_describe_is_not_cached_without_the_identity_of_the_user(first_run, requests_mock):
+    salesforce = _salesforce(first_run)
+    salesforce.identity_url = ""
+
+    salesforce.describe("Account")
+    salesforce.describe("Account")
+
+    assert requests_mock.call_count == 2
+    assert "If-Modified-Since" not in requests_mock.last_request.headers
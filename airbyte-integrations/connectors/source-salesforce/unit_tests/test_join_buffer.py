@@ -0,0 +1,45 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import os
+
+from source_salesforce.join_buffer import PropertyChunkJoinBuffer
+
+
+def test_record_is_complete_once_all_chunks_are_added() -> None:
+    join_buffer = PropertyChunkJoinBuffer(chunks_count=3)
+
+    assert join_buffer.add("1", {"Id": "1", "a": "A"}) is None
+    assert join_buffer.add("1", {"Id": "1", "b": "B"}) is None
+    assert join_buffer.add("1", {"Id": "1", "c": "C"}) == {"Id": "1", "a": "A", "b": "B", "c": "C"}
+    assert join_buffer.size == 0
+    assert join_buffer.completed_records == 1
+    assert join_buffer.incomplete_record_ids() == []
+
+
+def test_partial_records_are_spilled_to_disk() -> None:
+    join_buffer = PropertyChunkJoinBuffer(chunks_count=2, max_records_in_memory=10)
+    record_ids = list(range(100))
+
+    for record_id in record_ids:
+        assert join_buffer.add(record_id, {"Id": record_id, "a": f"A{record_id}"}) is None
+    assert join_buffer.size == 100
+    assert join_buffer.spilled_records >= 90
+    assert sorted(join_buffer.incomplete_record_ids()) == record_ids
+
+    complete_records = [join_buffer.add(record_id, {"Id": record_id, "b": f"B{record_id}"}) for record_id in record_ids[:-1]]
+
+    assert complete_records == [{"Id": record_id, "a": f"A{record_id}", "b": f"B{record_id}"} for record_id in record_ids[:-1]]
+    assert join_buffer.incomplete_record_ids() == [99]
+    assert join_buffer.peak_size == 100
+    join_buffer.close()
+
+
+def test_close_removes_the_spilled_records() -> None:
+    join_buffer = PropertyChunkJoinBuffer(chunks_count=2, max_records_in_memory=1)
+    join_buffer.add("1", {"Id": "1"})
+    join_buffer.add("2", {"Id": "2"})
+    directory = join_buffer._directory
+
+    assert directory and os.path.exists(directory)
+    join_buffer.close()
+    assert not os.path.exists(directory)
@@ -0,0 +1,105 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+from dataclasses import dataclass
+from typing import Any, Final, Mapping, Optional
+
+
+# the key to persist the learned values in the stream state
+JOB_SIZE_STATE_KEY: Final[str] = "bulk_job_size"
+
+
+@dataclass
+class ShopifyBulkJobSizeController:
+    """
+    Predicts the size (in days) of the next BULK Job slice, based on what was observed for the previous jobs:
+        - records_per_day: how dense the data is, the number of objects (`objectCount`) returned per day of the slice
+        - seconds_per_record: how fast the server produces the objects
+
+    The next slice should be produced within the `target_elapsed_time` and return no more than `target_records`,
+    so the sparse date ranges are crawled with the bigger slices and the dense ones don't overshoot
+    the `job_termination_threshold` or the `job_checkpoint_interval`.
+
+    Both values are smoothed with EMA (Exponential Moving Average):
+        value = smoothing * observed_value + (1 - smoothing) * previous_value
+
+    Attributes:
+        job_size_min (float): The lower boundary for the slice size.
+        job_size_max (float): The upper boundary for the slice size.
+        target_elapsed_time (float): The desired time (in sec) the single job should take.
+        target_records (Optional[int]): The max number of objects the single job should return, if limited.
+        smoothing (float): The EMA smoothing factor, the weight of the latest observation.
+        expand_factor (float): How much the slice grows, while the density is not known yet.
+        job_overhead_time (float): The time (in sec) taken by the job regardless the number of objects.
+        records_per_day (Optional[float]): The learned density of the data.
+        seconds_per_record (Optional[float]): The learned time taken to produce the single object.
+    """
+
+    job_size_min: float
+    job_size_max: float
+    target_elapsed_time: float
+    target_records: Optional[int] = None
+    smoothing: float = 0.5
+    expand_factor: float = 2.0
+    # 2 sec is the time taken by the empty-fast-completed jobs
+    job_overhead_time: float = 2.0
+
+    records_per_day: Optional[float] = None
+    seconds_per_record: Optional[float] = None
+
+    def _smooth(self, previous: Optional[float], observed: float) -> float:
+        return observed if previous is None else self.smoothing * observed + (1 - self.smoothing) * previous
+
+    def _clamp(self, job_size: float) -> float:
+        return max(self.job_size_min, min(job_size, self.job_size_max))
+
+    def observe(self, slice_size: Optional[float], records: int, elapsed_time: float, with_density: bool = True) -> None:
+        """
+        Learns from the job that is done.
+
+        Args:
+            slice_size (Optional[float]): The size of the slice (in days) the job was created for.
+            records (int): The number of objects returned by the job.
+            elapsed_time (float): The time (in sec) taken by the job on the server side.
+            with_density (bool): Whether or not the job covered the whole slice,
+                the density is not observed for the CANCELED or FAILED jobs.
+        """
+
+        if records > 0 and elapsed_time > self.job_overhead_time:
+            self.seconds_per_record = self._smooth(self.seconds_per_record, (elapsed_time - self.job_overhead_time) / records)
+        if with_density and slice_size:
+            self.records_per_day = self._smooth(self.records_per_day, records / slice_size)
+
+    def next_size(self, job_size: float) -> float:
+        """
+        Returns the size (in days) for the next slice, following the `job_size` of the previous one.
+        """
+
+        if not self.records_per_day:
+            # no data observed for the previous slices, expanding
+            return self._clamp(job_size * self.expand_factor)
+
+        if self.seconds_per_record:
+            records_expected = max(self.target_elapsed_time - self.job_overhead_time, 0) / self.seconds_per_record
+        else:
+            # the jobs are fast enough to be the overhead only
+            records_expected = float("inf")
+
+        if self.target_records:
+            records_expected = min(records_expected, self.target_records)
+
+        if records_expected == float("inf"):
+            return self._clamp(job_size * self.expand_factor)
+
+        return self._clamp(records_expected / self.records_per_day)
+
+    def to_state(self) -> Optional[Mapping[str, float]]:
+        if self.records_per_day is not None:
+            state = {"records_per_day": round(self.records_per_day, 3)}
+            if self.seconds_per_record is not None:
+                state["seconds_per_record"] = round(self.seconds_per_record, 6)
+            return state
+
+    def from_state(self, state: Optional[Mapping[str, Any]] = None) -> None:
+        if state:
+            self.records_per_day = state.get("records_per_day")
+            self.seconds_per_record = state.get("seconds_per_record")
@@ -33,6 +33,11 @@ class ShopifyBulkExceptions:
     class BulkRecordProduceError(BaseBulkException):
         """Raised when there are error producing records from BULK Job result"""
 
+    class BulkJobResultStreamError(BaseBulkException):
+        """Raised when the BULK Job result could not be streamed, after the download resume attempts are exhausted"""
+
+        failure_type: FailureType = FailureType.transient_error
+
     class BulkJobFailed(BaseBulkException):
         """Raised when BULK Job has FAILED status"""
 
@@ -16,10 +16,13 @@ from source_shopify.utils import ShopifyRateLimiter as limiter
 
 from airbyte_cdk.sources.streams.http import HttpClient
 
+from .controller import ShopifyBulkJobSizeController
 from .exceptions import AirbyteTracedException, ShopifyBulkExceptions
 from .query import ShopifyBulkQuery, ShopifyBulkTemplates
+from .reader import ShopifyBulkResultReader
 from .record import ShopifyBulkRecord
 from .retry import bulk_retry_on_exception
+from .scheduler import ShopifyBulkJobScheduler, ShopifyBulkQueuedJob
 from .status import ShopifyBulkJobStatus
 from .tools import END_OF_FILE, BulkTools
 
@@ -45,9 +48,17 @@ class ShopifyBulkManager:
 
     parent_stream_name: Optional[str] = None
     parent_stream_cursor: Optional[str] = None
+    # whether or not the job result should be parsed while it's downloaded, instead of saving it to the file first
+    job_result_streaming: bool = False
+    # the shop-level scheduler, to place the next job ahead, while the completed job result is processed
+    scheduler: Optional[ShopifyBulkJobScheduler] = None
 
     # 10Mb chunk size to save the file
     _retrieve_chunk_size: Final[int] = 1024 * 1024 * 10
+    # 1Mb chunk size to stream the file, smaller chunks let the lines to be processed sooner
+    _stream_chunk_size: Final[int] = 1024 * 1024
+    # 10Mb max size of the in-memory buffer for the incomplete line, while streaming, spilled to disk beyond
+    _stream_spill_threshold: Final[int] = 1024 * 1024 * 10
     _job_max_retries: Final[int] = 6
     _job_backoff_time: int = 5
 
@@ -68,6 +79,10 @@ class ShopifyBulkManager:
     _job_state: str | None = field(init=False, default=None)  # this string is based on ShopifyBulkJobStatus
     # completed and saved Bulk Job result filename
     _job_result_filename: Optional[str] = field(init=False, default=None)
+    # completed Bulk Job result url, to be streamed
+    _job_result_url: Optional[str] = field(init=False, default=None)
+    # the reader of the streamed Bulk Job result, keeps the bytes processed / downloaded stats
+    _job_result_reader: Optional[ShopifyBulkResultReader] = field(init=False, default=None)
     # date-time when the Bulk Job was created on the server
     _job_created_at: Optional[str] = field(init=False, default=None)
     # indicated whether or not we manually force-cancel the current job
@@ -85,15 +100,21 @@ class ShopifyBulkManager:
     # keeps the last checkpointed cursor value for supported streams
     _job_last_checkpoint_cursor_value: str | None = field(init=False, default=None)
 
-    # expand slice factor
-    _job_size_expand_factor: int = field(init=False, default=2)
     # reduce slice factor
     _job_size_reduce_factor: int = field(init=False, default=2)
     # whether or not the slicer should revert the previous start value
     _job_should_revert_slice: bool = field(init=False, default=False)
 
-    # 2 sec is set as default value to cover the case with the empty-fast-completed jobs
-    _job_last_elapsed_time: float = field(init=False, default=2.0)
+    # the job is expected to take up to the half of the `job_termination_threshold`, when the next slice size is predicted
+    _job_target_elapsed_ratio: Final[float] = 0.5
+    # the size (in days) of the slice the current job was created for
+    _job_slice_size: Optional[float] = field(init=False, default=None)
+
+    # the filter field and the upper boundary of the slices, used to place the job for the next slice ahead
+    _job_filter_field: Optional[str] = field(init=False, default=None)
+    _job_slices_end: Optional[datetime] = field(init=False, default=None)
+    # whether or not the job for the next slice was placed ahead, while processing the current one
+    _job_placed_ahead: bool = field(init=False, default=False)
 
     def __post_init__(self) -> None:
         self._job_size = self.job_size
@@ -108,6 +129,13 @@ class ShopifyBulkManager:
         self._job_checkpoint_interval = self.job_checkpoint_interval
         # define Record Producer instance
         self.record_producer: ShopifyBulkRecord = ShopifyBulkRecord(self.query, self.parent_stream_name, self.parent_stream_cursor)
+        # define the slice size controller, the checkpointing streams should not exceed the checkpoint interval
+        self.job_size_controller: ShopifyBulkJobSizeController = ShopifyBulkJobSizeController(
+            job_size_min=self._job_size_min,
+            job_size_max=self._job_size_max,
+            target_elapsed_time=self._job_max_elapsed_time * self._job_target_elapsed_ratio,
+            target_records=self._job_checkpoint_interval if self._supports_checkpointing else None,
+        )
 
     @property
     def _tools(self) -> BulkTools:
@@ -126,18 +154,6 @@ class ShopifyBulkManager:
             ShopifyBulkJobStatus.ACCESS_DENIED.value: self._on_access_denied_job,
         }
 
-    @property
-    def _job_size_adjusted_expand_factor(self, coef: float = 0.5) -> float:
-        """
-        The Job Size expand factor is calculated using EMA (Expotentional Moving Average):
-            coef - the expantion coefficient
-            previous_expand_factor - previous factor value
-
-        Formula: expand_factor = coef * previous_expand_factor + (1 - coef)
-        """
-
-        return coef * self._job_size_expand_factor + (1 - coef)
-
     @property
     def _job_size_adjusted_reduce_factor(self) -> float:
         """
@@ -179,9 +195,6 @@ class ShopifyBulkManager:
     def _job_any_lines_collected(self) -> bool:
         return self._job_last_rec_count > 0
 
-    def _expand_job_size(self) -> None:
-        self._job_size += self._job_size_adjusted_expand_factor
-
     def _reduce_job_size(self) -> None:
         self._job_size /= self._job_size_adjusted_reduce_factor
 
@@ -191,29 +204,36 @@ class ShopifyBulkManager:
         self._reduce_job_size()
 
     def __adjust_job_size(self, job_current_elapsed_time: float) -> None:
+        # learn from every job, but the density is known only when the job covered the whole slice
+        self.job_size_controller.observe(
+            self._job_slice_size,
+            self._job_last_rec_count,
+            job_current_elapsed_time,
+            with_density=self._job_completed(),
+        )
         if self._job_should_revert_slice:
+            # the slice is reduced, once the next slice is requested
             pass
-        else:
-            if job_current_elapsed_time < 1 or job_current_elapsed_time < self._job_last_elapsed_time:
-                self._expand_job_size()
-            elif job_current_elapsed_time > self._job_last_elapsed_time < self._job_max_elapsed_time:
-                pass
-            # set the last job time
-            self._job_last_elapsed_time = job_current_elapsed_time
-            # check the job size slice interval are acceptable
-            self._job_size = max(self._job_size_min, min(self._job_size, self._job_size_max))
+        elif self._job_completed():
+            # predict the next slice size from the observed rows/sec and the data density
+            self._job_size = self.job_size_controller.next_size(self._job_size)
 
     def __reset_state(self) -> None:
         # reset the job state to default
         self._job_state = None
         # reset the filename to default
         self._job_result_filename = None
+        # reset the streamed result to default
+        self._job_result_url = None
+        self._job_result_reader = None
         # setting self-cancelation to default
         self._job_self_canceled = False
         # set the running job message counter to default
         self._log_job_msg_count = 0
         # set the running job object count to default
         self._job_last_rec_count = 0
+        # reset the placed ahead flag to default
+        self._job_placed_ahead = False
 
     def _set_checkpointing(self) -> None:
         # set the flag to adjust the next slice from the checkpointed cursor value
@@ -254,12 +274,7 @@ class ShopifyBulkManager:
         return self._job_state == ShopifyBulkJobStatus.FAILED.value
 
     def _job_cancel(self) -> None:
-        _, canceled_response = self.http_client.send_request(
-            http_method="POST",
-            url=self.base_url,
-            json={"query": ShopifyBulkTemplates.cancel(self._job_id)},
-            request_kwargs={},
-        )
+        canceled_response = self._job_cancel_by_id(self._job_id)
         # mark the job was self-canceled
         self._job_self_canceled = True
         # check CANCELED Job health
@@ -267,6 +282,15 @@ class ShopifyBulkManager:
         # sleep to ensure the cancelation
         sleep(self._job_check_interval)
 
+    def _job_cancel_by_id(self, job_id: str) -> requests.Response:
+        _, canceled_response = self.http_client.send_request(
+            http_method="POST",
+            url=self.base_url,
+            json={"query": ShopifyBulkTemplates.cancel(job_id)},
+            request_kwargs={},
+        )
+        return canceled_response
+
     def _log_job_state_with_count(self) -> None:
         """
         Print the status/state Job info message every N request, to minimize the noise in the logs.
@@ -288,12 +312,15 @@ class ShopifyBulkManager:
         else:
             LOGGER.info(pattern)
 
-    def _job_get_result(self, response: Optional[requests.Response] = None) -> Optional[str]:
+    def _job_get_result_url(self, response: Optional[requests.Response] = None) -> Optional[str]:
         parsed_response = response.json().get("data", {}).get("node", {}) if response else None
         # get `complete` or `partial` result from collected Bulk Job results
         full_result_url = parsed_response.get("url") if parsed_response else None
         partial_result_url = parsed_response.get("partialDataUrl") if parsed_response else None
-        job_result_url = full_result_url if full_result_url else partial_result_url
+        return full_result_url if full_result_url else partial_result_url
+
+    def _job_get_result(self, response: Optional[requests.Response] = None) -> Optional[str]:
+        job_result_url = self._job_get_result_url(response)
         if job_result_url:
             # save to local file using chunks to avoid OOM
             filename = self._tools.filename_from_url(job_result_url)
@@ -311,6 +338,13 @@ class ShopifyBulkManager:
             # set the flag to adjust the next slice from the checkpointed cursor value
             self._set_checkpointing()
             # fetch the collected records from CANCELED Job on checkpointing
+            self._job_collect_result(response)
+
+    def _job_collect_result(self, response: Optional[requests.Response] = None) -> None:
+        if self.job_result_streaming:
+            # the result is downloaded and parsed at the same time, later on, in `_process_bulk_results`
+            self._job_result_url = self._job_get_result_url(response)
+        else:
             self._job_result_filename = self._job_get_result(response)
 
     def _job_update_state(self, response: Optional[requests.Response] = None) -> None:
@@ -361,7 +395,7 @@ class ShopifyBulkManager:
             sleep(self._job_check_interval)
 
     def _on_completed_job(self, response: Optional[requests.Response] = None) -> None:
-        self._job_result_filename = self._job_get_result(response)
+        self._job_collect_result(response)
 
     def _on_failed_job(self, response: requests.Response) -> AirbyteTracedException | None:
         if not self._supports_checkpointing:
@@ -475,8 +509,7 @@ class ShopifyBulkManager:
             else:
                 self._job_track_running()
 
-    @bulk_retry_on_exception()
-    def create_job(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+    def _job_send_create_request(self, stream_slice: Mapping[str, str], filter_field: str) -> requests.Response:
         if stream_slice:
             query = self.query.get(filter_field, stream_slice["start"], stream_slice["end"])
         else:
@@ -488,6 +521,19 @@ class ShopifyBulkManager:
             json={"query": ShopifyBulkTemplates.prepare(query)},
             request_kwargs={},
         )
+        return response
+
+    @bulk_retry_on_exception()
+    def create_job(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+        self._job_filter_field = filter_field
+        self._job_slice_size = (pdm.parse(stream_slice["end"]) - pdm.parse(stream_slice["start"])).total_days() if stream_slice else None
+        if self.scheduler:
+            queued_job = self.scheduler.take(self.http_client.name, stream_slice)
+            if queued_job:
+                self._job_adopt_queued(queued_job)
+                return
+
+        response = self._job_send_create_request(stream_slice, filter_field)
 
         errors = self._collect_bulk_errors(response)
         if self._has_running_concurrent_job(errors):
@@ -506,18 +552,108 @@ class ShopifyBulkManager:
 
         self._job_process_created(response)
 
+    def _job_get_created(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        bulk_response = response.json().get("data", {}).get("bulkOperationRunQuery", {}).get("bulkOperation", {}) if response else None
+        if bulk_response and bulk_response.get("status") == ShopifyBulkJobStatus.CREATED.value:
+            return bulk_response
+
     def _job_process_created(self, response: requests.Response) -> None:
         """
         The Bulk Job with CREATED status, should be processed, before we move forward with Job Status Checks.
         """
-        bulk_response = response.json().get("data", {}).get("bulkOperationRunQuery", {}).get("bulkOperation", {}) if response else None
-        if bulk_response and bulk_response.get("status") == ShopifyBulkJobStatus.CREATED.value:
+        bulk_response = self._job_get_created(response)
+        if bulk_response:
             self._job_id = bulk_response.get("id")
             self._job_created_at = bulk_response.get("createdAt")
             self._job_state = ShopifyBulkJobStatus.CREATED.value
             LOGGER.info(f"Stream: `{self.http_client.name}`, the BULK Job: `{self._job_id}` is {ShopifyBulkJobStatus.CREATED.value}")
 
+    def _job_adopt_queued(self, queued_job: ShopifyBulkQueuedJob) -> None:
+        """
+        The Bulk Job placed ahead for the requested slice becomes the current one, it's likely to be RUNNING or COMPLETED by now.
+        """
+        self._job_id = queued_job.job_id
+        self._job_created_at = queued_job.created_at
+        self._job_state = ShopifyBulkJobStatus.CREATED.value
+        LOGGER.info(
+            f"Stream: `{self.http_client.name}`, the BULK Job: `{self._job_id}` placed ahead is taken for the slice: {queued_job.stream_slice}"
+        )
+
+    def _job_next_slice(self, stream_slice: Optional[Mapping[str, str]] = None) -> Optional[Mapping[str, str]]:
+        """
+        Predicts the next slice, the same way as `stream_slices` would do, for the slice that was COMPLETED with no checkpointing.
+        """
+        if stream_slice and self._job_slices_end:
+            start = pdm.parse(stream_slice["end"])
+            if start < self._job_slices_end:
+                self.job_size_normalize(start, self._job_slices_end)
+                end = self.get_adjusted_job_start(start)
+                return {"start": start.to_rfc3339_string(), "end": end.to_rfc3339_string()}
+
+    def _job_should_place_ahead(self) -> bool:
+        return self.scheduler is not None and self._job_completed() and not self._job_adjust_slice_from_checkpoint
+
+    def job_size_from_state(self, state: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Restores the values learned by the slice size controller during the previous sync, to start with the predicted slice size.
+        """
+        if state:
+            self.job_size_controller.from_state(state)
+            self._job_size = self.job_size_controller.next_size(self._job_size)
+
+    def job_size_to_state(self) -> Optional[Mapping[str, float]]:
+        return self.job_size_controller.to_state()
+
+    def _job_place_ahead(self, stream_slice: Optional[Mapping[str, str]], job_current_elapsed_time: float) -> None:
+        """
+        Places the job for the next slice, before the COMPLETED job result is processed.
+        The slice size is adjusted first, because the next slice depends on it.
+        Failing to place the job ahead is not critical, the job is created in a regular way, once the next slice is requested.
+        """
+        self.__adjust_job_size(job_current_elapsed_time)
+        self._job_placed_ahead = True
+        next_slice = self._job_next_slice(stream_slice)
+        if not next_slice:
+            return
+        try:
+            response = self._job_send_create_request(next_slice, self._job_filter_field)
+            errors = self._collect_bulk_errors(response)
+            created_job = self._job_get_created(response)
+        except ShopifyBulkExceptions.BaseBulkException as e:
+            errors, created_job = [repr(e)], None
+
+        if errors or not created_job:
+            LOGGER.info(
+                f"Stream: `{self.http_client.name}`, couldn't place the BULK Job ahead for the next slice: {next_slice}. Details: {errors}."
+            )
+            return
+
+        self.scheduler.queue(
+            ShopifyBulkQueuedJob(
+                stream_name=self.http_client.name,
+                stream_slice=next_slice,
+                job_id=created_job.get("id"),
+                created_at=created_job.get("createdAt"),
+                cancel=self._job_cancel_by_id,
+            )
+        )
+
+    def job_cancel_placed_ahead(self) -> None:
+        """
+        Cancels the job placed ahead for this stream, that was not taken, once the stream ends or fails,
+        otherwise the job keeps running on the server side, holding the shop.
+        Failing to cancel the job is not critical, it's logged to keep the original error of the stream, if any.
+        """
+        if not self.scheduler:
+            return
+        try:
+            self.scheduler.cancel(self.http_client.name)
+        except Exception as e:
+            LOGGER.warning(f"Stream: `{self.http_client.name}`, couldn't cancel the BULK Job placed ahead. Details: {repr(e)}.")
+
     def job_size_normalize(self, start: datetime, end: datetime) -> None:
+        # keep the upper boundary of the slices, to be able to predict the next slice
+        self._job_slices_end = end
         # adjust slice size when it's bigger than the loop point when it should end,
         # to preserve correct job size adjustments when this is the only job we need to run, based on STATE provided
         requested_slice_size = (end - start).total_days()
@@ -580,27 +716,51 @@ class ShopifyBulkManager:
             lines_collected_message = f" Rows collected: {self._job_last_rec_count} --> records: `{self.record_producer.record_composed}`."
             final_message = final_message + lines_collected_message
 
+        if self.scheduler:
+            final_message = final_message + f" {self.scheduler.stats_message()}."
+
+        if self._job_result_reader:
+            final_message = final_message + f" {self._job_result_reader.stats_message()}."
+
         # emit final Bulk job status message
         LOGGER.info(f"{final_message}")
 
     def _process_bulk_results(self) -> Iterable[Mapping[str, Any]]:
-        if self._job_result_filename:
+        if self._job_result_url:
+            # produce records from the job result, while it's downloaded
+            self._job_result_reader = ShopifyBulkResultReader(
+                http_client=self.http_client,
+                url=self._job_result_url,
+                chunk_size=self._stream_chunk_size,
+                spill_threshold=self._stream_spill_threshold,
+            )
+            yield from self.record_producer.read_lines(self._job_result_reader.iter_lines())
+        elif self._job_result_filename:
             # produce records from saved bulk job result
             yield from self.record_producer.read_file(self._job_result_filename)
         else:
             yield from []
 
     @limiter.balance_rate_limit(api_type=ApiTypeEnum.graphql.value)
-    def job_get_results(self) -> Optional[Iterable[Mapping[str, Any]]]:
+    def job_get_results(self, stream_slice: Optional[Mapping[str, str]] = None) -> Optional[Iterable[Mapping[str, Any]]]:
         """
         This method checks the status for the `CREATED` Shopify BULK Job, using it's `ID`.
         The time spent for the Job execution is tracked to understand the effort.
+        When the `scheduler` is provided, the job for the next slice is placed, before the COMPLETED job result is processed.
         """
 
         job_started = time()
+        job_server_elapsed_time = None
         try:
             # track created job until it's COMPLETED
             self._job_check_state()
+            job_waited_time = round((time() - job_started), 3)
+            # the job might have been created ahead of time, the elapsed time is taken from the server side, if available
+            job_server_elapsed_time = max(self._job_elapsed_time_in_state, job_waited_time)
+            if self.scheduler:
+                self.scheduler.track_wait(job_waited_time)
+                if self._job_should_place_ahead():
+                    self._job_place_ahead(stream_slice, job_server_elapsed_time)
             yield from self._process_bulk_results()
         except (
             ShopifyBulkExceptions.BulkJobFailed,
@@ -615,7 +775,8 @@ class ShopifyBulkManager:
             job_current_elapsed_time = round((time() - job_started), 3)
             # emit the final Bulk Job log message
             self._emit_final_job_message(job_current_elapsed_time)
-            # check whether or not we should expand or reduce the size of the slice
-            self.__adjust_job_size(job_current_elapsed_time)
+            # check whether or not we should expand or reduce the size of the slice, unless it's done before placing the next job
+            if not self._job_placed_ahead:
+                self.__adjust_job_size(job_server_elapsed_time or job_current_elapsed_time)
             # reset the state for COMPLETED job
             self.__reset_state()
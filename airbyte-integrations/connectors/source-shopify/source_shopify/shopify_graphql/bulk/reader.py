@@ -0,0 +1,139 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+from dataclasses import dataclass, field
+from tempfile import SpooledTemporaryFile
+from typing import Final, Iterable
+
+import requests
+from requests.exceptions import ChunkedEncodingError, ConnectionError, ReadTimeout
+from source_shopify.utils import LOGGER
+
+from airbyte_cdk.sources.streams.http import HttpClient
+
+from .exceptions import ShopifyBulkExceptions
+
+
+# the errors raised while the response body is being consumed, these are not covered by the `HttpClient` retries
+BULK_RESULT_STREAM_ERRORS: Final = (ChunkedEncodingError, ConnectionError, ReadTimeout)
+
+
+@dataclass
+class ShopifyBulkResultReader:
+    """
+    Streams the BULK Job result (JSONL) from the `result_url` and splits it into lines, while the content is being downloaded.
+
+    The incomplete line (the tail of the last received chunk) is kept in a bounded buffer,
+    which is spilled to disk, once the `spill_threshold` is exceeded.
+    When the connection drops in the middle of the download, the stream is resumed using the `Range` request,
+    starting from the last downloaded byte, so the buffered tail is continued with no line lost or duplicated.
+
+    Attributes:
+        http_client (HttpClient): The HTTP Client instance of the stream.
+        url (str): The `url` or `partialDataUrl` of the BULK Job result.
+        chunk_size (int): The size of the chunk to read from the response body.
+        spill_threshold (int): The max size of the in-memory line buffer, before it's spilled to disk.
+        max_resume_attempts (int): How many times the broken download could be resumed.
+        bytes_downloaded (int): The number of bytes received from the `url`.
+        bytes_processed (int): The number of bytes handed over as the complete lines and processed.
+    """
+
+    http_client: HttpClient
+    url: str
+    chunk_size: int = 1024 * 1024
+    spill_threshold: int = 1024 * 1024 * 10
+    max_resume_attempts: int = 5
+
+    bytes_downloaded: int = field(init=False, default=0)
+    bytes_processed: int = field(init=False, default=0)
+    _resume_attempt: int = field(init=False, default=0)
+
+    def _request(self) -> requests.Response:
+        headers = {"Range": f"bytes={self.bytes_downloaded}-"} if self.bytes_downloaded else None
+        _, response = self.http_client.send_request(
+            http_method="GET",
+            url=self.url,
+            request_kwargs={"stream": True},
+            headers=headers,
+        )
+        response.raise_for_status()
+        return response
+
+    def _skip_downloaded(self, chunks: Iterable[bytes]) -> Iterable[bytes]:
+        """
+        When the server ignores the `Range` header and responds with the whole content (`200 OK` instead of `206 Partial Content`),
+        the bytes received before the connection drop should be skipped.
+        """
+
+        to_skip = self.bytes_downloaded
+        for chunk in chunks:
+            if to_skip >= len(chunk):
+                to_skip -= len(chunk)
+                continue
+            yield chunk[to_skip:]
+            to_skip = 0
+
+    def _should_resume(self, error: Exception) -> bool:
+        if self._resume_attempt < self.max_resume_attempts:
+            self._resume_attempt += 1
+            LOGGER.warning(
+                f"Stream: `{self.http_client.name}`, the BULK Job result download was interrupted after {self.bytes_downloaded} bytes. "
+                f"Resuming, attempt: {self._resume_attempt}/{self.max_resume_attempts}. Details: {repr(error)}."
+            )
+            return True
+        return False
+
+    def iter_chunks(self) -> Iterable[bytes]:
+        """
+        Yields the raw chunks of the result content, resuming the download on connection errors.
+        """
+
+        while True:
+            response = self._request()
+            chunks = response.iter_content(chunk_size=self.chunk_size)
+            if self.bytes_downloaded and response.status_code != requests.codes.partial_content:
+                chunks = self._skip_downloaded(chunks)
+            try:
+                for chunk in chunks:
+                    self.bytes_downloaded += len(chunk)
+                    yield chunk
+                return
+            except BULK_RESULT_STREAM_ERRORS as e:
+                if not self._should_resume(e):
+                    raise ShopifyBulkExceptions.BulkJobResultStreamError(
+                        f"Stream: `{self.http_client.name}`, failed to stream the BULK Job result after {self.bytes_downloaded} bytes. Trace: {repr(e)}."
+                    )
+            finally:
+                response.close()
+
+    def iter_lines(self) -> Iterable[str]:
+        """
+        Yields the complete non-empty lines of the result content, as soon as they are downloaded.
+        """
+
+        with SpooledTemporaryFile(max_size=self.spill_threshold) as tail:
+            for chunk in self.iter_chunks():
+                lines = chunk.split(b"\n")
+                # the last piece is not terminated by the new line, yet
+                incomplete = lines.pop()
+                if lines and tail.tell():
+                    # the first piece completes the buffered line
+                    tail.write(lines[0])
+                    tail.seek(0)
+                    lines[0] = tail.read()
+                    tail.seek(0)
+                    tail.truncate()
+                tail.write(incomplete)
+                for line in lines:
+                    if line:
+                        yield line.decode("utf-8")
+                    # account the line separator as well
+                    self.bytes_processed += len(line) + 1
+            # emit the last line, if the content is not terminated with the new line
+            if tail.tell():
+                tail.seek(0)
+                line = tail.read()
+                yield line.decode("utf-8")
+                self.bytes_processed += len(line)
+
+    def stats_message(self) -> str:
+        return f"Bytes processed: {self.bytes_processed} / downloaded: {self.bytes_downloaded}"
@@ -8,7 +8,7 @@ from functools import cached_property
 from io import TextIOWrapper
 from json import loads
 from os import remove
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, FrozenSet, Iterable, List, Mapping, MutableMapping, Optional, Union
 
 from source_shopify.utils import LOGGER
 
@@ -36,6 +36,8 @@ class ShopifyBulkRecord:
     Methods:
         __post_init__(): Initializes additional attributes after the object is created.
         tools(): Returns an instance of BulkTools.
+        new_record_types(): Returns the `__typename` values of the new record.
+        component_types(): Returns the `__typename` values of the record components.
         has_parent_stream(): Checks if the record has a parent stream.
         parent_cursor_key(): Returns the key for the parent cursor if a parent stream exists.
         check_type(record, types): Checks if the record's type matches the given type(s).
@@ -51,7 +53,9 @@ class ShopifyBulkRecord:
         process_line(jsonl_file): Processes a JSON Lines (jsonl) file and yields records.
         record_resolve_id(record): Resolves and updates the 'id' field in the given record.
         produce_records(filename): Reads the JSONL content saved from `job.job_retrieve_result()` line-by-line to avoid OOM.
+        produce_records_from_lines(lines): Produces records from the JSONL content, provided line-by-line.
         read_file(filename, remove_file): Reads a file and produces records from it.
+        read_lines(lines): Produces records from the JSONL content, streamed while the BULK Job result is downloaded.
     """
 
     query: ShopifyBulkQuery
@@ -75,6 +79,21 @@ class ShopifyBulkRecord:
     def tools(self) -> BulkTools:
         return BulkTools()
 
+    @cached_property
+    def new_record_types(self) -> FrozenSet[str]:
+        """
+        The `__typename` values of the new record, to look up while composing the records.
+        """
+        types = self.composition.get("new_record") if self.composition else None
+        return frozenset(types if isinstance(types, list) else [types])
+
+    @cached_property
+    def component_types(self) -> FrozenSet[str]:
+        """
+        The `__typename` values of the record components, to look up while composing the records.
+        """
+        return frozenset(self.components or [])
+
     @cached_property
     def has_parent_stream(self) -> bool:
         return True if self.parent_stream_name and self.parent_stream_cursor else False
@@ -188,8 +207,7 @@ class ShopifyBulkRecord:
             It is expected to contain a "__typename" key which indicates the component type.
         """
 
-        component = record.get("__typename")
-        record.pop("__typename")
+        component = record.pop("__typename")
         # add component to its placeholder in the components list
         self.buffer[-1]["record_components"][component].append(record)
 
@@ -208,9 +226,7 @@ class ShopifyBulkRecord:
         """
 
         if self.components:
-            record["record_components"] = {}
-            for component in self.components:
-                record["record_components"][component] = []
+            record["record_components"] = {component: [] for component in self.components}
         return record
 
     def buffer_flush(self) -> Iterable[Mapping[str, Any]]:
@@ -228,7 +244,7 @@ class ShopifyBulkRecord:
         After processing, the buffer is cleared.
         """
 
-        if len(self.buffer) > 0:
+        if self.buffer:
             for record in self.buffer:
                 # track the parent state
                 self._track_parent_cursor(record)
@@ -260,16 +276,17 @@ class ShopifyBulkRecord:
         Step 3: repeat until the `<END_OF_FILE>`.
         """
 
-        if self.check_type(record, self.composition.get("new_record")):
+        record_type = record.get("__typename")
+        if record_type in self.new_record_types:
             # emit from previous iteration, if present
             yield from self.buffer_flush()
             # register the record
             self.record_new(record)
         # components check
-        elif self.check_type(record, self.components):
+        elif record_type in self.component_types:
             self.record_new_component(record)
 
-    def process_line(self, jsonl_file: TextIOWrapper) -> Iterable[MutableMapping[str, Any]]:
+    def process_line(self, jsonl_file: Union[TextIOWrapper, Iterable[str]]) -> Iterable[MutableMapping[str, Any]]:
         """
         Processes a JSON Lines (jsonl) file and yields records.
 
@@ -334,12 +351,25 @@ class ShopifyBulkRecord:
         """
 
         with open(filename, "r") as jsonl_file:
-            # reset the counter
-            self.record_composed = 0
+            yield from self.produce_records_from_lines(jsonl_file)
+
+    def produce_records_from_lines(self, lines: Iterable[str]) -> Iterable[MutableMapping[str, Any]]:
+        """
+        Produce records from the JSON Lines (jsonl) content, provided line-by-line.
+
+        Args:
+            lines (Iterable[str]): The file-like object or the stream of lines to process.
+
+        Yields:
+            MutableMapping[str, Any]: A dictionary representing a processed record with field names in snake_case.
+        """
+
+        # reset the counter
+        self.record_composed = 0
 
-            for record in self.process_line(jsonl_file):
-                yield self.tools.fields_names_to_snake_case(record)
-                self.record_composed += 1
+        for record in self.process_line(lines):
+            yield self.tools.fields_names_to_snake_case(record)
+            self.record_composed += 1
 
     def read_file(self, filename: str, remove_file: Optional[bool] = True) -> Iterable[Mapping[str, Any]]:
         """
@@ -380,3 +410,28 @@ class ShopifyBulkRecord:
                 except Exception as e:
                     LOGGER.info(f"Failed to remove the `tmp job result` file, the file doen't exist. Details: {repr(e)}.")
                     pass
+
+    def read_lines(self, lines: Iterable[str]) -> Iterable[Mapping[str, Any]]:
+        """
+        Produce records from the JSONL content, streamed line-by-line while the BULK Job result is being downloaded,
+        with no intermediate file saved.
+
+        Args:
+            lines (Iterable[str]): The stream of lines, typically from `ShopifyBulkResultReader.iter_lines()`.
+
+        Yields:
+            Iterable[Mapping[str, Any]]: An iterable of records produced from the lines.
+
+        Raises:
+            ShopifyBulkExceptions.BulkRecordProduceError: If an error occurs while producing records from the lines.
+        """
+
+        try:
+            yield from self.produce_records_from_lines(lines)
+        except ShopifyBulkExceptions.BaseBulkException:
+            # the download errors are raised `as is`
+            raise
+        except Exception as e:
+            raise ShopifyBulkExceptions.BulkRecordProduceError(
+                f"An error occured while producing records from BULK Job result. Trace: {repr(e)}.",
+            )
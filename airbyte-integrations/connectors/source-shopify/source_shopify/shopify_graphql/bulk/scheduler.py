@@ -0,0 +1,126 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+from dataclasses import dataclass, field
+from time import time
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional
+
+from source_shopify.utils import LOGGER
+
+
+@dataclass
+class ShopifyBulkQueuedJob:
+    """
+    The BULK Job placed ahead of time for the next slice of the stream.
+
+    Attributes:
+        stream_name (str): The name of the stream the job was placed for.
+        stream_slice (Mapping[str, str]): The slice the job was placed for.
+        job_id (str): The `id` of the CREATED BULK Job.
+        created_at (str): The date-time when the job was created on the server.
+        cancel (Callable[[str], None]): The callable to cancel the job, when it's not adopted by the stream.
+        queued_at (float): The time when the job was placed.
+    """
+
+    stream_name: str
+    stream_slice: Mapping[str, str]
+    job_id: str
+    created_at: str
+    cancel: Callable[[str], None]
+    queued_at: float = field(default_factory=time)
+
+
+@dataclass
+class ShopifyBulkJobScheduler:
+    """
+    The shop-level BULK Job scheduler.
+
+    Shopify allows only one BULK Job per app and shop at a time, so the streams of the same shop share the single scheduler.
+    Once the job is COMPLETED, the job for the next slice is placed right away (queued), before the completed job result
+    is downloaded and parsed, so the server-side execution of the next job overlaps with the result processing.
+    The queued job is adopted by the stream when it requests the same slice, otherwise it's canceled (discarded),
+    releasing the shop for the other job.
+
+    Attributes:
+        shop (str): The name of the shop.
+        jobs_waited (int): How many jobs were tracked until done.
+        jobs_placed_ahead (int): How many jobs were placed ahead of time.
+        jobs_adopted (int): How many jobs placed ahead were adopted by the streams.
+        jobs_discarded (int): How many jobs placed ahead were canceled, since the slice requested differs.
+        wait_time (float): The total time (in sec) spent waiting for the jobs to complete.
+        overlap_time (float): The total time (in sec) the queued jobs were running, while the previous results were processed.
+    """
+
+    shop: str
+
+    # the registry of the schedulers, one per shop
+    _schedulers: ClassVar[Dict[str, "ShopifyBulkJobScheduler"]] = {}
+
+    jobs_waited: int = field(init=False, default=0)
+    jobs_placed_ahead: int = field(init=False, default=0)
+    jobs_adopted: int = field(init=False, default=0)
+    jobs_discarded: int = field(init=False, default=0)
+    wait_time: float = field(init=False, default=0.0)
+    overlap_time: float = field(init=False, default=0.0)
+
+    _queued: Optional[ShopifyBulkQueuedJob] = field(init=False, default=None)
+
+    @classmethod
+    def for_shop(cls, shop: str) -> "ShopifyBulkJobScheduler":
+        if shop not in cls._schedulers:
+            cls._schedulers[shop] = cls(shop)
+        return cls._schedulers[shop]
+
+    @property
+    def has_queued_job(self) -> bool:
+        return self._queued is not None
+
+    def queue(self, job: ShopifyBulkQueuedJob) -> None:
+        # only one job per shop is allowed, the previously queued job should have been taken by this time
+        self._discard()
+        self._queued = job
+        self.jobs_placed_ahead += 1
+        LOGGER.info(f"Stream: `{job.stream_name}`, the BULK Job: `{job.job_id}` is placed ahead for the next slice: {job.stream_slice}.")
+
+    def take(self, stream_name: str, stream_slice: Optional[Mapping[str, Any]]) -> Optional[ShopifyBulkQueuedJob]:
+        """
+        Returns the queued job, if it was placed for the same stream and slice, otherwise the queued job is discarded.
+        """
+
+        job = self._queued
+        if job and job.stream_name == stream_name and job.stream_slice == stream_slice:
+            self._queued = None
+            self.jobs_adopted += 1
+            self.overlap_time += time() - job.queued_at
+            return job
+        self._discard()
+        return None
+
+    def cancel(self, stream_name: str) -> None:
+        """
+        Cancels the job queued for the stream, when the stream ends or fails before taking it.
+        """
+
+        if self._queued and self._queued.stream_name == stream_name:
+            self._discard()
+
+    def track_wait(self, elapsed: float) -> None:
+        self.jobs_waited += 1
+        self.wait_time += elapsed
+
+    def _discard(self) -> None:
+        job, self._queued = self._queued, None
+        if job:
+            LOGGER.info(f"Stream: `{job.stream_name}`, the BULK Job: `{job.job_id}` placed ahead is not requested, canceling.")
+            job.cancel(job.job_id)
+            self.jobs_discarded += 1
+
+    def stats_message(self) -> str:
+        return (
+            f"BULK Job scheduler for `{self.shop}`: "
+            f"jobs waited: {self.jobs_waited}, "
+            f"placed ahead: {self.jobs_placed_ahead}, "
+            f"adopted: {self.jobs_adopted}, "
+            f"discarded: {self.jobs_discarded}, "
+            f"wait time: {round(self.wait_time, 3)} sec, "
+            f"overlap time: {round(self.overlap_time, 3)} sec"
+        )
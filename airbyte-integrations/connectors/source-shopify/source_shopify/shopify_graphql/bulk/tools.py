@@ -4,7 +4,8 @@
 
 
 import re
-from typing import Any, Mapping, MutableMapping, Optional, Union
+from sys import intern
+from typing import Any, Dict, Final, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import parse_qsl, urlparse
 
 import pendulum as pdm
@@ -15,11 +16,25 @@ from .exceptions import ShopifyBulkExceptions
 # default end line tag
 END_OF_FILE: str = "<end_of_file>"
 BULK_PARENT_KEY: str = "__parentId"
+# the max number of the memoized record layouts, the layouts are repeated for the records of the same `__typename`
+SNAKE_CASE_LAYOUTS_LIMIT: Final[int] = 10_000
 
 
 class BulkTools:
+    # the memoized camelCase -> snake_case translations, interned to share the same key objects across the records
+    _snake_case_keys: Dict[str, str] = {}
+    # the memoized translations of the record keys layout
+    _snake_case_layouts: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
     @staticmethod
     def camel_to_snake(camel_case: str) -> str:
+        snake_case = BulkTools._snake_case_keys.get(camel_case)
+        if snake_case is None:
+            snake_case = BulkTools._snake_case_keys[camel_case] = intern(BulkTools._camel_to_snake(camel_case))
+        return snake_case
+
+    @staticmethod
+    def _camel_to_snake(camel_case: str) -> str:
         snake_case = []
         for char in camel_case:
             if char.isupper():
@@ -80,11 +95,20 @@ class BulkTools:
         target_value = record.get(field)
         return BulkTools._datetime_str_to_rfc3339(target_value) if target_value else record.get(field)
 
+    def _snake_case_layout(self, layout: Tuple[str, ...]) -> Tuple[str, ...]:
+        translated = self._snake_case_layouts.get(layout)
+        if translated is not None:
+            return translated
+        translated = tuple(k if k == BULK_PARENT_KEY else self.camel_to_snake(k) for k in layout)
+        if len(self._snake_case_layouts) < SNAKE_CASE_LAYOUTS_LIMIT:
+            self._snake_case_layouts[layout] = translated
+        return translated
+
     def fields_names_to_snake_case(self, dict_input: Optional[Mapping[str, Any]] = None) -> Optional[MutableMapping[str, Any]]:
         # transforming record field names from camel to snake case, leaving the `__parent_id` relation in place
         if dict_input:
             # the `None` type check is required, to properly handle nested missing entities (return None)
-            return {self.camel_to_snake(k) if dict_input and k != BULK_PARENT_KEY else k: v for k, v in dict_input.items()}
+            return dict(zip(self._snake_case_layout(tuple(dict_input)), dict_input.values()))
 
     @staticmethod
     def resolve_str_id(
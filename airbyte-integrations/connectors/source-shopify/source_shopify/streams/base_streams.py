@@ -14,8 +14,10 @@ import pendulum as pdm
 import requests
 from requests.exceptions import RequestException
 from source_shopify.http_request import ShopifyErrorHandler
+from source_shopify.shopify_graphql.bulk.controller import JOB_SIZE_STATE_KEY
 from source_shopify.shopify_graphql.bulk.job import ShopifyBulkManager
 from source_shopify.shopify_graphql.bulk.query import DeliveryZoneList, ShopifyBulkQuery
+from source_shopify.shopify_graphql.bulk.scheduler import ShopifyBulkJobScheduler
 from source_shopify.transform import DataTypeEnforcer
 from source_shopify.utils import ApiTypeEnum, ShopifyNonRetryableErrors
 from source_shopify.utils import EagerlyCachedStreamState as stream_state_cache
@@ -668,6 +670,10 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
             job_checkpoint_interval=config.get("job_checkpoint_interval", 200_000),
             parent_stream_name=self.parent_stream_name,
             parent_stream_cursor=self.parent_stream_cursor,
+            # parse the job result while it's downloaded, instead of saving it to the file first
+            job_result_streaming=config.get("job_result_streaming", False),
+            # place the job for the next slice, while the completed job result is processed
+            scheduler=ShopifyBulkJobScheduler.for_shop(config["shop"]) if config.get("job_place_ahead", False) else None,
         )
 
     @property
@@ -749,6 +755,10 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
                     "id": 12345,
                     "customers": {
                         "updated_at": "2022-03-03T03:47:46-08:00"
+                    },
+                    "bulk_job_size": {
+                        "records_per_day": 1520.5,
+                        "seconds_per_record": 0.0021
                     }
                 }
             }
@@ -756,6 +766,11 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
 
         updated_state = super().get_updated_state(current_stream_state, latest_record)
 
+        # keep the values learned by the slice size controller, to start the next sync with the predicted slice size
+        learned_job_size = self.job_manager.job_size_to_state()
+        if learned_job_size:
+            updated_state[JOB_SIZE_STATE_KEY] = learned_job_size
+
         if self.parent_stream_class:
             # the default way of getting the parent stream state is to use the value from the RecordProducer,
             # since the parent record could be present but no substream's records are present to emit,
@@ -820,20 +835,29 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
 
     @stream_state_cache.cache_stream_state
     def stream_slices(self, stream_state: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
-        if self.filter_field:
-            state = self._get_state_value(stream_state)
-            start = pdm.parse(state)
-            end = pdm.now()
-            while start < end:
-                self.job_manager.job_size_normalize(start, end)
-                slice_end = self.job_manager.get_adjusted_job_start(start)
-                self.emit_slice_message(start, slice_end)
-                yield {"start": start.to_rfc3339_string(), "end": slice_end.to_rfc3339_string()}
-                # increment the end of the slice or reduce the next slice
-                start = self.job_manager.get_adjusted_job_end(start, slice_end, self._checkpoint_cursor, self._filter_checkpointed_cursor)
-        else:
-            # for the streams that don't support filtering
-            yield {}
+        try:
+            if self.filter_field:
+                if stream_state:
+                    # start with the slice size predicted from the previous sync
+                    self.job_manager.job_size_from_state(stream_state.get(JOB_SIZE_STATE_KEY))
+                state = self._get_state_value(stream_state)
+                start = pdm.parse(state)
+                end = pdm.now()
+                while start < end:
+                    self.job_manager.job_size_normalize(start, end)
+                    slice_end = self.job_manager.get_adjusted_job_start(start)
+                    self.emit_slice_message(start, slice_end)
+                    yield {"start": start.to_rfc3339_string(), "end": slice_end.to_rfc3339_string()}
+                    # increment the end of the slice or reduce the next slice
+                    start = self.job_manager.get_adjusted_job_end(
+                        start, slice_end, self._checkpoint_cursor, self._filter_checkpointed_cursor
+                    )
+            else:
+                # for the streams that don't support filtering
+                yield {}
+        finally:
+            # the job placed ahead for a slice that is not going to be read is canceled
+            self.job_manager.job_cancel_placed_ahead()
 
     def sort_output_asc(self, non_sorted_records: Iterable[Mapping[str, Any]] = None) -> Iterable[Mapping[str, Any]]:
         """
@@ -864,7 +888,7 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
         # add `shop_url` field to each record produced
         records = self.add_shop_url_field(
             # produce records from saved bulk job result
-            self.job_manager.job_get_results()
+            self.job_manager.job_get_results(stream_slice)
         )
         # emit records in ASC order
         yield from self.filter_records_newer_than_state(stream_state, self.sort_output_asc(records))
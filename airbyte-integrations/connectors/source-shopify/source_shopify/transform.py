@@ -3,7 +3,11 @@
 #
 
 from decimal import Decimal
-from typing import Any, Iterable, List, Mapping, MutableMapping
+from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional
+
+
+# the converter of the single value, compiled from the schema
+Converter = Callable[[Any], Any]
 
 
 class DataTypeEnforcer:
@@ -16,8 +20,13 @@ class DataTypeEnforcer:
     Correct types placed in schemes
     Transformer iterates over records, compare values type with schema type and transform if it's needed
 
+    The stream schema is compiled once into the tree of converters, so the records are only touched
+    where the conversion can happen, the fields with no `number` or `string` types down the schema tree are skipped.
+
     Methods
     -------
+    _compile(self, schema: Mapping[str, Any])
+        Compiles the schema into the converter, returns `None` when no conversion can happen for the schema
     _transform_array(self, array: List[Any], item_properties: Mapping[str, Any])
         Some fields type is array. Items inside array contain price fields, which should be transformed
         This method iterate over items in array, compare schema types and convert if necessary
@@ -28,6 +37,7 @@ class DataTypeEnforcer:
     def __init__(self, schema: Mapping[str, Any], **kwargs):
         super().__init__(**kwargs)
         self._schema = schema
+        self._converter: Optional[Converter] = self._compile(schema)
 
     @staticmethod
     def _get_json_types(value_type: Any) -> List[str]:
@@ -71,6 +81,69 @@ class DataTypeEnforcer:
     def _transform_string(value: Any):
         return str(value)
 
+    def _compile_value(self, schema_types: List[str], schema_type: str) -> Converter:
+        # the python types, that don't match the schema types, should be converted
+        json_types = {
+            value_type: self._get_json_types(value_type) for value_type in (str, int, float, dict, list, bool, type(None), Decimal)
+        }
+        matched = {value_type for value_type, types in json_types.items() if any(json_type in schema_types for json_type in types)}
+        convert = self._transform_number if schema_type == "number" else self._transform_string
+
+        def _convert(value: Any) -> Any:
+            return value if type(value) in matched else convert(value)
+
+        return _convert
+
+    def _compile_object(self, properties: Mapping[str, Any]) -> Optional[Converter]:
+        converters = {}
+        for object_property, object_properties in properties.items():
+            converter = self._compile(object_properties or {})
+            if converter:
+                converters[object_property] = converter
+        if not converters:
+            return None
+
+        def _convert(record: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+            if isinstance(record, dict):
+                for object_property, converter in converters.items():
+                    value = record.get(object_property)
+                    if value is not None:
+                        record[object_property] = converter(value)
+            return record
+
+        return _convert
+
+    def _compile_array(self, item_properties: Mapping[str, Any]) -> Optional[Converter]:
+        converter = self._compile(item_properties)
+        if not converter:
+            return None
+
+        def _convert(array: List[Any]) -> List[Any]:
+            if isinstance(array, list):
+                for index, record in enumerate(array):
+                    if record is not None:
+                        array[index] = converter(record)
+            return array
+
+        return _convert
+
+    def _compile(self, schema: Mapping[str, Any]) -> Optional[Converter]:
+        """
+        Compiles the schema into the converter, following the same rules as `transform` does.
+        Returns `None`, when no conversion can happen for the value of the schema.
+        """
+        schema_types = self._types_from_schema(schema)
+        if not schema_types or schema_types == ["null"]:
+            return None
+        schema_type = self._first_non_null_type(schema_types)
+        if schema_type in ("number", "string"):
+            return self._compile_value(schema_types, schema_type)
+        if schema_type == "object":
+            return self._compile_object(schema.get("properties", {}))
+        if schema_type == "array":
+            return self._compile_array(schema.get("items", {}))
+        return None
+
     def _transform_array(self, array: List[Any], item_properties: Mapping[str, Any]):
         # iterate over items in array, compare schema types and convert if necessary.
         for index, record in enumerate(array):
@@ -88,7 +161,9 @@ class DataTypeEnforcer:
         return record
 
     def transform(self, field: Any, schema: Mapping[str, Any] = None) -> Iterable[MutableMapping]:
-        schema = schema if schema is not None else self._schema
+        if schema is None:
+            # use the compiled stream schema
+            return self._converter(field) if self._converter and field is not None else field
         # get available types from schema
         schema_types = self._types_from_schema(schema)
         if schema_types and field is not None:
@@ -0,0 +1,153 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+from dataclasses import dataclass
+from typing import Callable, List
+
+import pytest
+from source_shopify.shopify_graphql.bulk.controller import JOB_SIZE_STATE_KEY, ShopifyBulkJobSizeController
+from source_shopify.streams.streams import MetafieldOrders
+
+
+def _controller(**kwargs) -> ShopifyBulkJobSizeController:
+    return ShopifyBulkJobSizeController(**{"job_size_min": 0.1, "job_size_max": 30.0, "target_elapsed_time": 1800.0, **kwargs})
+
+
+def test_expand_while_density_is_unknown() -> None:
+    controller = _controller()
+    assert controller.next_size(4) == 8
+    # no objects returned, still expanding up to the max size
+    controller.observe(slice_size=8, records=0, elapsed_time=1.5)
+    assert controller.next_size(20) == 30.0
+
+
+def test_predict_from_density_and_rows_per_sec() -> None:
+    controller = _controller(job_size_max=365.0)
+    # 100k objects per day, produced at 1k objects/sec
+    controller.observe(slice_size=1, records=100_000, elapsed_time=102.0)
+    assert controller.records_per_day == 100_000
+    assert controller.seconds_per_record == 0.001
+    # (1800 - 2) sec / 0.001 sec per object / 100k objects per day
+    assert controller.next_size(1) == pytest.approx(17.98)
+    # the observations are smoothed
+    controller.observe(slice_size=10, records=200_000, elapsed_time=402.0)
+    assert controller.records_per_day == 60_000
+    assert controller.seconds_per_record == 0.0015
+    assert controller.next_size(17.98) == pytest.approx(1798 / 0.0015 / 60_000)
+
+
+def test_target_records_limits_the_slice() -> None:
+    controller = _controller(target_records=100_000)
+    controller.observe(slice_size=1, records=50_000, elapsed_time=7.0)
+    assert controller.next_size(1) == 2.0
+
+
+def test_density_is_not_observed_for_incomplete_job() -> None:
+    controller = _controller()
+    controller.observe(slice_size=1, records=50_000, elapsed_time=52.0, with_density=False)
+    assert controller.records_per_day is None
+    assert controller.seconds_per_record == 0.001
+
+
+def test_controller_state_round_trip() -> None:
+    controller = _controller()
+    assert controller.to_state() is None
+    controller.observe(slice_size=2, records=3000, elapsed_time=5.0)
+    restored = _controller()
+    restored.from_state(controller.to_state())
+    assert restored.next_size(1) == controller.next_size(1)
+
+
+def test_stream_starts_with_learned_slice_size(auth_config) -> None:
+    stream = MetafieldOrders(dict(auth_config, bulk_window_in_days=30))
+    learned = {"records_per_day": 100_000, "seconds_per_record": 0.001}
+    stream_slice = next(stream.stream_slices(stream_state={"updated_at": "2023-01-01T00:00:00+00:00", JOB_SIZE_STATE_KEY: learned}))
+    # the MetafieldOrders stream supports checkpointing, so the slice is limited by the checkpoint interval: 200k objects
+    assert stream.job_manager._job_size == 2.0
+    assert stream_slice == {"start": "2023-01-01T00:00:00+00:00", "end": "2023-01-03T00:00:00+00:00"}
+    assert stream.get_updated_state({}, {"updated_at": "2023-01-02T00:00:00+00:00"})[JOB_SIZE_STATE_KEY] == learned
+
+
+# SIMULATION HARNESS
+# Replays the recorded job timings (objects per day, server throughput) to benchmark the slicing strategies.
+
+
+@dataclass
+class RecordedShop:
+    # objects returned per day of the slice
+    records_by_day: List[int]
+    # sec per object on the server side
+    seconds_per_record: float
+    # sec taken by every job, regardless the number of objects
+    job_overhead_time: float = 2.0
+    # `job_termination_threshold`, the job is canceled and retried with the halved slice, when exceeded
+    termination_threshold: float = 3600.0
+
+    def replay_job(self, start: float, size: float) -> tuple:
+        first, last = int(start), min(int(start + size), len(self.records_by_day))
+        # the partial days are accounted proportionally
+        records = sum(self.records_by_day[first:last]) + int(self.records_by_day[last % len(self.records_by_day)] * (start + size - last))
+        return records, self.job_overhead_time + records * self.seconds_per_record
+
+
+@dataclass
+class SimulationResult:
+    jobs: int = 0
+    canceled_jobs: int = 0
+    elapsed_time: float = 0.0
+
+
+def simulate(shop: RecordedShop, next_size: Callable[[float, float, int, float], float], job_size: float = 30.0) -> SimulationResult:
+    result, start, days = SimulationResult(), 0.0, len(shop.records_by_day) - 1
+    while start < days:
+        size = min(job_size, days - start)
+        records, elapsed = shop.replay_job(start, size)
+        result.jobs += 1
+        if elapsed > shop.termination_threshold:
+            result.canceled_jobs += 1
+            result.elapsed_time += shop.termination_threshold
+            job_size = max(size / 2, 0.1)
+            continue
+        result.elapsed_time += elapsed
+        start += size
+        job_size = next_size(size, job_size, records, elapsed)
+    return result
+
+
+def legacy_ema_strategy() -> Callable[[float, float, int, float], float]:
+    # the previous strategy: the slice grows by the EMA factor while the jobs are getting faster, ignoring the number of objects
+    last_elapsed = [2.0]
+
+    def _next_size(size: float, job_size: float, records: int, elapsed: float) -> float:
+        if elapsed < 1 or elapsed < last_elapsed[0]:
+            job_size += 0.5 * 2 + 0.5
+        last_elapsed[0] = elapsed
+        return max(0.1, min(job_size, 30.0))
+
+    return _next_size
+
+
+def controller_strategy(controller: ShopifyBulkJobSizeController) -> Callable[[float, float, int, float], float]:
+    def _next_size(size: float, job_size: float, records: int, elapsed: float) -> float:
+        controller.observe(size, records, elapsed)
+        return controller.next_size(job_size)
+
+    return _next_size
+
+
+@pytest.mark.parametrize(
+    "shop",
+    [
+        # sparse year: a few objects a day, followed by the dense holiday season
+        RecordedShop(records_by_day=[20] * 300 + [400_000] * 65, seconds_per_record=0.004),
+        # dense all year round
+        RecordedShop(records_by_day=[150_000] * 365, seconds_per_record=0.003),
+    ],
+    ids=["sparse then dense", "dense"],
+)
+def test_simulation_controller_outperforms_legacy_strategy(shop) -> None:
+    legacy = simulate(shop, legacy_ema_strategy(), job_size=0.1)
+    controlled = simulate(shop, controller_strategy(_controller(job_size_max=30.0, target_elapsed_time=1800.0)), job_size=0.1)
+    # the controller aims for the half of the termination threshold, so the dense slices are rarely canceled
+    assert controlled.canceled_jobs < legacy.canceled_jobs
+    assert controlled.elapsed_time < legacy.elapsed_time
@@ -68,14 +68,15 @@ def test_job_manager_default_values(auth_config) -> None:
     assert stream.job_manager._job_checkpoint_interval == 200000
     # the flag to adjust the next slice from the checkpointed cursor vaue
     assert not stream.job_manager._job_adjust_slice_from_checkpoint
-    # expand slice factor
-    assert stream.job_manager._job_size_expand_factor == 2
     # reduce slice factor
     assert stream.job_manager._job_size_reduce_factor == 2
     # whether or not the slicer should revert the previous start value
     assert not stream.job_manager._job_should_revert_slice
-    # 2 sec is set as default value to cover the case with the empty-fast-completed jobs
-    assert stream.job_manager._job_last_elapsed_time == 2.0
+    # the slice size controller has nothing learned yet
+    assert stream.job_manager.job_size_controller.expand_factor == 2.0
+    assert stream.job_manager.job_size_controller.target_elapsed_time == 1800.0
+    assert not stream.job_manager.job_size_controller.records_per_day
+    assert not stream.job_manager.job_size_controller.seconds_per_record
 
 
 def test_get_errors_from_response_invalid_response(auth_config) -> None:
@@ -444,6 +445,41 @@ def test_bulk_stream_parse_response(
         assert test_records == expected_result
 
 
+@pytest.mark.parametrize(
+    "stream, json_content_example, expected",
+    [
+        (MetafieldOrders, "metafield_jsonl_content_example", "metafield_parse_response_expected_result"),
+        (FulfillmentOrders, "filfillment_order_jsonl_content_example", "fulfillment_orders_response_expected_result"),
+        (Products, "products_jsonl_content_example", "products_response_expected_result"),
+    ],
+    ids=[
+        "MetafieldOrders",
+        "FulfillmentOrders",
+        "Products",
+    ],
+)
+def test_bulk_stream_parse_streamed_response(
+    request,
+    requests_mock,
+    bulk_job_completed_response,
+    stream,
+    json_content_example,
+    expected,
+    auth_config,
+) -> None:
+    stream = stream(dict(auth_config, job_result_streaming=True))
+    test_result_url = bulk_job_completed_response.get("data").get("node").get("url")
+    requests_mock.post(stream.job_manager.base_url, json=bulk_job_completed_response)
+    requests_mock.get(test_result_url, text=request.getfixturevalue(json_content_example))
+    # the chunks smaller than the line should be stitched together
+    stream.job_manager._stream_chunk_size = 16
+    test_records = list(stream.read_records(SyncMode.full_refresh, stream_slice={}))
+    expected_result = request.getfixturevalue(expected)
+    assert test_records == (expected_result if isinstance(expected_result, list) else [expected_result])
+    # the result is never saved to the file
+    assert not stream.job_manager._job_result_filename
+
+
 @pytest.mark.parametrize(
     "stream, stream_state, with_start_date, expected_start",
     [
@@ -478,9 +514,9 @@ def test_stream_slices(
 
 
 @pytest.mark.parametrize(
-    "stream, json_content_example, last_job_elapsed_time, previous_slice_size, adjusted_slice_size",
+    "stream, json_content_example, previous_slice_size, adjusted_slice_size",
     [
-        (CustomerAddress, "customer_address_jsonl_content_example", 20, 4, 5.5),
+        (CustomerAddress, "customer_address_jsonl_content_example", 4, 8),
     ],
     ids=[
         "Expand Slice Size",
@@ -492,7 +528,6 @@ def test_expand_stream_slices_job_size(
     bulk_job_completed_response,
     stream,
     json_content_example,
-    last_job_elapsed_time,
     previous_slice_size,
     adjusted_slice_size,
     auth_config,
@@ -508,10 +543,8 @@ def test_expand_stream_slices_job_size(
     # for the sake of simplicity we fake some parts to simulate the `current_job_time_elapsed`
     # fake current slice interval value
     stream.job_manager._job_size = previous_slice_size
-    # fake `last job elapsed time`
-    if last_job_elapsed_time:
-        stream.job_manager._job_last_elapsed_time = last_job_elapsed_time
 
+    # no objects returned for the slice, the density is not known yet, so the slice is expanded
     first_slice = next(stream.stream_slices())
     list(stream.read_records(SyncMode.incremental, stream_slice=first_slice))
     # check the next slice
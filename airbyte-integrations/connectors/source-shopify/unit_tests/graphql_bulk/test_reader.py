@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+import pytest
+from requests.exceptions import ChunkedEncodingError
+from source_shopify.shopify_graphql.bulk.exceptions import ShopifyBulkExceptions
+from source_shopify.shopify_graphql.bulk.reader import ShopifyBulkResultReader
+from source_shopify.streams.streams import Products
+
+
+_RESULT_URL = "https://some_url/bulk-123456789.jsonl"
+_CONTENT = '{"id": 1, "name": "first"}\n{"id": 2, "name": "second"}\n\n{"id": 3, "name": "third"}\n'
+
+
+class _BrokenBody:
+    """Emits the `content` in chunks, raising the connection error after `fail_after` bytes."""
+
+    def __init__(self, content: bytes, fail_after: int) -> None:
+        self.content = content
+        self.fail_after = fail_after
+
+    def iter_content(self, chunk_size: int):
+        yield self.content[: self.fail_after]
+        raise ChunkedEncodingError("Connection broken")
+
+
+@pytest.mark.parametrize(
+    "chunk_size, spill_threshold",
+    [
+        (1, 1024),
+        (7, 1024),
+        (1024, 1024),
+        (5, 1),
+    ],
+    ids=["byte-by-byte", "lines split across chunks", "single chunk", "spilled to disk"],
+)
+def test_reader_iter_lines(requests_mock, auth_config, chunk_size, spill_threshold) -> None:
+    stream = Products(auth_config)
+    requests_mock.get(_RESULT_URL, text=_CONTENT)
+    reader = ShopifyBulkResultReader(stream.job_manager.http_client, _RESULT_URL, chunk_size=chunk_size, spill_threshold=spill_threshold)
+    assert list(reader.iter_lines()) == [
+        '{"id": 1, "name": "first"}',
+        '{"id": 2, "name": "second"}',
+        '{"id": 3, "name": "third"}',
+    ]
+    assert reader.bytes_downloaded == len(_CONTENT)
+    assert reader.bytes_processed == len(_CONTENT)
+
+
+def test_reader_iter_lines_without_trailing_new_line(requests_mock, auth_config) -> None:
+    stream = Products(auth_config)
+    requests_mock.get(_RESULT_URL, text=_CONTENT.rstrip())
+    reader = ShopifyBulkResultReader(stream.job_manager.http_client, _RESULT_URL, chunk_size=4)
+    assert list(reader.iter_lines())[-1] == '{"id": 3, "name": "third"}'
+    assert reader.bytes_processed == reader.bytes_downloaded
+
+
+@pytest.mark.parametrize(
+    "resume_status_code",
+    [206, 200],
+    ids=["range supported", "range ignored"],
+)
+def test_reader_resumes_interrupted_download(mocker, requests_mock, auth_config, resume_status_code) -> None:
+    stream = Products(auth_config)
+    content = _CONTENT.encode()
+    fail_after = 33
+    resumed_content = content[fail_after:] if resume_status_code == 206 else content
+    requests_mock.get(_RESULT_URL, [{"text": _CONTENT}, {"content": resumed_content, "status_code": resume_status_code}])
+    broken_response = mocker.Mock(status_code=200, iter_content=_BrokenBody(content, fail_after).iter_content)
+    original_request = ShopifyBulkResultReader._request
+    responses = iter([broken_response])
+    mocker.patch.object(
+        ShopifyBulkResultReader,
+        "_request",
+        lambda self: next(responses, None) or original_request(self),
+    )
+    reader = ShopifyBulkResultReader(stream.job_manager.http_client, _RESULT_URL, chunk_size=8)
+    assert len(list(reader.iter_lines())) == 3
+    assert reader.bytes_downloaded == len(content)
+    assert requests_mock.last_request.headers["Range"] == f"bytes={fail_after}-"
+
+
+def test_reader_raises_when_resume_attempts_exhausted(mocker, auth_config) -> None:
+    stream = Products(auth_config)
+    mocker.patch.object(
+        ShopifyBulkResultReader,
+        "_request",
+        lambda self: mocker.Mock(status_code=200, iter_content=_BrokenBody(b'{"id": 1}\n{"id"', 12).iter_content),
+    )
+    reader = ShopifyBulkResultReader(stream.job_manager.http_client, _RESULT_URL, max_resume_attempts=2)
+    with pytest.raises(ShopifyBulkExceptions.BulkJobResultStreamError):
+        list(reader.iter_lines())
@@ -1,9 +1,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
 
+import logging
+import os
+from json import dumps
+from time import perf_counter
+
 import pytest
 from source_shopify.shopify_graphql.bulk.query import ShopifyBulkQuery
 from source_shopify.shopify_graphql.bulk.record import ShopifyBulkRecord
+from source_shopify.shopify_graphql.bulk.tools import BULK_PARENT_KEY, BulkTools
 
 
 @pytest.mark.parametrize(
@@ -207,3 +213,71 @@ def test_record_compose(basic_config, records_from_jsonl, record_composition, ex
         list(record_instance.record_compose(record))
 
     assert record_instance.buffer == expected
+
+
+def _write_orders_bulk_file(filename, lines: int) -> None:
+    with open(filename, "w") as jsonl_file:
+        for index in range(lines):
+            jsonl_file.write(
+                dumps(
+                    {
+                        "__typename": "Order",
+                        "id": f"gid://shopify/Order/{index}",
+                        "createdAt": "2023-01-01T01:01:01Z",
+                        "displayFinancialStatus": "PAID",
+                        "totalPriceSet": {"shopMoney": {"amount": "10.0"}},
+                    }
+                )
+                + "\n"
+            )
+
+
+def test_produce_records_translates_the_keys_of_each_record(tmp_path, basic_config) -> None:
+    filename = tmp_path / "bulk-123.jsonl"
+    _write_orders_bulk_file(filename, lines=3)
+
+    record_instance = ShopifyBulkRecord(ShopifyBulkQuery(basic_config))
+    record_instance.composition = {"new_record": "Order"}
+    records = list(record_instance.produce_records(filename))
+
+    assert records == [
+        {
+            "id": index,
+            "created_at": "2023-01-01T01:01:01Z",
+            "display_financial_status": "PAID",
+            "total_price_set": {"shopMoney": {"amount": "10.0"}},
+            "admin_graphql_api_id": f"gid://shopify/Order/{index}",
+        }
+        for index in range(3)
+    ]
+    # the records of the same layout share the translated key objects
+    assert all(a is b for a, b in zip(records[0], records[-1]))
+
+
+@pytest.mark.skipif(not os.getenv("SHOPIFY_BULK_BENCHMARK_LINES"), reason="set SHOPIFY_BULK_BENCHMARK_LINES to run it")
+def test_benchmark_produce_records_throughput(tmp_path, mocker, basic_config) -> None:
+    """
+    Logs the records/sec produced from a synthetic BULK Job result, with and without the memoized key translations.
+    """
+
+    lines = int(os.environ["SHOPIFY_BULK_BENCHMARK_LINES"])
+    filename = tmp_path / "bulk-123.jsonl"
+    _write_orders_bulk_file(filename, lines)
+
+    def _records_per_sec() -> float:
+        started = perf_counter()
+        record_instance = ShopifyBulkRecord(ShopifyBulkQuery(basic_config))
+        record_instance.composition = {"new_record": "Order"}
+        records = sum(1 for _ in record_instance.produce_records(filename))
+        assert records == lines
+        return records / (perf_counter() - started)
+
+    memoized = _records_per_sec()
+    # the keys translated char by char for every record, as before the memoization
+    mocker.patch.object(
+        BulkTools,
+        "fields_names_to_snake_case",
+        lambda self, record: {BulkTools._camel_to_snake(k) if k != BULK_PARENT_KEY else k: v for k, v in record.items()},
+    )
+    not_memoized = _records_per_sec()
+    logging.getLogger("airbyte").info(f"{lines} BULK lines, records/sec: memoized {memoized:.0f}, not memoized {not_memoized:.0f}.")
@@ -0,0 +1,131 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+import pendulum as pdm
+import pytest
+from source_shopify.shopify_graphql.bulk.scheduler import ShopifyBulkJobScheduler, ShopifyBulkQueuedJob
+from source_shopify.streams.streams import MetafieldOrders
+
+from airbyte_cdk.models import SyncMode
+
+
+_SLICE = {"start": "2023-01-01T00:00:00+00:00", "end": "2023-01-31T00:00:00+00:00"}
+
+
+@pytest.fixture(autouse=True)
+def clean_schedulers():
+    ShopifyBulkJobScheduler._schedulers.clear()
+    yield
+    ShopifyBulkJobScheduler._schedulers.clear()
+
+
+def _queued_job(mocker, stream_name: str = "metafield_orders", stream_slice=_SLICE) -> ShopifyBulkQueuedJob:
+    return ShopifyBulkQueuedJob(
+        stream_name=stream_name,
+        stream_slice=stream_slice,
+        job_id="gid://shopify/BulkOperation/1",
+        created_at="2023-01-31T00:00:00Z",
+        cancel=mocker.Mock(),
+    )
+
+
+def test_scheduler_is_shared_per_shop() -> None:
+    assert ShopifyBulkJobScheduler.for_shop("shop_a") is ShopifyBulkJobScheduler.for_shop("shop_a")
+    assert ShopifyBulkJobScheduler.for_shop("shop_a") is not ShopifyBulkJobScheduler.for_shop("shop_b")
+
+
+def test_scheduler_take_queued_job(mocker) -> None:
+    scheduler = ShopifyBulkJobScheduler("shop")
+    job = _queued_job(mocker)
+    scheduler.queue(job)
+    assert scheduler.take("metafield_orders", dict(_SLICE)) is job
+    assert not scheduler.has_queued_job
+    assert scheduler.jobs_adopted == 1
+    job.cancel.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "stream_name, stream_slice",
+    [
+        ("metafield_orders", {"start": "2023-01-01T00:00:00+00:00", "end": "2023-01-15T00:00:00+00:00"}),
+        ("metafield_customers", _SLICE),
+    ],
+    ids=["other slice", "other stream"],
+)
+def test_scheduler_discards_not_requested_job(mocker, stream_name, stream_slice) -> None:
+    scheduler = ShopifyBulkJobScheduler("shop")
+    job = _queued_job(mocker)
+    scheduler.queue(job)
+    assert scheduler.take(stream_name, stream_slice) is None
+    assert not scheduler.has_queued_job
+    assert scheduler.jobs_discarded == 1
+    job.cancel.assert_called_once_with(job.job_id)
+
+
+def test_scheduler_cancels_the_job_queued_for_the_stream(mocker) -> None:
+    scheduler = ShopifyBulkJobScheduler("shop")
+    job = _queued_job(mocker)
+    scheduler.queue(job)
+
+    scheduler.cancel("metafield_customers")
+    assert scheduler.has_queued_job
+    scheduler.cancel("metafield_orders")
+    assert not scheduler.has_queued_job
+    job.cancel.assert_called_once_with(job.job_id)
+
+
+def test_place_next_job_ahead(request, requests_mock, auth_config, bulk_successful_response, bulk_job_completed_response) -> None:
+    stream = MetafieldOrders(dict(auth_config, job_place_ahead=True, bulk_window_in_days=30))
+    bulk_successful_response["data"]["bulkOperationRunQuery"]["bulkOperation"]["createdAt"] = pdm.now().to_rfc3339_string()
+
+    def _response(req, context):
+        return bulk_successful_response if "bulkOperationRunQuery" in req.text else bulk_job_completed_response
+
+    requests_mock.post(stream.job_manager.base_url, json=_response)
+    test_result_url = bulk_job_completed_response.get("data").get("node").get("url")
+    requests_mock.get(test_result_url, text=request.getfixturevalue("metafield_jsonl_content_example"))
+
+    def _creation_requests() -> int:
+        return len([req for req in requests_mock.request_history if req.method == "POST" and "bulkOperationRunQuery" in req.text])
+
+    scheduler = stream.job_manager.scheduler
+    slices = stream.stream_slices(stream_state={})
+    first_slice = next(slices)
+    list(stream.read_records(SyncMode.incremental, stream_slice=first_slice))
+    # the job for the next slice is placed, while the first one is processed
+    assert _creation_requests() == 2
+    assert scheduler.has_queued_job
+
+    second_slice = next(slices)
+    assert scheduler._queued.stream_slice == second_slice
+    list(stream.read_records(SyncMode.incremental, stream_slice=second_slice))
+    # the queued job is adopted, the job for the third slice is placed ahead
+    assert _creation_requests() == 3
+    assert scheduler.jobs_adopted == 1
+    assert scheduler.jobs_discarded == 0
+
+
+def test_job_placed_ahead_is_canceled_when_the_stream_stops(
+    request, requests_mock, auth_config, bulk_successful_response, bulk_job_completed_response
+) -> None:
+    stream = MetafieldOrders(dict(auth_config, job_place_ahead=True, bulk_window_in_days=30))
+    bulk_successful_response["data"]["bulkOperationRunQuery"]["bulkOperation"]["createdAt"] = pdm.now().to_rfc3339_string()
+
+    def _response(req, context):
+        return bulk_successful_response if "bulkOperationRunQuery" in req.text else bulk_job_completed_response
+
+    requests_mock.post(stream.job_manager.base_url, json=_response)
+    test_result_url = bulk_job_completed_response.get("data").get("node").get("url")
+    requests_mock.get(test_result_url, text=request.getfixturevalue("metafield_jsonl_content_example"))
+
+    scheduler = stream.job_manager.scheduler
+    slices = stream.stream_slices(stream_state={})
+    list(stream.read_records(SyncMode.incremental, stream_slice=next(slices)))
+    assert scheduler.has_queued_job
+
+    # the sync stops before requesting the next slice, e.g. on a failure
+    slices.close()
+
+    assert not scheduler.has_queued_job
+    assert scheduler.jobs_discarded == 1
+    assert any(req.method == "POST" and "bulkOperationCancel" in req.text for req in requests_mock.request_history)
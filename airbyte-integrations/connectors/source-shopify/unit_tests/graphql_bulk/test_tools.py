@@ -48,6 +48,24 @@ def test_fields_names_to_snake_case() -> None:
     assert BulkTools().fields_names_to_snake_case(dict_input) == expected_output
 
 
+def test_fields_names_to_snake_case_memoized() -> None:
+    first = BulkTools().fields_names_to_snake_case({"camelCaseKey": 1, "otherKey": 2})
+    second = BulkTools().fields_names_to_snake_case({"camelCaseKey": 3, "otherKey": 4})
+    assert second == {"camel_case_key": 3, "other_key": 4}
+    # the translated keys are shared across the records
+    assert [id(k) for k in first] == [id(k) for k in second]
+
+
+def test_fields_names_to_snake_case_returns_a_new_dict() -> None:
+    dict_input = {"snake_case": "value", "__parentId": "value"}
+    output = BulkTools().fields_names_to_snake_case(dict_input)
+    assert output == dict_input and output is not dict_input
+    # changing the output leaves the input as is
+    output["snake_case"] = "changed"
+    assert dict_input == {"snake_case": "value", "__parentId": "value"}
+    assert BulkTools().fields_names_to_snake_case({}) is None
+
+
 def test_resolve_str_id() -> None:
     assert BulkTools.resolve_str_id("123") == 123
     assert BulkTools.resolve_str_id("456", str) == "456"
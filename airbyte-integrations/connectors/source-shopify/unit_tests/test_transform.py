@@ -2,9 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import logging
+import os
+from copy import deepcopy
 from decimal import Decimal
+from pathlib import Path
+from time import perf_counter
 
 import pytest
+from source_shopify.streams.streams import Orders
 from source_shopify.transform import DataTypeEnforcer
 
 
@@ -255,3 +262,55 @@ def test_enforcer_nested_array(transform_object, schema, checks):
 )
 def test_enforcer_string_to_number_in_array(transform_object, schema, checks):
     run_check(transform_object, schema, checks)
+
+
+def _recorded_orders_page(size: int = 250) -> list:
+    """
+    The Orders page, as returned by the API: the recorded records with the numbers (prices, amounts) back to strings.
+    """
+
+    def _as_api_value(value):
+        if isinstance(value, dict):
+            return {k: _as_api_value(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [_as_api_value(v) for v in value]
+        if isinstance(value, float):
+            return f"{value:.2f}"
+        return value
+
+    records_path = Path(__file__).parent.parent / "integration_tests" / "expected_records.jsonl"
+    with open(records_path) as records_file:
+        orders = [json.loads(line)["data"] for line in records_file if '"stream": "orders"' in line]
+    return [_as_api_value(orders[index % len(orders)]) for index in range(size)]
+
+
+def test_compiled_transform_matches_schema_walk_on_a_page(auth_config):
+    schema = Orders(auth_config).get_json_schema()
+    transformer = DataTypeEnforcer(schema)
+    page = _recorded_orders_page()
+
+    compiled = [transformer.transform(deepcopy(record)) for record in page]
+    schema_walk = [transformer.transform(deepcopy(record), schema) for record in page]
+
+    assert compiled == schema_walk
+
+
+@pytest.mark.skipif(not os.getenv("SHOPIFY_TRANSFORM_BENCHMARK_PAGES"), reason="set SHOPIFY_TRANSFORM_BENCHMARK_PAGES to run it")
+def test_benchmark_compiled_transform_against_schema_walk(auth_config):
+    schema = Orders(auth_config).get_json_schema()
+    transformer = DataTypeEnforcer(schema)
+    pages_count = int(os.environ["SHOPIFY_TRANSFORM_BENCHMARK_PAGES"])
+
+    def _measure(transform) -> float:
+        pages = [_recorded_orders_page() for _ in range(pages_count)]
+        started = perf_counter()
+        for page in pages:
+            for record in page:
+                transform(record)
+        return perf_counter() - started
+
+    schema_walk_time = _measure(lambda record: transformer.transform(record, schema))
+    compiled_time = _measure(transformer.transform)
+    logging.getLogger("airbyte").info(
+        f"{pages_count} Orders pages of 250 records: schema walk {schema_walk_time:.4f} sec, compiled {compiled_time:.4f} sec."
+    )